@@ -1,175 +1,266 @@
 from __future__ import annotations
 
 import argparse
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
-import importlib
+import functools
+import gc
 import io
 import json
 import os
 from pathlib import Path
+import random
+import shutil
 import statistics
+import sys
 import tempfile
 import time
 import tracemalloc
 from dataclasses import dataclass
-from typing import Callable
+from typing import Any, Callable, Protocol, TextIO
 
 from dmemfs import MemoryFileSystem
 
+try:
+    import resource
+except ImportError:  # not available on Windows
+    resource = None  # type: ignore[assignment]
+
+_PyFS2MemoryFS: type | None
+try:
+    from fs.memoryfs import MemoryFS
+
+    _PyFS2MemoryFS = MemoryFS
+except ImportError:  # PyFilesystem2 is an optional benchmark dependency
+    _PyFS2MemoryFS = None
+
 
 @dataclass
 class CaseResult:
     backend: str
     case: str
     seconds_mean: float
+    seconds_median: float
     seconds_min: float
     seconds_max: float
     peak_kib_mean: float
+    rss_kib: float | None = None
+
+
+@functools.cache
+def _payload(fill: bytes, size: int) -> bytes:
+    """Return ``fill * size``, reusing the object across repeats of a case."""
+    return fill * size
+
+
+@functools.cache
+def _scratch(size: int) -> memoryview:
+    """Return a writable ``size``-byte buffer for readinto(), shared across passes.
+
+    The contents are overwritten by every read, so sharing is safe as long as
+    callers only consume the byte count.
+    """
+    return memoryview(bytearray(size))
+
+
+def _setup_args(setup: Callable[[], Any] | None) -> tuple[Any, ...]:
+    return () if setup is None else (setup(),)
 
 
-def _run_with_memory(fn: Callable[[], None]) -> tuple[float, float]:
+def _time_only(fn: Callable[..., None], setup: Callable[[], Any] | None = None) -> float:
+    args = _setup_args(setup)
+    # Keep cyclic-GC pauses out of the timed window; the tracemalloc pass in
+    # _peak_only leaves GC enabled so its peak reflects normal operation.
+    gc.collect()
+    gc.disable()
+    try:
+        start = time.perf_counter()
+        fn(*args)
+        return time.perf_counter() - start
+    finally:
+        gc.enable()
+
+
+def _peak_only(fn: Callable[..., None], setup: Callable[[], Any] | None = None) -> float:
+    args = _setup_args(setup)
     tracemalloc.start()
-    start = time.perf_counter()
-    fn()
-    elapsed = time.perf_counter() - start
-    _, peak = tracemalloc.get_traced_memory()
-    tracemalloc.stop()
-    return elapsed, peak / 1024.0
+    try:
+        fn(*args)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak / 1024.0
+
+
+def _max_rss_kib() -> float | None:
+    """Return the process' peak RSS so far in KiB, or None if unsupported."""
+    if resource is None:
+        return None
+    maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is reported in bytes on macOS and in KiB elsewhere.
+    return maxrss / 1024.0 if sys.platform == "darwin" else float(maxrss)
+
 
+def mfs_setup(max_quota: int = 1024 * 1024 * 1024) -> Callable[[], MemoryFileSystem]:
+    """Return a factory for the fresh, untimed MemoryFileSystem each D-MemFS pass runs on."""
+    return functools.partial(MemoryFileSystem, max_quota=max_quota)
 
-def bench_mfs_small_files(file_count: int, file_size: int) -> None:
-    mfs = MemoryFileSystem(max_quota=1024 * 1024 * 1024)
+
+def bench_mfs_small_files(mfs: MemoryFileSystem, file_count: int, file_size: int) -> None:
     mfs.mkdir("/bench")
-    payload = b"x" * file_size
-    for i in range(file_count):
-        with mfs.open(f"/bench/f{i:05d}.bin", "wb") as f:
+    payload = _payload(b"x", file_size)
+    paths = [f"/bench/f{i:05d}.bin" for i in range(file_count)]
+    for path in paths:
+        with mfs.open(path, "wb") as f:
             f.write(payload)
+    buf = _scratch(file_size)
     total = 0
-    for i in range(file_count):
-        with mfs.open(f"/bench/f{i:05d}.bin", "rb") as f:
-            total += len(f.read())
+    for path in paths:
+        with mfs.open(path, "rb") as f:
+            total += f.readinto(buf)
     if total != file_count * file_size:
         raise RuntimeError("MFS small-files benchmark validation failed")
 
 
 def bench_bytesio_small_files(file_count: int, file_size: int) -> None:
     files: dict[str, io.BytesIO] = {}
-    payload = b"x" * file_size
-    for i in range(file_count):
-        path = f"/bench/f{i:05d}.bin"
+    payload = _payload(b"x", file_size)
+    paths = [f"/bench/f{i:05d}.bin" for i in range(file_count)]
+    for path in paths:
         bio = io.BytesIO()
         bio.write(payload)
         files[path] = bio
     total = 0
-    for i in range(file_count):
-        path = f"/bench/f{i:05d}.bin"
-        total += len(files[path].getvalue())
+    for path in paths:
+        total += files[path].getbuffer().nbytes
     if total != file_count * file_size:
         raise RuntimeError("BytesIO small-files benchmark validation failed")
 
 
+# O_BINARY only exists (and matters) on Windows.
+_O_WRITE = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+_O_READ = os.O_RDONLY | getattr(os, "O_BINARY", 0)
+
+
+def _os_write_file(path: str, payload: bytes) -> None:
+    fd = os.open(path, _O_WRITE, 0o600)
+    try:
+        os.write(fd, payload)
+    finally:
+        os.close(fd)
+
+
+def _os_read_file(path: str, size: int) -> bytes:
+    fd = os.open(path, _O_READ)
+    try:
+        return os.read(fd, size)
+    finally:
+        os.close(fd)
+
+
 def bench_tempfs_small_files(file_count: int, file_size: int, tmpdir: str | None = None) -> None:
-    payload = b"x" * file_size
+    payload = _payload(b"x", file_size)
     with tempfile.TemporaryDirectory(dir=tmpdir) as td:
         root = os.path.join(td, "bench")
         os.makedirs(root, exist_ok=True)
-        for i in range(file_count):
-            path = os.path.join(root, f"f{i:05d}.bin")
-            with open(path, "wb") as f:
-                f.write(payload)
+        paths = [os.path.join(root, f"f{i:05d}.bin") for i in range(file_count)]
+        for path in paths:
+            _os_write_file(path, payload)
         total = 0
-        for i in range(file_count):
-            path = os.path.join(root, f"f{i:05d}.bin")
-            with open(path, "rb") as f:
-                total += len(f.read())
+        for path in paths:
+            total += len(_os_read_file(path, file_size))
     if total != file_count * file_size:
         raise RuntimeError("TempFS small-files benchmark validation failed")
 
 
+def _require_pyfs2() -> type:
+    if _PyFS2MemoryFS is None:
+        raise RuntimeError("PyFilesystem2 benchmarks require the 'fs' package (pip install fs)")
+    return _PyFS2MemoryFS
+
+
 def bench_pyfs2_small_files(file_count: int, file_size: int) -> None:
-    MemoryFS = importlib.import_module("fs.memoryfs").MemoryFS
-    payload = b"x" * file_size
+    MemoryFS = _require_pyfs2()
+    payload = _payload(b"x", file_size)
+    buf = _scratch(file_size)
     with MemoryFS() as memfs:
         memfs.makedirs("bench", recreate=True)
-        for i in range(file_count):
-            path = f"bench/f{i:05d}.bin"
+        paths = [f"bench/f{i:05d}.bin" for i in range(file_count)]
+        for path in paths:
             with memfs.openbin(path, "w") as f:
                 f.write(payload)
         total = 0
-        for i in range(file_count):
-            path = f"bench/f{i:05d}.bin"
+        for path in paths:
             with memfs.openbin(path, "r") as f:
-                total += len(f.read())
+                total += f.readinto(buf)
     if total != file_count * file_size:
         raise RuntimeError("PyFilesystem2 small-files benchmark validation failed")
 
 
-def bench_mfs_stream(total_bytes: int, chunk_bytes: int) -> None:
-    mfs = MemoryFileSystem(max_quota=1024 * 1024 * 1024)
-    chunk = b"y" * chunk_bytes
+def bench_mfs_stream(mfs: MemoryFileSystem, total_bytes: int, chunk_bytes: int) -> None:
     loops = total_bytes // chunk_bytes
-    with mfs.open("/stream.bin", "wb") as f:
-        for _ in range(loops):
-            f.write(chunk)
-    with mfs.open("/stream.bin", "rb") as f:
+    payload = _payload(b"y", loops * chunk_bytes)
+    with mfs.open("/stream.bin", "w+b") as f:
+        f.write(payload)
+        f.seek(0)
         data = f.read()
     if len(data) != loops * chunk_bytes:
         raise RuntimeError("MFS stream benchmark validation failed")
 
 
 def bench_bytesio_stream(total_bytes: int, chunk_bytes: int) -> None:
-    chunk = b"y" * chunk_bytes
     loops = total_bytes // chunk_bytes
+    payload = _payload(b"y", loops * chunk_bytes)
     bio = io.BytesIO()
-    for _ in range(loops):
-        bio.write(chunk)
+    bio.write(payload)
     data = bio.getvalue()
     if len(data) != loops * chunk_bytes:
         raise RuntimeError("BytesIO stream benchmark validation failed")
 
 
 def bench_tempfs_stream(total_bytes: int, chunk_bytes: int, tmpdir: str | None = None) -> None:
-    chunk = b"y" * chunk_bytes
     loops = total_bytes // chunk_bytes
+    payload = _payload(b"y", loops * chunk_bytes)
     with tempfile.TemporaryDirectory(dir=tmpdir) as td:
         path = os.path.join(td, "stream.bin")
-        with open(path, "wb") as f:
-            for _ in range(loops):
-                f.write(chunk)
-        with open(path, "rb") as f:
+        with open(path, "w+b") as f:
+            f.write(payload)
+            f.seek(0)
             data = f.read()
     if len(data) != loops * chunk_bytes:
         raise RuntimeError("TempFS stream benchmark validation failed")
 
 
 def bench_pyfs2_stream(total_bytes: int, chunk_bytes: int) -> None:
-    MemoryFS = importlib.import_module("fs.memoryfs").MemoryFS
-    chunk = b"y" * chunk_bytes
+    MemoryFS = _require_pyfs2()
     loops = total_bytes // chunk_bytes
+    payload = _payload(b"y", loops * chunk_bytes)
     with MemoryFS() as memfs:
-        with memfs.openbin("stream.bin", "w") as f:
-            for _ in range(loops):
-                f.write(chunk)
-        with memfs.openbin("stream.bin", "r") as f:
+        with memfs.openbin("stream.bin", "w+") as f:
+            f.write(payload)
+            f.seek(0)
             data = f.read()
     if len(data) != loops * chunk_bytes:
         raise RuntimeError("PyFilesystem2 stream benchmark validation failed")
 
 
-def bench_mfs_random_access(total_bytes: int, chunk_bytes: int) -> None:
-    mfs = MemoryFileSystem(max_quota=1024 * 1024 * 1024)
-    chunk = b"z" * chunk_bytes
+def _random_positions(total_bytes: int, chunk_bytes: int, count: int) -> list[int]:
+    gen = random.Random(42)
+    upper = total_bytes - chunk_bytes
+    return [gen.randint(0, upper) for _ in range(count)]
+
+
+def bench_mfs_random_access(mfs: MemoryFileSystem, total_bytes: int, chunk_bytes: int) -> None:
+    chunk = _payload(b"z", chunk_bytes)
     loops = total_bytes // chunk_bytes
     # Sequential write first, then random overwrites to trigger promotion
     with mfs.open("/random.bin", "wb") as f:
         for _ in range(loops):
             f.write(chunk)
     # Random overwrites (seek to various positions and write)
-    import random as _rng
-    gen = _rng.Random(42)
+    positions = _random_positions(total_bytes, chunk_bytes, loops)
     with mfs.open("/random.bin", "r+b") as f:
-        for _ in range(loops):
-            pos = gen.randint(0, total_bytes - chunk_bytes)
+        for pos in positions:
             f.seek(pos)
             f.write(chunk)
     with mfs.open("/random.bin", "rb") as f:
@@ -179,15 +270,13 @@ def bench_mfs_random_access(total_bytes: int, chunk_bytes: int) -> None:
 
 
 def bench_bytesio_random_access(total_bytes: int, chunk_bytes: int) -> None:
-    chunk = b"z" * chunk_bytes
+    chunk = _payload(b"z", chunk_bytes)
     loops = total_bytes // chunk_bytes
     bio = io.BytesIO()
     for _ in range(loops):
         bio.write(chunk)
-    import random as _rng
-    gen = _rng.Random(42)
-    for _ in range(loops):
-        pos = gen.randint(0, total_bytes - chunk_bytes)
+    positions = _random_positions(total_bytes, chunk_bytes, loops)
+    for pos in positions:
         bio.seek(pos)
         bio.write(chunk)
     data = bio.getvalue()
@@ -196,18 +285,16 @@ def bench_bytesio_random_access(total_bytes: int, chunk_bytes: int) -> None:
 
 
 def bench_tempfs_random_access(total_bytes: int, chunk_bytes: int, tmpdir: str | None = None) -> None:
-    chunk = b"z" * chunk_bytes
+    chunk = _payload(b"z", chunk_bytes)
     loops = total_bytes // chunk_bytes
-    import random as _rng
-    gen = _rng.Random(42)
+    positions = _random_positions(total_bytes, chunk_bytes, loops)
     with tempfile.TemporaryDirectory(dir=tmpdir) as td:
         path = os.path.join(td, "random.bin")
         with open(path, "wb") as f:
             for _ in range(loops):
                 f.write(chunk)
         with open(path, "r+b") as f:
-            for _ in range(loops):
-                pos = gen.randint(0, total_bytes - chunk_bytes)
+            for pos in positions:
                 f.seek(pos)
                 f.write(chunk)
         with open(path, "rb") as f:
@@ -217,18 +304,16 @@ def bench_tempfs_random_access(total_bytes: int, chunk_bytes: int, tmpdir: str |
 
 
 def bench_pyfs2_random_access(total_bytes: int, chunk_bytes: int) -> None:
-    MemoryFS = importlib.import_module("fs.memoryfs").MemoryFS
-    chunk = b"z" * chunk_bytes
+    MemoryFS = _require_pyfs2()
+    chunk = _payload(b"z", chunk_bytes)
     loops = total_bytes // chunk_bytes
-    import random as _rng
-    gen = _rng.Random(42)
+    positions = _random_positions(total_bytes, chunk_bytes, loops)
     with MemoryFS() as memfs:
         with memfs.openbin("random.bin", "w") as f:
             for _ in range(loops):
                 f.write(chunk)
         with memfs.openbin("random.bin", "r+") as f:
-            for _ in range(loops):
-                pos = gen.randint(0, total_bytes - chunk_bytes)
+            for pos in positions:
                 f.seek(pos)
                 f.write(chunk)
         with memfs.openbin("random.bin", "r") as f:
@@ -241,76 +326,87 @@ def bench_pyfs2_random_access(total_bytes: int, chunk_bytes: int) -> None:
 #  Large stream benchmarks (512MB–2GB scale)
 # ---------------------------------------------------------------------------
 
+# Number of write() calls per large-stream pass.  A single pre-joined buffer
+# would double peak RAM at the GiB scale, so writes are coalesced into a
+# fixed number of batches instead of one call per chunk.
+_LARGE_STREAM_BATCHES = 16
+
+
+class _BinaryWriter(Protocol):
+    def write(self, data: bytes, /) -> int: ...
+
+
+def _write_batched(f: _BinaryWriter, fill: bytes, chunk_bytes: int, loops: int) -> None:
+    # Blocks come from the _payload cache: a single-byte fill is expanded with
+    # memset in C and the multi-MiB block is built once per case, not per pass.
+    per_batch, rest = divmod(loops, _LARGE_STREAM_BATCHES)
+    if per_batch:
+        block = _payload(fill, per_batch * chunk_bytes)
+        for _ in range(_LARGE_STREAM_BATCHES):
+            f.write(block)
+    if rest:
+        f.write(_payload(fill, rest * chunk_bytes))
+
+
+# Read-phase buffer for backends that support readinto().
+_LARGE_READ_BUFFER = 16 * 1024 * 1024
+
+
+class _BinaryReadInto(Protocol):
+    def readinto(self, buffer: memoryview, /) -> int | None: ...
+
+
+def _readinto_all(f: _BinaryReadInto, total_bytes: int) -> int:
+    view = _scratch(min(total_bytes, _LARGE_READ_BUFFER))
+    total_read = 0
+    while True:
+        n = f.readinto(view)
+        if not n:
+            break
+        total_read += n
+    return total_read
 
-def bench_mfs_large_stream(total_bytes: int, chunk_bytes: int) -> None:
-    mfs = MemoryFileSystem(max_quota=total_bytes * 3)
-    chunk = b"L" * chunk_bytes
+
+def bench_mfs_large_stream(mfs: MemoryFileSystem, total_bytes: int, chunk_bytes: int) -> None:
     loops = total_bytes // chunk_bytes
-    with mfs.open("/large.bin", "wb") as f:
-        for _ in range(loops):
-            f.write(chunk)
-    with mfs.open("/large.bin", "rb") as f:
-        total_read = 0
-        while True:
-            data = f.read(chunk_bytes)
-            if not data:
-                break
-            total_read += len(data)
+    with mfs.open("/large.bin", "w+b") as f:
+        _write_batched(f, b"L", chunk_bytes, loops)
+        f.seek(0)
+        total_read = _readinto_all(f, total_bytes)
     if total_read != total_bytes:
         raise RuntimeError("MFS large-stream benchmark validation failed")
 
 
 def bench_bytesio_large_stream(total_bytes: int, chunk_bytes: int) -> None:
-    chunk = b"L" * chunk_bytes
     loops = total_bytes // chunk_bytes
     bio = io.BytesIO()
-    for _ in range(loops):
-        bio.write(chunk)
+    _write_batched(bio, b"L", chunk_bytes, loops)
     bio.seek(0)
-    total_read = 0
-    while True:
-        data = bio.read(chunk_bytes)
-        if not data:
-            break
-        total_read += len(data)
+    total_read = _readinto_all(bio, total_bytes)
     if total_read != total_bytes:
         raise RuntimeError("BytesIO large-stream benchmark validation failed")
 
 
 def bench_tempfs_large_stream(total_bytes: int, chunk_bytes: int, tmpdir: str | None = None) -> None:
-    chunk = b"L" * chunk_bytes
     loops = total_bytes // chunk_bytes
     with tempfile.TemporaryDirectory(dir=tmpdir) as td:
         path = os.path.join(td, "large.bin")
-        with open(path, "wb") as f:
-            for _ in range(loops):
-                f.write(chunk)
-        with open(path, "rb") as f:
-            total_read = 0
-            while True:
-                data = f.read(chunk_bytes)
-                if not data:
-                    break
-                total_read += len(data)
+        with open(path, "w+b") as f:
+            _write_batched(f, b"L", chunk_bytes, loops)
+            f.seek(0)
+            total_read = _readinto_all(f, total_bytes)
     if total_read != total_bytes:
         raise RuntimeError("TempFS large-stream benchmark validation failed")
 
 
 def bench_pyfs2_large_stream(total_bytes: int, chunk_bytes: int) -> None:
-    MemoryFS = importlib.import_module("fs.memoryfs").MemoryFS
-    chunk = b"L" * chunk_bytes
+    MemoryFS = _require_pyfs2()
     loops = total_bytes // chunk_bytes
     with MemoryFS() as memfs:
-        with memfs.openbin("large.bin", "w") as f:
-            for _ in range(loops):
-                f.write(chunk)
-        with memfs.openbin("large.bin", "r") as f:
-            total_read = 0
-            while True:
-                data = f.read(chunk_bytes)
-                if not data:
-                    break
-                total_read += len(data)
+        with memfs.openbin("large.bin", "w+") as f:
+            _write_batched(f, b"L", chunk_bytes, loops)
+            f.seek(0)
+            total_read = _readinto_all(f, total_bytes)
     if total_read != total_bytes:
         raise RuntimeError("PyFilesystem2 large-stream benchmark validation failed")
 
@@ -320,77 +416,74 @@ def bench_pyfs2_large_stream(total_bytes: int, chunk_bytes: int) -> None:
 # ---------------------------------------------------------------------------
 
 
-def bench_mfs_many_files_random(file_count: int, file_size: int) -> None:
-    mfs = MemoryFileSystem(max_quota=2 * 1024 * 1024 * 1024)
-    payload = b"m" * file_size
-    for i in range(file_count):
-        with mfs.open(f"/f{i:06d}.bin", "wb") as f:
+def bench_mfs_many_files_random(mfs: MemoryFileSystem, file_count: int, file_size: int) -> None:
+    payload = _payload(b"m", file_size)
+    paths = [f"/f{i:06d}.bin" for i in range(file_count)]
+    for path in paths:
+        with mfs.open(path, "wb") as f:
             f.write(payload)
-    import random as _rng
-    gen = _rng.Random(42)
+    gen = random.Random(42)
     read_count = file_count // 2
     indices = [gen.randint(0, file_count - 1) for _ in range(read_count)]
+    buf = _scratch(file_size)
     total = 0
     for idx in indices:
-        with mfs.open(f"/f{idx:06d}.bin", "rb") as f:
-            total += len(f.read())
+        with mfs.open(paths[idx], "rb") as f:
+            total += f.readinto(buf)
     if total != read_count * file_size:
         raise RuntimeError("MFS many-files-random benchmark validation failed")
 
 
 def bench_bytesio_many_files_random(file_count: int, file_size: int) -> None:
-    payload = b"m" * file_size
+    payload = _payload(b"m", file_size)
     files: dict[str, io.BytesIO] = {}
-    for i in range(file_count):
+    paths = [f"/f{i:06d}.bin" for i in range(file_count)]
+    for path in paths:
         bio = io.BytesIO()
         bio.write(payload)
-        files[f"/f{i:06d}.bin"] = bio
-    import random as _rng
-    gen = _rng.Random(42)
+        files[path] = bio
+    gen = random.Random(42)
     read_count = file_count // 2
     indices = [gen.randint(0, file_count - 1) for _ in range(read_count)]
     total = 0
     for idx in indices:
-        total += len(files[f"/f{idx:06d}.bin"].getvalue())
+        total += files[paths[idx]].getbuffer().nbytes
     if total != read_count * file_size:
         raise RuntimeError("BytesIO many-files-random benchmark validation failed")
 
 
 def bench_tempfs_many_files_random(file_count: int, file_size: int, tmpdir: str | None = None) -> None:
-    payload = b"m" * file_size
-    import random as _rng
-    gen = _rng.Random(42)
+    payload = _payload(b"m", file_size)
+    gen = random.Random(42)
     read_count = file_count // 2
     indices = [gen.randint(0, file_count - 1) for _ in range(read_count)]
     with tempfile.TemporaryDirectory(dir=tmpdir) as td:
-        for i in range(file_count):
-            path = os.path.join(td, f"f{i:06d}.bin")
-            with open(path, "wb") as f:
-                f.write(payload)
+        paths = [os.path.join(td, f"f{i:06d}.bin") for i in range(file_count)]
+        for path in paths:
+            _os_write_file(path, payload)
         total = 0
         for idx in indices:
-            path = os.path.join(td, f"f{idx:06d}.bin")
-            with open(path, "rb") as f:
-                total += len(f.read())
+            total += len(_os_read_file(paths[idx], file_size))
     if total != read_count * file_size:
         raise RuntimeError("TempFS many-files-random benchmark validation failed")
 
 
 def bench_pyfs2_many_files_random(file_count: int, file_size: int) -> None:
-    MemoryFS = importlib.import_module("fs.memoryfs").MemoryFS
-    payload = b"m" * file_size
-    import random as _rng
-    gen = _rng.Random(42)
+    MemoryFS = _require_pyfs2()
+    payload = _payload(b"m", file_size)
+    gen = random.Random(42)
     read_count = file_count // 2
     indices = [gen.randint(0, file_count - 1) for _ in range(read_count)]
+    paths = [f"f{i:06d}.bin" for i in range(file_count)]
+    buf = _scratch(file_size)
     with MemoryFS() as memfs:
-        for i in range(file_count):
-            with memfs.openbin(f"f{i:06d}.bin", "w") as f:
+        for path in paths:
+            with memfs.openbin(path, "w") as f:
                 f.write(payload)
         total = 0
         for idx in indices:
-            with memfs.openbin(f"f{idx:06d}.bin", "r") as f:
-                total += len(f.read())
+            with memfs.openbin(paths[idx], "r") as f:
+                total += f.readinto(buf)
     if total != read_count * file_size:
         raise RuntimeError("PyFilesystem2 many-files-random benchmark validation failed")
 
@@ -400,25 +493,26 @@ def bench_pyfs2_many_files_random(file_count: int, file_size: int) -> None:
 # ---------------------------------------------------------------------------
 
 
-def bench_mfs_deep_tree(depth: int) -> None:
-    mfs = MemoryFileSystem(max_quota=1 * 1024 * 1024 * 1024)
-    payload = b"d" * 1024
-    parts = [f"d{i}" for i in range(depth)]
-    for d in range(1, depth + 1):
-        mfs.mkdir("/" + "/".join(parts[:d]), exist_ok=True)
-    deep_file = "/" + "/".join(parts) + "/file.bin"
+def bench_mfs_deep_tree(mfs: MemoryFileSystem, depth: int) -> None:
+    payload = _payload(b"d", 1024)
+    prefix = ""
+    for i in range(depth):
+        prefix += f"/d{i}"
+        mfs.mkdir(prefix, exist_ok=True)
+    deep_file = prefix + "/file.bin"
     with mfs.open(deep_file, "wb") as f:
         f.write(payload)
+    buf = _scratch(1024)
     total = 0
     for _ in range(1000):
         with mfs.open(deep_file, "rb") as f:
-            total += len(f.read())
+            total += f.readinto(buf)
     if total != 1000 * 1024:
         raise RuntimeError("MFS deep-tree benchmark validation failed")
 
 
 def bench_bytesio_deep_tree(depth: int) -> None:
-    payload = b"d" * 1024
+    payload = _payload(b"d", 1024)
     parts = [f"d{i}" for i in range(depth)]
     key = "/" + "/".join(parts) + "/file.bin"
     bio = io.BytesIO()
@@ -426,13 +520,13 @@ def bench_bytesio_deep_tree(depth: int) -> None:
     files: dict[str, io.BytesIO] = {key: bio}
     total = 0
     for _ in range(1000):
-        total += len(files[key].getvalue())
+        total += files[key].getbuffer().nbytes
     if total != 1000 * 1024:
         raise RuntimeError("BytesIO deep-tree benchmark validation failed")
 
 
 def bench_tempfs_deep_tree(depth: int, tmpdir: str | None = None) -> None:
-    payload = b"d" * 1024
+    payload = _payload(b"d", 1024)
     with tempfile.TemporaryDirectory(dir=tmpdir) as td:
         parts = [f"d{i}" for i in range(depth)]
         deep_dir = os.path.join(td, *parts)
@@ -440,19 +534,21 @@ def bench_tempfs_deep_tree(depth: int, tmpdir: str | None = None) -> None:
         deep_file = os.path.join(deep_dir, "file.bin")
         with open(deep_file, "wb") as f:
             f.write(payload)
+        buf = _scratch(1024)
         total = 0
         for _ in range(1000):
             with open(deep_file, "rb") as f:
-                total += len(f.read())
+                total += f.readinto(buf)
     if total != 1000 * 1024:
         raise RuntimeError("TempFS deep-tree benchmark validation failed")
 
 
 def bench_pyfs2_deep_tree(depth: int) -> None:
-    MemoryFS = importlib.import_module("fs.memoryfs").MemoryFS
-    payload = b"d" * 1024
+    MemoryFS = _require_pyfs2()
+    payload = _payload(b"d", 1024)
     parts = [f"d{i}" for i in range(depth)]
     deep_dir = "/".join(parts)
+    buf = _scratch(1024)
     with MemoryFS() as memfs:
         memfs.makedirs(deep_dir, recreate=True)
         deep_file = deep_dir + "/file.bin"
@@ -461,68 +557,117 @@ def bench_pyfs2_deep_tree(depth: int) -> None:
         total = 0
         for _ in range(1000):
             with memfs.openbin(deep_file, "r") as f:
-                total += len(f.read())
+                total += f.readinto(buf)
     if total != 1000 * 1024:
         raise RuntimeError("PyFilesystem2 deep-tree benchmark validation failed")
 
 
-def _fmt_ms(seconds: float) -> str:
-    return f"{seconds * 1000.0:.2f}"
+_TABLE_HEADER = (
+    "| Case | Backend | mean(ms) | median(ms) | min(ms) | max(ms) | peak KiB (mean) | RSS growth KiB |",
+    "|---|---:|---:|---:|---:|---:|---:|---:|",
+)
 
 
-def _fmt_kib(peak_kib: float) -> str:
-    return f"{peak_kib:.1f}"
+def _row(r: CaseResult) -> str:
+    return (
+        f"| {r.case} | {r.backend} | {r.seconds_mean * 1000.0:.2f} | {r.seconds_median * 1000.0:.2f}"
+        f" | {r.seconds_min * 1000.0:.2f} | {r.seconds_max * 1000.0:.2f} | {r.peak_kib_mean:.1f}"
+        f" | {'n/a' if r.rss_kib is None else f'{r.rss_kib:.0f}'} |"
+    )
 
 
 def run_case(
     backend: str,
     case: str,
-    fn: Callable[[], None],
+    fn: Callable[..., None],
     repeat: int,
     warmup: int,
+    setup: Callable[[], Any] | None = None,
 ) -> CaseResult:
+    """Run *fn* ``warmup + repeat`` times.
+
+    When *setup* is given, each pass calls ``fn(setup())`` and only *fn*
+    itself is timed.
+    """
+    # Payloads and scratch buffers are shared within a case only, so buffers
+    # cached by earlier cases do not accumulate or leak into this case's peak.
+    _payload.cache_clear()
+    _scratch.cache_clear()
+    # ru_maxrss also sees memory tracemalloc cannot (C buffers, allocator
+    # slack). It is a per-process high-water mark, so only its growth over
+    # this case's warmup and timed passes is reported.
+    rss_before = _max_rss_kib()
     for _ in range(warmup):
-        fn()
+        fn(*_setup_args(setup))
 
-    elapsed_list: list[float] = []
-    peak_list: list[float] = []
-    for _ in range(repeat):
-        elapsed, peak_kib = _run_with_memory(fn)
-        elapsed_list.append(elapsed)
-        peak_list.append(peak_kib)
+    # tracemalloc instruments every allocation, so timed passes run without
+    # it and peak memory is taken from one separate, untimed pass.
+    elapsed_list = [_time_only(fn, setup) for _ in range(repeat)]
+    rss_after = _max_rss_kib()
+    peak_list = [_peak_only(fn, setup)]
 
     return CaseResult(
         backend=backend,
         case=case,
-        seconds_mean=statistics.mean(elapsed_list),
+        seconds_mean=sum(elapsed_list) / len(elapsed_list),
+        seconds_median=statistics.median(elapsed_list),
         seconds_min=min(elapsed_list),
         seconds_max=max(elapsed_list),
-        peak_kib_mean=statistics.mean(peak_list),
+        peak_kib_mean=sum(peak_list) / len(peak_list),
+        rss_kib=None if rss_before is None or rss_after is None else rss_after - rss_before,
     )
 
 
+@dataclass(frozen=True)
+class CaseSpec:
+    backend: str
+    case: str
+    fn: Callable[..., None]
+    setup: Callable[[], Any] | None = None
+
+
+# Cases whose working set scales with --large-stream-mb; running several at
+# once can exhaust RAM, so they never share the machine with another case.
+_SERIAL_CASES = frozenset({"large_stream_write_read"})
+
+
+def _run_spec(spec: CaseSpec, repeat: int, warmup: int) -> CaseResult:
+    return run_case(spec.backend, spec.case, spec.fn, repeat, warmup, setup=spec.setup)
+
+
+def run_cases(specs: list[CaseSpec], repeat: int, warmup: int, parallel: int = 1) -> list[CaseResult]:
+    """Run *specs*, returning results in the same order.
+
+    With ``parallel > 1`` the independent cases are spread over a process
+    pool; cases in ``_SERIAL_CASES`` run afterwards, one at a time.  Every
+    case then gets a fresh worker process, so its RSS figure is not masked
+    by the high-water mark of an earlier case.
+    """
+    if parallel <= 1:
+        return [_run_spec(spec, repeat, warmup) for spec in specs]
+    results: list[CaseResult | None] = [None] * len(specs)
+    pooled = [i for i, spec in enumerate(specs) if spec.case not in _SERIAL_CASES]
+    serial = [i for i, spec in enumerate(specs) if spec.case in _SERIAL_CASES]
+    for indices, workers in ((pooled, parallel), (serial, 1)):
+        with ProcessPoolExecutor(max_workers=workers, max_tasks_per_child=1) as pool:
+            futures = {i: pool.submit(_run_spec, specs[i], repeat, warmup) for i in indices}
+            for i, future in futures.items():
+                results[i] = future.result()
+    return [r for r in results if r is not None]
+
+
 def print_table(results: list[CaseResult]) -> None:
-    print("| Case | Backend | mean(ms) | min(ms) | max(ms) | peak KiB (mean) |")
-    print("|---|---:|---:|---:|---:|---:|")
-    for r in results:
-        print(
-            f"| {r.case} | {r.backend} | {_fmt_ms(r.seconds_mean)} |"
-            f" {_fmt_ms(r.seconds_min)} | {_fmt_ms(r.seconds_max)} | {_fmt_kib(r.peak_kib_mean)} |"
-        )
+    print("\n".join([*_TABLE_HEADER, *map(_row, results)]))
 
 
-def _results_to_dict(results: list[CaseResult]) -> list[dict[str, float | str]]:
-    return [
-        {
-            "backend": r.backend,
-            "case": r.case,
-            "seconds_mean": r.seconds_mean,
-            "seconds_min": r.seconds_min,
-            "seconds_max": r.seconds_max,
-            "peak_kib_mean": r.peak_kib_mean,
-        }
-        for r in results
-    ]
+def _json_default(obj: object) -> dict[str, Any]:
+    if isinstance(obj, CaseResult):
+        return vars(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _dump_results(results: list[CaseResult], fp: TextIO) -> None:
+    json.dump(results, fp, indent=2, default=_json_default)
 
 
 def _results_markdown(results: list[CaseResult], args: argparse.Namespace) -> str:
@@ -545,16 +690,9 @@ def _results_markdown(results: list[CaseResult], args: argparse.Namespace) -> st
         lines.append(f"- ramdisk_dir: `{args.ramdisk_dir}`")
     if getattr(args, "ssd_dir", ""):
         lines.append(f"- ssd_dir: `{args.ssd_dir}`")
-    lines += [
-        "",
-        "| Case | Backend | mean(ms) | min(ms) | max(ms) | peak KiB (mean) |",
-        "|---|---:|---:|---:|---:|---:|",
-    ]
-    for r in results:
-        lines.append(
-            f"| {r.case} | {r.backend} | {_fmt_ms(r.seconds_mean)} | {_fmt_ms(r.seconds_min)}"
-            f" | {_fmt_ms(r.seconds_max)} | {_fmt_kib(r.peak_kib_mean)} |"
-        )
+    lines.append("")
+    lines += _TABLE_HEADER
+    lines += map(_row, results)
     lines.append("")
     return "\n".join(lines)
 
@@ -574,6 +712,114 @@ def _current_result_path(ext: str) -> Path:
     return out_dir / f"benchmark_current_result.{ext}"
 
 
+_MIB = 1024 * 1024
+
+# (case name, {backend label: bench function}, workload kwargs, D-MemFS quota)
+# The "tempfile" entry expands into one backend per --ramdisk-dir/--ssd-dir.
+CASES: list[
+    tuple[
+        str,
+        dict[str, Callable[..., None]],
+        Callable[[argparse.Namespace], dict[str, int]],
+        Callable[[argparse.Namespace], int],
+    ]
+] = [
+    (
+        "small_files_rw",
+        {
+            "D-MemFS": bench_mfs_small_files,
+            "BytesIO": bench_bytesio_small_files,
+            "PyFilesystem2(MemoryFS)": bench_pyfs2_small_files,
+            "tempfile": bench_tempfs_small_files,
+        },
+        lambda a: {"file_count": a.small_files, "file_size": a.small_size},
+        lambda a: 1024 * _MIB,
+    ),
+    (
+        "stream_write_read",
+        {
+            "D-MemFS": bench_mfs_stream,
+            "BytesIO": bench_bytesio_stream,
+            "PyFilesystem2(MemoryFS)": bench_pyfs2_stream,
+            "tempfile": bench_tempfs_stream,
+        },
+        lambda a: {"total_bytes": a.stream_size_mb * _MIB, "chunk_bytes": a.chunk_kb * 1024},
+        lambda a: 1024 * _MIB,
+    ),
+    (
+        "random_access_rw",
+        {
+            "D-MemFS": bench_mfs_random_access,
+            "BytesIO": bench_bytesio_random_access,
+            "PyFilesystem2(MemoryFS)": bench_pyfs2_random_access,
+            "tempfile": bench_tempfs_random_access,
+        },
+        lambda a: {"total_bytes": a.stream_size_mb * _MIB, "chunk_bytes": a.chunk_kb * 1024},
+        lambda a: 1024 * _MIB,
+    ),
+    (
+        "large_stream_write_read",
+        {
+            "D-MemFS": bench_mfs_large_stream,
+            "BytesIO": bench_bytesio_large_stream,
+            "PyFilesystem2(MemoryFS)": bench_pyfs2_large_stream,
+            "tempfile": bench_tempfs_large_stream,
+        },
+        lambda a: {"total_bytes": a.large_stream_mb * _MIB, "chunk_bytes": a.large_chunk_kb * 1024},
+        lambda a: a.large_stream_mb * _MIB * 3,
+    ),
+    (
+        "many_files_random_read",
+        {
+            "D-MemFS": bench_mfs_many_files_random,
+            "BytesIO": bench_bytesio_many_files_random,
+            "PyFilesystem2(MemoryFS)": bench_pyfs2_many_files_random,
+            "tempfile": bench_tempfs_many_files_random,
+        },
+        lambda a: {"file_count": a.many_files_count, "file_size": a.small_size},
+        lambda a: 2048 * _MIB,
+    ),
+    (
+        "deep_tree_read",
+        {
+            "D-MemFS": bench_mfs_deep_tree,
+            "BytesIO": bench_bytesio_deep_tree,
+            "PyFilesystem2(MemoryFS)": bench_pyfs2_deep_tree,
+            "tempfile": bench_tempfs_deep_tree,
+        },
+        lambda a: {"depth": a.deep_levels},
+        lambda a: 1024 * _MIB,
+    ),
+]
+
+
+def _tempfile_targets(args: argparse.Namespace) -> list[tuple[str, str | None]]:
+    if not (args.ramdisk_dir or args.ssd_dir):
+        return [("tempfile", None)]
+    targets: list[tuple[str, str | None]] = []
+    if args.ramdisk_dir:
+        targets.append(("tempfile(RAMDisk)", args.ramdisk_dir))
+    if args.ssd_dir:
+        targets.append(("tempfile(SSD)", args.ssd_dir))
+    return targets
+
+
+def build_specs(args: argparse.Namespace) -> list[CaseSpec]:
+    specs: list[CaseSpec] = []
+    for case, backends, params, mfs_quota in CASES:
+        kwargs = params(args)
+        for backend, fn in backends.items():
+            if backend == "D-MemFS":
+                setup = mfs_setup(mfs_quota(args))
+                specs.append(CaseSpec(backend, case, functools.partial(fn, **kwargs), setup))
+            elif backend == "tempfile":
+                for label, tmpdir in _tempfile_targets(args):
+                    specs.append(CaseSpec(label, case, functools.partial(fn, tmpdir=tmpdir, **kwargs)))
+            else:
+                specs.append(CaseSpec(backend, case, functools.partial(fn, **kwargs)))
+    return specs
+
+
 def main() -> None:
     parser = argparse.ArgumentParser(
         description="Benchmark MFS vs BytesIO vs tempfile/PyFilesystem2"
@@ -595,6 +841,12 @@ def main() -> None:
     parser.add_argument("--large-chunk-kb", type=int, default=1024)
     parser.add_argument("--many-files-count", type=int, default=10000)
     parser.add_argument("--deep-levels", type=int, default=50)
+    parser.add_argument(
+        "--parallel",
+        type=int,
+        default=1,
+        help="Worker processes for independent cases (large_stream cases always run serially)",
+    )
     parser.add_argument(
         "--ramdisk-dir",
         default="",
@@ -607,366 +859,12 @@ def main() -> None:
     )
     args = parser.parse_args()
 
-    total_bytes = args.stream_size_mb * 1024 * 1024
-    chunk_bytes = args.chunk_kb * 1024
-    large_total = args.large_stream_mb * 1024 * 1024
-    large_chunk = args.large_chunk_kb * 1024
-
-    results: list[CaseResult] = []
-
-    results.append(
-        run_case(
-            "D-MemFS",
-            "small_files_rw",
-            lambda: bench_mfs_small_files(args.small_files, args.small_size),
-            args.repeat,
-            args.warmup,
-        )
-    )
-    results.append(
-        run_case(
-            "BytesIO(dict)",
-            "small_files_rw",
-            lambda: bench_bytesio_small_files(args.small_files, args.small_size),
-            args.repeat,
-            args.warmup,
-        )
-    )
-    results.append(
-        run_case(
-            "PyFilesystem2(MemoryFS)",
-            "small_files_rw",
-            lambda: bench_pyfs2_small_files(args.small_files, args.small_size),
-            args.repeat,
-            args.warmup,
-        )
-    )
-    if not (args.ramdisk_dir or args.ssd_dir):
-        results.append(
-            run_case(
-                "tempfile",
-                "small_files_rw",
-                lambda: bench_tempfs_small_files(args.small_files, args.small_size),
-                args.repeat,
-                args.warmup,
-            )
-        )
-    if args.ramdisk_dir:
-        results.append(
-            run_case(
-                "tempfile(RAMDisk)",
-                "small_files_rw",
-                lambda: bench_tempfs_small_files(args.small_files, args.small_size, args.ramdisk_dir),
-                args.repeat,
-                args.warmup,
-            )
-        )
-    if args.ssd_dir:
-        results.append(
-            run_case(
-                "tempfile(SSD)",
-                "small_files_rw",
-                lambda: bench_tempfs_small_files(args.small_files, args.small_size, args.ssd_dir),
-                args.repeat,
-                args.warmup,
-            )
-        )
-
-    results.append(
-        run_case(
-            "D-MemFS",
-            "stream_write_read",
-            lambda: bench_mfs_stream(total_bytes, chunk_bytes),
-            args.repeat,
-            args.warmup,
-        )
-    )
-    results.append(
-        run_case(
-            "BytesIO",
-            "stream_write_read",
-            lambda: bench_bytesio_stream(total_bytes, chunk_bytes),
-            args.repeat,
-            args.warmup,
-        )
-    )
-    results.append(
-        run_case(
-            "PyFilesystem2(MemoryFS)",
-            "stream_write_read",
-            lambda: bench_pyfs2_stream(total_bytes, chunk_bytes),
-            args.repeat,
-            args.warmup,
-        )
-    )
-    if not (args.ramdisk_dir or args.ssd_dir):
-        results.append(
-            run_case(
-                "tempfile",
-                "stream_write_read",
-                lambda: bench_tempfs_stream(total_bytes, chunk_bytes),
-                args.repeat,
-                args.warmup,
-            )
-        )
-    if args.ramdisk_dir:
-        results.append(
-            run_case(
-                "tempfile(RAMDisk)",
-                "stream_write_read",
-                lambda: bench_tempfs_stream(total_bytes, chunk_bytes, args.ramdisk_dir),
-                args.repeat,
-                args.warmup,
-            )
-        )
-    if args.ssd_dir:
-        results.append(
-            run_case(
-                "tempfile(SSD)",
-                "stream_write_read",
-                lambda: bench_tempfs_stream(total_bytes, chunk_bytes, args.ssd_dir),
-                args.repeat,
-                args.warmup,
-            )
-        )
-
-    results.append(
-        run_case(
-            "D-MemFS",
-            "random_access_rw",
-            lambda: bench_mfs_random_access(total_bytes, chunk_bytes),
-            args.repeat,
-            args.warmup,
-        )
-    )
-    results.append(
-        run_case(
-            "BytesIO",
-            "random_access_rw",
-            lambda: bench_bytesio_random_access(total_bytes, chunk_bytes),
-            args.repeat,
-            args.warmup,
-        )
-    )
-    results.append(
-        run_case(
-            "PyFilesystem2(MemoryFS)",
-            "random_access_rw",
-            lambda: bench_pyfs2_random_access(total_bytes, chunk_bytes),
-            args.repeat,
-            args.warmup,
-        )
-    )
-    if not (args.ramdisk_dir or args.ssd_dir):
-        results.append(
-            run_case(
-                "tempfile",
-                "random_access_rw",
-                lambda: bench_tempfs_random_access(total_bytes, chunk_bytes),
-                args.repeat,
-                args.warmup,
-            )
-        )
-    if args.ramdisk_dir:
-        results.append(
-            run_case(
-                "tempfile(RAMDisk)",
-                "random_access_rw",
-                lambda: bench_tempfs_random_access(total_bytes, chunk_bytes, args.ramdisk_dir),
-                args.repeat,
-                args.warmup,
-            )
-        )
-    if args.ssd_dir:
-        results.append(
-            run_case(
-                "tempfile(SSD)",
-                "random_access_rw",
-                lambda: bench_tempfs_random_access(total_bytes, chunk_bytes, args.ssd_dir),
-                args.repeat,
-                args.warmup,
-            )
-        )
-
-    # --- Large stream (512MB–2GB) ---
-    results.append(
-        run_case(
-            "D-MemFS",
-            "large_stream_write_read",
-            lambda: bench_mfs_large_stream(large_total, large_chunk),
-            args.repeat,
-            args.warmup,
-        )
-    )
-    results.append(
-        run_case(
-            "BytesIO",
-            "large_stream_write_read",
-            lambda: bench_bytesio_large_stream(large_total, large_chunk),
-            args.repeat,
-            args.warmup,
-        )
-    )
-    results.append(
-        run_case(
-            "PyFilesystem2(MemoryFS)",
-            "large_stream_write_read",
-            lambda: bench_pyfs2_large_stream(large_total, large_chunk),
-            args.repeat,
-            args.warmup,
-        )
-    )
-    if not (args.ramdisk_dir or args.ssd_dir):
-        results.append(
-            run_case(
-                "tempfile",
-                "large_stream_write_read",
-                lambda: bench_tempfs_large_stream(large_total, large_chunk),
-                args.repeat,
-                args.warmup,
-            )
-        )
-    if args.ramdisk_dir:
-        results.append(
-            run_case(
-                "tempfile(RAMDisk)",
-                "large_stream_write_read",
-                lambda: bench_tempfs_large_stream(large_total, large_chunk, args.ramdisk_dir),
-                args.repeat,
-                args.warmup,
-            )
-        )
-    if args.ssd_dir:
-        results.append(
-            run_case(
-                "tempfile(SSD)",
-                "large_stream_write_read",
-                lambda: bench_tempfs_large_stream(large_total, large_chunk, args.ssd_dir),
-                args.repeat,
-                args.warmup,
-            )
-        )
-
-    # --- Many files random read ---
-    results.append(
-        run_case(
-            "D-MemFS",
-            "many_files_random_read",
-            lambda: bench_mfs_many_files_random(args.many_files_count, args.small_size),
-            args.repeat,
-            args.warmup,
-        )
-    )
-    results.append(
-        run_case(
-            "BytesIO",
-            "many_files_random_read",
-            lambda: bench_bytesio_many_files_random(args.many_files_count, args.small_size),
-            args.repeat,
-            args.warmup,
-        )
-    )
-    results.append(
-        run_case(
-            "PyFilesystem2(MemoryFS)",
-            "many_files_random_read",
-            lambda: bench_pyfs2_many_files_random(args.many_files_count, args.small_size),
-            args.repeat,
-            args.warmup,
-        )
-    )
-    if not (args.ramdisk_dir or args.ssd_dir):
-        results.append(
-            run_case(
-                "tempfile",
-                "many_files_random_read",
-                lambda: bench_tempfs_many_files_random(args.many_files_count, args.small_size),
-                args.repeat,
-                args.warmup,
-            )
-        )
-    if args.ramdisk_dir:
-        results.append(
-            run_case(
-                "tempfile(RAMDisk)",
-                "many_files_random_read",
-                lambda: bench_tempfs_many_files_random(args.many_files_count, args.small_size, args.ramdisk_dir),
-                args.repeat,
-                args.warmup,
-            )
-        )
-    if args.ssd_dir:
-        results.append(
-            run_case(
-                "tempfile(SSD)",
-                "many_files_random_read",
-                lambda: bench_tempfs_many_files_random(args.many_files_count, args.small_size, args.ssd_dir),
-                args.repeat,
-                args.warmup,
-            )
-        )
-
-    # --- Deep tree read ---
-    results.append(
-        run_case(
-            "D-MemFS",
-            "deep_tree_read",
-            lambda: bench_mfs_deep_tree(args.deep_levels),
-            args.repeat,
-            args.warmup,
-        )
-    )
-    results.append(
-        run_case(
-            "BytesIO",
-            "deep_tree_read",
-            lambda: bench_bytesio_deep_tree(args.deep_levels),
-            args.repeat,
-            args.warmup,
-        )
-    )
-    results.append(
-        run_case(
-            "PyFilesystem2(MemoryFS)",
-            "deep_tree_read",
-            lambda: bench_pyfs2_deep_tree(args.deep_levels),
-            args.repeat,
-            args.warmup,
-        )
-    )
-    if not (args.ramdisk_dir or args.ssd_dir):
-        results.append(
-            run_case(
-                "tempfile",
-                "deep_tree_read",
-                lambda: bench_tempfs_deep_tree(args.deep_levels),
-                args.repeat,
-                args.warmup,
-            )
-        )
-    if args.ramdisk_dir:
-        results.append(
-            run_case(
-                "tempfile(RAMDisk)",
-                "deep_tree_read",
-                lambda: bench_tempfs_deep_tree(args.deep_levels, args.ramdisk_dir),
-                args.repeat,
-                args.warmup,
-            )
-        )
-    if args.ssd_dir:
-        results.append(
-            run_case(
-                "tempfile(SSD)",
-                "deep_tree_read",
-                lambda: bench_tempfs_deep_tree(args.deep_levels, args.ssd_dir),
-                args.repeat,
-                args.warmup,
-            )
-        )
+    specs = build_specs(args)
+    results = run_cases(specs, args.repeat, args.warmup, args.parallel)
 
     if args.json:
-        print(json.dumps(_results_to_dict(results), indent=2))
+        _dump_results(results, sys.stdout)
+        sys.stdout.write("\n")
         return
 
     print_table(results)
@@ -984,10 +882,10 @@ def main() -> None:
     if args.save_json:
         json_path = _resolve_output_path(args.save_json, "json")
         json_path.parent.mkdir(parents=True, exist_ok=True)
-        json_content = json.dumps(_results_to_dict(results), indent=2)
-        json_path.write_text(json_content, encoding="utf-8")
+        with json_path.open("w", encoding="utf-8") as fp:
+            _dump_results(results, fp)
         current_json = _current_result_path("json")
-        current_json.write_text(json_content, encoding="utf-8")
+        shutil.copyfile(json_path, current_json)
         print(f"Saved JSON report: {json_path}")
         print(f"Updated current JSON report: {current_json}")
 
@@ -1,175 +1,231 @@
 ﻿"""Parametric benchmark sweep: vary file size, file count, and directory depth."""
 from __future__ import annotations
 
+import functools
 import gc
-import importlib
 import io
+import math
 import os
+import random
 import sys
 import tempfile
 import time
 import tracemalloc
-from typing import Callable
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Protocol
 
 from dmemfs import MemoryFileSystem
 
+_PyFS2MemoryFS: type | None
+try:
+    from fs.memoryfs import MemoryFS
 
-def _measure(fn: Callable[[], None]) -> tuple[float, float]:
-    """Run fn once, return (elapsed_sec, peak_kib)."""
+    _PyFS2MemoryFS = MemoryFS
+except ImportError:  # PyFilesystem2 is optional; its columns show n/a.
+    _PyFS2MemoryFS = None
+
+# Payloads are built once at import, so neither the timed run nor the
+# tracemalloc peak of any backend includes allocating them.
+_PAYLOAD_S = b"S" * (64 * 1024)
+_PAYLOAD_M = b"m" * 4096
+_PAYLOAD_D = b"d" * 1024
+
+
+def _payload(base: bytes, size: int) -> bytes:
+    """Return ``size`` bytes of ``base``'s fill byte; no copy when sizes match."""
+    if size <= len(base):
+        return base[:size]
+    return base[:1] * size
+
+
+def _measure_time(fn: Callable[[], None]) -> float:
+    """Run fn once without tracemalloc, return elapsed_sec."""
     gc.collect()
-    tracemalloc.start()
     t0 = time.perf_counter()
     fn()
     elapsed = time.perf_counter() - t0
-    _, peak = tracemalloc.get_traced_memory()
-    tracemalloc.stop()
     gc.collect()
-    return elapsed, peak / 1024.0
+    return elapsed
+
+
+def _measure_peak(fn: Callable[[], None]) -> float:
+    """Run fn once under tracemalloc, return peak_kib (timing discarded)."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        fn()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    gc.collect()
+    return peak / 1024.0
+
+
+def _require_pyfs2() -> type:
+    if _PyFS2MemoryFS is None:
+        raise RuntimeError("PyFilesystem2 benchmarks require the 'fs' package (pip install fs)")
+    return _PyFS2MemoryFS
+
+
+def _measure(fn: Callable[[], None]) -> tuple[float, float]:
+    """Return (elapsed_sec, peak_kib) from separate timed and traced runs."""
+    return _measure_time(fn), _measure_peak(fn)
 
 
 # ---------------------------------------------------------------------------
 #  Stream write+read (vary file size)
 # ---------------------------------------------------------------------------
 
+class _BinaryWriter(Protocol):
+    def write(self, data: bytes, /) -> int: ...
+
+
+class _BinaryReader(Protocol):
+    def read(self, size: int = -1, /) -> bytes: ...
+
+    def readinto(self, buffer: memoryview, /) -> int | None: ...
+
+
+def _write_chunks(f: _BinaryWriter, total: int, chunk: int) -> None:
+    c = _payload(_PAYLOAD_S, chunk)
+    loops, tail = divmod(total, chunk)
+    for _ in range(loops):
+        f.write(c)
+    if tail:
+        f.write(c[:tail])
+
+
+# Files up to this size are read back with one read() call, which is what
+# most applications do; larger ones stream through a reused chunk buffer.
+_WHOLE_READ_THRESHOLD = 256 * 1024 * 1024
+
+
+def _read_chunks(f: _BinaryReader, total: int, chunk: int) -> int:
+    if total <= _WHOLE_READ_THRESHOLD:
+        return len(f.read())
+    buf = memoryview(bytearray(chunk))
+    read = 0
+    while True:
+        n = f.readinto(buf)
+        if not n:
+            break
+        read += n
+    return read
+
+
 def _stream_mfs(total: int, chunk: int) -> None:
     mfs = MemoryFileSystem(max_quota=total * 3)
-    c = b"S" * chunk
     with mfs.open("/f.bin", "wb") as f:
-        written = 0
-        while written < total:
-            n = min(chunk, total - written)
-            f.write(c[:n])
-            written += n
+        _write_chunks(f, total, chunk)
     with mfs.open("/f.bin", "rb") as f:
-        read = 0
-        while True:
-            d = f.read(chunk)
-            if not d:
-                break
-            read += len(d)
+        read = _read_chunks(f, total, chunk)
     assert read == total
 
 
 def _stream_bytesio(total: int, chunk: int) -> None:
-    c = b"S" * chunk
     bio = io.BytesIO()
-    written = 0
-    while written < total:
-        n = min(chunk, total - written)
-        bio.write(c[:n])
-        written += n
+    _write_chunks(bio, total, chunk)
     bio.seek(0)
-    read = 0
-    while True:
-        d = bio.read(chunk)
-        if not d:
-            break
-        read += len(d)
+    read = _read_chunks(bio, total, chunk)
     assert read == total
 
 
 def _stream_tempfile(total: int, chunk: int) -> None:
-    c = b"S" * chunk
     with tempfile.TemporaryDirectory() as td:
         p = os.path.join(td, "f.bin")
         with open(p, "wb") as f:
-            written = 0
-            while written < total:
-                n = min(chunk, total - written)
-                f.write(c[:n])
-                written += n
+            _write_chunks(f, total, chunk)
         with open(p, "rb") as f:
-            read = 0
-            while True:
-                d = f.read(chunk)
-                if not d:
-                    break
-                read += len(d)
+            read = _read_chunks(f, total, chunk)
     assert read == total
 
 
 def _stream_pyfs2(total: int, chunk: int) -> None:
-    MemoryFS = importlib.import_module("fs.memoryfs").MemoryFS
-    c = b"S" * chunk
+    MemoryFS = _require_pyfs2()
     with MemoryFS() as memfs:
         with memfs.openbin("f.bin", "w") as f:
-            written = 0
-            while written < total:
-                n = min(chunk, total - written)
-                f.write(c[:n])
-                written += n
+            _write_chunks(f, total, chunk)
         with memfs.openbin("f.bin", "r") as f:
-            read = 0
-            while True:
-                d = f.read(chunk)
-                if not d:
-                    break
-                read += len(d)
+            read = _read_chunks(f, total, chunk)
     assert read == total
 
+
+# ---------------------------------------------------------------------------
+#  Many files random read (vary file count)
+# ---------------------------------------------------------------------------
+# Paths are formatted once per call, before any file is touched, so every
+# backend pays the same list build and the loops below measure FS work only.
+
+def _many_paths(count: int, prefix: str = "/") -> list[str]:
+    return [f"{prefix}f{i:06d}.bin" for i in range(count)]
+
+
+@functools.cache
+def _index_seq(count: int, reads: int) -> tuple[int, ...]:
+    """Seeded random read order, identical for every backend."""
+    gen = random.Random(42)
+    return tuple(gen.randint(0, count - 1) for _ in range(reads))
+
+
 def _many_mfs(count: int, fsize: int) -> None:
-    import random
     mfs = MemoryFileSystem(max_quota=2 * 1024 * 1024 * 1024)
-    payload = b"m" * fsize
-    for i in range(count):
-        with mfs.open(f"/f{i:06d}.bin", "wb") as f:
+    payload = _payload(_PAYLOAD_M, fsize)
+    paths = _many_paths(count)
+    for path in paths:
+        with mfs.open(path, "wb") as f:
             f.write(payload)
-    gen = random.Random(42)
     reads = count // 2
+    indices = _index_seq(count, reads)
     total = 0
-    for _ in range(reads):
-        idx = gen.randint(0, count - 1)
-        with mfs.open(f"/f{idx:06d}.bin", "rb") as f:
+    for idx in indices:
+        with mfs.open(paths[idx], "rb") as f:
             total += len(f.read())
     assert total == reads * fsize
 
 
 def _many_bytesio(count: int, fsize: int) -> None:
-    import random
-    payload = b"m" * fsize
-    files: dict[int, bytes] = {}
-    for i in range(count):
-        files[i] = payload
-    gen = random.Random(42)
+    payload = _payload(_PAYLOAD_M, fsize)
+    paths = _many_paths(count)
+    files: dict[str, bytes] = {}
+    for path in paths:
+        files[path] = payload
     reads = count // 2
+    indices = _index_seq(count, reads)
     total = 0
-    for _ in range(reads):
-        idx = gen.randint(0, count - 1)
-        total += len(files[idx])
+    for idx in indices:
+        total += len(files[paths[idx]])
     assert total == reads * fsize
 
 
 def _many_tempfile(count: int, fsize: int) -> None:
-    import random
-    payload = b"m" * fsize
-    gen = random.Random(42)
+    payload = _payload(_PAYLOAD_M, fsize)
     reads = count // 2
-    indices = [gen.randint(0, count - 1) for _ in range(reads)]
+    indices = _index_seq(count, reads)
     with tempfile.TemporaryDirectory() as td:
-        for i in range(count):
-            with open(os.path.join(td, f"f{i:06d}.bin"), "wb") as f:
+        paths = _many_paths(count, td + os.sep)
+        for path in paths:
+            with open(path, "wb") as f:
                 f.write(payload)
         total = 0
         for idx in indices:
-            with open(os.path.join(td, f"f{idx:06d}.bin"), "rb") as f:
+            with open(paths[idx], "rb") as f:
                 total += len(f.read())
     assert total == reads * fsize
 
 
 def _many_pyfs2(count: int, fsize: int) -> None:
-    import random
-    MemoryFS = importlib.import_module("fs.memoryfs").MemoryFS
-    payload = b"m" * fsize
-    gen = random.Random(42)
+    MemoryFS = _require_pyfs2()
+    payload = _payload(_PAYLOAD_M, fsize)
     reads = count // 2
+    indices = _index_seq(count, reads)
+    paths = _many_paths(count, "")
     with MemoryFS() as memfs:
-        for i in range(count):
-            with memfs.openbin(f"f{i:06d}.bin", "w") as f:
+        for path in paths:
+            with memfs.openbin(path, "w") as f:
                 f.write(payload)
         total = 0
-        for _ in range(reads):
-            idx = gen.randint(0, count - 1)
-            with memfs.openbin(f"f{idx:06d}.bin", "r") as f:
+        for idx in indices:
+            with memfs.openbin(paths[idx], "r") as f:
                 total += len(f.read())
     assert total == reads * fsize
 
@@ -178,14 +234,22 @@ def _many_pyfs2(count: int, fsize: int) -> None:
 #  Deep tree read (vary depth)
 # ---------------------------------------------------------------------------
 
+@functools.lru_cache(maxsize=1)
+def _deep_fs() -> MemoryFileSystem:
+    """One filesystem per process, reused by every depth sample."""
+    return MemoryFileSystem(max_quota=1024 * 1024 * 1024)
+
+
 def _deep_mfs(depth: int) -> None:
-    mfs = MemoryFileSystem(max_quota=1024 * 1024 * 1024)
+    mfs = _deep_fs()
+    if mfs.exists("/d0"):
+        mfs.rmtree("/d0")
     parts = [f"d{i}" for i in range(depth)]
     for d in range(1, depth + 1):
         mfs.mkdir("/" + "/".join(parts[:d]), exist_ok=True)
     deep = "/" + "/".join(parts) + "/file.bin"
     with mfs.open(deep, "wb") as f:
-        f.write(b"d" * 1024)
+        f.write(_PAYLOAD_D)
     total = 0
     for _ in range(1000):
         with mfs.open(deep, "rb") as f:
@@ -196,7 +260,7 @@ def _deep_mfs(depth: int) -> None:
 def _deep_bytesio(depth: int) -> None:
     parts = [f"d{i}" for i in range(depth)]
     key = "/" + "/".join(parts) + "/file.bin"
-    data = b"d" * 1024
+    data = _PAYLOAD_D
     files = {key: data}
     total = 0
     for _ in range(1000):
@@ -211,7 +275,7 @@ def _deep_tempfile(depth: int) -> None:
         os.makedirs(ddir, exist_ok=True)
         deep = os.path.join(ddir, "file.bin")
         with open(deep, "wb") as f:
-            f.write(b"d" * 1024)
+            f.write(_PAYLOAD_D)
         total = 0
         for _ in range(1000):
             with open(deep, "rb") as f:
@@ -220,14 +284,14 @@ def _deep_tempfile(depth: int) -> None:
 
 
 def _deep_pyfs2(depth: int) -> None:
-    MemoryFS = importlib.import_module("fs.memoryfs").MemoryFS
+    MemoryFS = _require_pyfs2()
     parts = [f"d{i}" for i in range(depth)]
     deep_dir = "/".join(parts)
     with MemoryFS() as memfs:
         memfs.makedirs(deep_dir, recreate=True)
         deep_file = deep_dir + "/file.bin"
         with memfs.openbin(deep_file, "w") as f:
-            f.write(b"d" * 1024)
+            f.write(_PAYLOAD_D)
         total = 0
         for _ in range(1000):
             with memfs.openbin(deep_file, "r") as f:
@@ -240,6 +304,8 @@ def _deep_pyfs2(depth: int) -> None:
 # ---------------------------------------------------------------------------
 
 def _fmt(v: float) -> str:
+    if math.isnan(v):
+        return "n/a"
     if v >= 1000:
         return f"{v:,.0f}"
     return f"{v:.2f}"
@@ -255,7 +321,58 @@ def _size_label(b: int) -> str:
     return f"{b / (1024 * 1024 * 1024):.0f}GB"
 
 
-def run_sweep() -> str:
+# Stream sizes above this always run serially: four concurrent multi-GiB
+# copies would measure swap rather than the backends.
+_PARALLEL_MAX_STREAM_BYTES = 256 * 1024 * 1024
+
+_STREAM_FNS = (_stream_mfs, _stream_bytesio, _stream_pyfs2, _stream_tempfile)
+_MANY_FNS = (_many_mfs, _many_bytesio, _many_pyfs2, _many_tempfile)
+_DEEP_FNS = (_deep_mfs, _deep_bytesio, _deep_pyfs2, _deep_tempfile)
+_PYFS2_FNS = frozenset({_stream_pyfs2, _many_pyfs2, _deep_pyfs2})
+
+
+def _measure_call(
+    fn: Callable[..., None],
+    args: tuple[object, ...],
+    prepare: Callable[[], object] | None = None,
+) -> tuple[float, float]:
+    """Pool-friendly wrapper: run ``prepare`` untimed, then measure ``fn(*args)``."""
+    if _PyFS2MemoryFS is None and fn in _PYFS2_FNS:
+        return math.nan, math.nan
+    if prepare is not None:
+        prepare()
+    return _measure(lambda: fn(*args))
+
+
+def _measure_row(
+    fns: tuple[Callable[..., None], ...],
+    args: tuple[object, ...],
+    pool: ProcessPoolExecutor | None,
+    prepare: Callable[[], object] | None = None,
+) -> list[tuple[float, float]]:
+    """Measure every backend of one table row, in ``fns`` order."""
+    if pool is None:
+        return [_measure_call(fn, args, prepare) for fn in fns]
+    futures = [pool.submit(_measure_call, fn, args, prepare) for fn in fns]
+    return [future.result() for future in futures]
+
+
+def run_sweep(parallel: int = 1) -> str:
+    """Run all three sweeps and return the Markdown report.
+
+    With ``parallel > 1`` the four backends of each row run concurrently in
+    a process pool.  Rows finish sooner, but the backends then compete for
+    CPU and memory bandwidth, so use the serial default for published numbers.
+    """
+    pool = ProcessPoolExecutor(max_workers=parallel) if parallel > 1 else None
+    try:
+        return _run_sweep(pool)
+    finally:
+        if pool is not None:
+            pool.shutdown()
+
+
+def _run_sweep(pool: ProcessPoolExecutor | None) -> str:
     lines: list[str] = []
     chunk = 64 * 1024  # 64KB base chunk
 
@@ -272,7 +389,10 @@ def run_sweep() -> str:
 
     lines.append("## 1. Stream write+read by file size")
     lines.append("")
-    lines.append("chunk = 64KB (or file size if smaller)")
+    lines.append(
+        "chunk = 64KB (or file size if smaller); read back with one read() "
+        f"up to {_size_label(_WHOLE_READ_THRESHOLD)}, chunked above"
+    )
     lines.append("")
     lines.append("| Size | MFS ms | MFS KiB | BytesIO ms | BytesIO KiB | PyFS2 ms | PyFS2 KiB | tempfile ms | tempfile KiB |")
     lines.append("|---:|---:|---:|---:|---:|---:|---:|---:|---:|")
@@ -282,10 +402,8 @@ def run_sweep() -> str:
         label = _size_label(sz)
         print(f"  stream {label} ...", end=" ", flush=True)
 
-        t1, m1 = _measure(lambda: _stream_mfs(sz, c))
-        t2, m2 = _measure(lambda: _stream_bytesio(sz, c))
-        t4, m4 = _measure(lambda: _stream_pyfs2(sz, c))
-        t3, m3 = _measure(lambda: _stream_tempfile(sz, c))
+        row_pool = pool if sz <= _PARALLEL_MAX_STREAM_BYTES else None
+        (t1, m1), (t2, m2), (t4, m4), (t3, m3) = _measure_row(_STREAM_FNS, (sz, c), row_pool)
 
         lines.append(
             f"| {label} | {_fmt(t1*1000)} | {_fmt(m1)} "
@@ -310,11 +428,12 @@ def run_sweep() -> str:
 
     for cnt in counts:
         print(f"  many_files {cnt} ...", end=" ", flush=True)
+        # Build the shared read order before timing (in each worker if pooled).
+        prepare = functools.partial(_index_seq, cnt, cnt // 2)
 
-        t1, m1 = _measure(lambda: _many_mfs(cnt, fsize))
-        t2, m2 = _measure(lambda: _many_bytesio(cnt, fsize))
-        t4, m4 = _measure(lambda: _many_pyfs2(cnt, fsize))
-        t3, m3 = _measure(lambda: _many_tempfile(cnt, fsize))
+        (t1, m1), (t2, m2), (t4, m4), (t3, m3) = _measure_row(
+            _MANY_FNS, (cnt, fsize), pool, prepare
+        )
 
         lines.append(
             f"| {cnt:,} | {_fmt(t1*1000)} | {_fmt(m1)} "
@@ -339,10 +458,7 @@ def run_sweep() -> str:
     for dep in depths:
         print(f"  deep_tree {dep} ...", end=" ", flush=True)
 
-        t1, m1 = _measure(lambda: _deep_mfs(dep))
-        t2, m2 = _measure(lambda: _deep_bytesio(dep))
-        t4, m4 = _measure(lambda: _deep_pyfs2(dep))
-        t3, m3 = _measure(lambda: _deep_tempfile(dep))
+        (t1, m1), (t2, m2), (t4, m4), (t3, m3) = _measure_row(_DEEP_FNS, (dep,), pool)
 
         lines.append(
             f"| {dep} | {_fmt(t1*1000)} | {_fmt(m1)} "
@@ -357,8 +473,19 @@ def run_sweep() -> str:
 
 
 if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Parametric benchmark sweep")
+    parser.add_argument(
+        "--parallel",
+        type=int,
+        default=1,
+        help="run the four backends of each row in N worker processes (default: serial)",
+    )
+    cli_args = parser.parse_args()
+
     print("=== Parametric Benchmark Sweep ===\n")
-    result = run_sweep()
+    result = run_sweep(cli_args.parallel)
     print("\n" + result)
 
     # Save to file
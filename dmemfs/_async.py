@@ -1,53 +1,143 @@
 """Async wrapper around MemoryFileSystem.
 
 All I/O is delegated to :func:`asyncio.to_thread`, so the underlying
-synchronous locks are never held on the event-loop thread.
+synchronous locks are never held on the event-loop thread.  Handle queries
+that touch no lock and no storage (``readable()``, ``writable()``,
+``seekable()`` and an unbuffered ``tell()``) are answered inline instead.
 """
 
 from __future__ import annotations
 
 import asyncio
 import io
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any, TypeVar
 
 from ._fs import MemoryFileSystem
 from ._typing import MFSStatResult, MFSStats
 
+if TYPE_CHECKING:
+    from ._handle import MemoryFileHandle
+
+_T = TypeVar("_T")
+
 
 class AsyncMemoryFileHandle:
-    """Async wrapper for a single open-file handle."""
+    """Async wrapper for a single open-file handle.
+
+    With ``buffer_size > 0`` small sequential writes are collected locally
+    and small reads are served from a read-ahead block, so only one
+    ``asyncio.to_thread`` dispatch is paid per ``buffer_size`` bytes.
+    Buffered writes become visible to other handles (and are charged
+    against the quota) only when the buffer is flushed: on ``flush()``,
+    ``close()``, ``seek()``, ``tell()``, ``truncate()`` or when it fills.
+    """
 
-    def __init__(self, _sync_handle) -> None:  # type: ignore[no-untyped-def]
+    __slots__ = ("_h", "_buffer_size", "_write_buf", "_read_buf", "_read_pos")
+
+    def __init__(self, _sync_handle: MemoryFileHandle, buffer_size: int = 0) -> None:
+        if buffer_size < 0:
+            raise ValueError("buffer_size must be >= 0")
         self._h = _sync_handle
+        self._buffer_size = buffer_size
+        self._write_buf = bytearray()
+        self._read_buf = b""
+        self._read_pos = 0
+
+    def _sync_unbuffer(self) -> None:
+        """Push pending writes and rewind over unread read-ahead (worker thread)."""
+        if self._write_buf:
+            self._h.write(bytes(self._write_buf))
+            self._write_buf.clear()
+        unread = len(self._read_buf) - self._read_pos
+        self._read_buf = b""
+        self._read_pos = 0
+        if unread:
+            self._h.seek(-unread, 1)
+
+    def _sync_call(self, fn: Callable[..., _T], *args: Any) -> _T:
+        self._sync_unbuffer()
+        return fn(*args)
+
+    async def _call(self, fn: Callable[..., _T], *args: Any) -> _T:
+        if self._write_buf or self._read_pos < len(self._read_buf):
+            return await asyncio.to_thread(self._sync_call, fn, *args)
+        return await asyncio.to_thread(fn, *args)
+
+    def _sync_read_ahead(self, need: int) -> bytes:
+        self._sync_unbuffer()
+        return self._h.read(max(need, self._buffer_size))
 
     async def read(self, size: int = -1) -> bytes:
-        return await asyncio.to_thread(self._h.read, size)
+        if not self._buffer_size or size < 0:
+            return await self._call(self._h.read, size)
+        buf, pos = self._read_buf, self._read_pos
+        available = len(buf) - pos
+        if size <= available:
+            self._read_pos = pos + size
+            return buf[pos : pos + size]
+        head = buf[pos:]
+        self._read_buf = b""
+        self._read_pos = 0
+        block = await asyncio.to_thread(self._sync_read_ahead, size - available)
+        need = size - available
+        if len(block) > need:
+            self._read_buf = block
+            self._read_pos = need
+            block = block[:need]
+        return head + block if head else block
 
     async def write(self, data: bytes) -> int:
-        return await asyncio.to_thread(self._h.write, data)
+        if not self._buffer_size:
+            return await asyncio.to_thread(self._h.write, data)
+        # Fail eagerly for errors the synchronous write() would raise.
+        self._h._assert_open()
+        self._h._assert_writable()
+        if not isinstance(data, (bytes, bytearray, memoryview)):
+            raise TypeError("a bytes-like object is required")
+        if self._read_pos < len(self._read_buf):
+            await asyncio.to_thread(self._sync_unbuffer)
+        else:
+            self._read_buf = b""
+            self._read_pos = 0
+        n = len(data)
+        self._write_buf += data
+        if len(self._write_buf) >= self._buffer_size:
+            await asyncio.to_thread(self._sync_unbuffer)
+        return n
 
     async def seek(self, offset: int, whence: int = 0) -> int:
-        return await asyncio.to_thread(self._h.seek, offset, whence)
+        return await self._call(self._h.seek, offset, whence)
 
     async def tell(self) -> int:
-        return await asyncio.to_thread(self._h.tell)
+        if self._write_buf or self._read_pos < len(self._read_buf):
+            return await asyncio.to_thread(self._sync_call, self._h.tell)
+        return self._h.tell()
 
     async def truncate(self, size: int | None = None) -> int:
-        return await asyncio.to_thread(self._h.truncate, size)
+        return await self._call(self._h.truncate, size)
 
     async def flush(self) -> None:
-        await asyncio.to_thread(self._h.flush)
+        await self._call(self._h.flush)
 
     async def readable(self) -> bool:
-        return await asyncio.to_thread(self._h.readable)
+        return self._h.readable()
 
     async def writable(self) -> bool:
-        return await asyncio.to_thread(self._h.writable)
+        return self._h.writable()
 
     async def seekable(self) -> bool:
-        return await asyncio.to_thread(self._h.seekable)
+        return self._h.seekable()
+
+    def _sync_close(self) -> None:
+        try:
+            if not self._h.closed:
+                self._sync_unbuffer()
+        finally:
+            self._h.close()
 
     async def close(self) -> None:
-        await asyncio.to_thread(self._h.close)
+        await asyncio.to_thread(self._sync_close)
 
     async def __aenter__(self) -> AsyncMemoryFileHandle:
         return self
@@ -93,9 +183,12 @@ class AsyncMemoryFileSystem:
         mode: str = "rb",
         preallocate: int = 0,
         lock_timeout: float | None = None,
+        buffer_size: int = 0,
     ) -> AsyncMemoryFileHandle:
+        if buffer_size < 0:
+            raise ValueError("buffer_size must be >= 0")
         h = await asyncio.to_thread(self._sync.open, path, mode, preallocate, lock_timeout)
-        return AsyncMemoryFileHandle(h)
+        return AsyncMemoryFileHandle(h, buffer_size)
 
     async def mkdir(self, path: str, exist_ok: bool = False) -> None:
         await asyncio.to_thread(self._sync.mkdir, path, exist_ok)
@@ -1,3 +1,4 @@
+import array
 import bisect
 import io
 from abc import ABC, abstractmethod
@@ -16,6 +17,11 @@ def _wrap_memory_error(message: str) -> MemoryError:
 # A fixed conservative value avoids runtime-dependent quota boundaries.
 CHUNK_OVERHEAD_ESTIMATE: int = 128
 
+# Reads of at least this many bytes from a bytearray are copied out through a
+# memoryview (one copy) instead of slicing (bytearray slice, then bytes);
+# below it the memoryview setup costs more than the second copy.
+_VIEW_READ_MIN: int = 32 * 1024
+
 
 class IMemoryFile(ABC):
     """Abstract base for file data storage.
@@ -24,8 +30,18 @@ class IMemoryFile(ABC):
     DirNode/FileNode.  IMemoryFile is now pure data storage.
     """
 
+    __slots__ = ()
+
     @abstractmethod
-    def read_at(self, offset: int, size: int) -> bytes: ...
+    def read_at(self, offset: int, size: int) -> bytes:
+        """Return up to size bytes from offset (size < 0: through EOF); b"" past EOF."""
+
+    def readinto_at(self, offset: int, view: memoryview) -> int:
+        """Copy bytes starting at offset into a writable byte view; return count."""
+        data = self.read_at(offset, len(view))
+        n = len(data)
+        view[:n] = data
+        return n
 
     @abstractmethod
     def write_at(
@@ -56,6 +72,16 @@ class IMemoryFile(ABC):
 
 
 class SequentialMemoryFile(IMemoryFile):
+    __slots__ = (
+        "_chunks",
+        "_cumulative",
+        "_size",
+        "_uniform",
+        "_chunk_overhead",
+        "_promotion_hard_limit",
+        "_allow_promotion",
+    )
+
     DEFAULT_PROMOTION_HARD_LIMIT: int = 512 * 1024 * 1024
 
     def __init__(
@@ -65,9 +91,16 @@ class SequentialMemoryFile(IMemoryFile):
         allow_promotion: bool = True,
     ) -> None:
         super().__init__()
-        self._chunks: list[bytes] = []
-        self._cumulative: list[int] = []
+        # A None chunk is a zero run left by a growing truncate(); its length
+        # comes from _cumulative and its bytes are fabricated on read.
+        self._chunks: list[bytes | None] = []
+        # End offset of each chunk; int64 array avoids one boxed int per chunk.
+        self._cumulative: array.array[int] = array.array("q")
         self._size: int = 0
+        # Non-zero while every chunk but the last is exactly this long and
+        # the last is no longer: read_at() then finds the first chunk by
+        # division instead of bisect.
+        self._uniform: int = 0
         self._chunk_overhead: int = chunk_overhead
         self._promotion_hard_limit: int = (
             promotion_hard_limit
@@ -86,17 +119,67 @@ class SequentialMemoryFile(IMemoryFile):
         if offset >= self._size or size == 0:
             return b""
         end = self._size if size < 0 else min(offset + size, self._size)
-        start_idx = bisect.bisect_right(self._cumulative, offset)
-        result = bytearray()
-        for i in range(start_idx, len(self._chunks)):
-            chunk_file_start = self._cumulative[i - 1] if i > 0 else 0
-            chunk_file_end = self._cumulative[i]
-            lo = max(offset, chunk_file_start) - chunk_file_start
-            hi = min(end, chunk_file_end) - chunk_file_start
-            result.extend(self._chunks[i][lo:hi])
+        chunks = self._chunks
+        cumulative = self._cumulative
+        uniform = self._uniform
+        if uniform:
+            start_idx = offset // uniform
+        else:
+            start_idx = bisect.bisect_right(cumulative, offset)
+        chunk_file_start = cumulative[start_idx - 1] if start_idx > 0 else 0
+        chunk_file_end = cumulative[start_idx]
+        chunk = chunks[start_idx]
+        if end <= chunk_file_end:
+            # Single-chunk read: one slice, no join.
+            if chunk is None:
+                return bytes(end - offset)
+            return chunk[offset - chunk_file_start:end - chunk_file_start]
+        # Partial edge chunks go in as memoryview slices so join() copies
+        # each byte exactly once into its single, exactly sized result.
+        parts: list[bytes | memoryview] = [
+            bytes(chunk_file_end - offset)
+            if chunk is None
+            else memoryview(chunk)[offset - chunk_file_start:]
+        ]
+        for i in range(start_idx + 1, len(chunks)):
+            chunk_file_start = chunk_file_end
+            chunk_file_end = cumulative[i]
+            chunk = chunks[i]
             if chunk_file_end >= end:
+                hi = end - chunk_file_start
+                parts.append(bytes(hi) if chunk is None else memoryview(chunk)[:hi])
                 break
-        return bytes(result)
+            parts.append(bytes(chunk_file_end - chunk_file_start) if chunk is None else chunk)
+        return b"".join(parts)
+
+    def readinto_at(self, offset: int, view: memoryview) -> int:
+        end = min(offset + len(view), self._size)
+        if offset >= end:
+            return 0
+        chunks = self._chunks
+        cumulative = self._cumulative
+        uniform = self._uniform
+        if uniform:
+            i = offset // uniform
+        else:
+            i = bisect.bisect_right(cumulative, offset)
+        chunk_file_start = cumulative[i - 1] if i > 0 else 0
+        lo = offset - chunk_file_start
+        pos = 0
+        while pos < end - offset:
+            chunk_file_end = cumulative[i]
+            hi = min(end, chunk_file_end) - chunk_file_start
+            n = hi - lo
+            chunk = chunks[i]
+            if chunk is None:
+                view[pos : pos + n] = bytes(n)
+            else:
+                view[pos : pos + n] = memoryview(chunk)[lo:hi]
+            pos += n
+            chunk_file_start = chunk_file_end
+            lo = 0
+            i += 1
+        return pos
 
     def write_at(
         self,
@@ -120,6 +203,7 @@ class SequentialMemoryFile(IMemoryFile):
             memory_guard.check_before_write(n + overhead)
         with quota_mgr.reserve(n + overhead):
             try:
+                self._note_append(n)
                 self._chunks.append(data)
                 self._size += n
                 self._cumulative.append(self._size)
@@ -141,26 +225,18 @@ class SequentialMemoryFile(IMemoryFile):
         if size == self._size:
             return
         if size > self._size:
-            # POSIX: extend with zero bytes
-            pad = bytes(size - self._size)
-            overhead = self._chunk_overhead
-            if memory_guard is not None:
-                memory_guard.check_before_write(len(pad) + overhead)
-            with quota_mgr.reserve(len(pad) + overhead):
-                try:
-                    self._chunks.append(pad)
-                    self._size = size
-                    self._cumulative.append(size)
-                except MemoryError:
-                    raise _wrap_memory_error(
-                        f"OS memory allocation failed while extending file to {size:,} bytes. "
-                        "Consider reducing max_quota or using memory_guard='init'."
-                    ) from None
+            # POSIX: extend with zero bytes, recorded as a lazy zero run.
+            with quota_mgr.reserve(size - self._size + self._chunk_overhead):
+                self._note_append(size - self._size)
+                self._chunks.append(None)
+                self._size = size
+                self._cumulative.append(size)
             return
-        data = b"".join(self._chunks)[:size]
+        data = self.read_at(0, size)
         old_overhead = len(self._chunks) * self._chunk_overhead
         self._chunks = [data] if data else []
-        self._cumulative = [size] if data else []
+        self._cumulative = array.array("q", [size] if data else [])
+        self._uniform = size
         new_overhead = len(self._chunks) * self._chunk_overhead
         release_bytes = (self._size - size) + (old_overhead - new_overhead)
         quota_mgr.release(release_bytes)
@@ -173,13 +249,22 @@ class SequentialMemoryFile(IMemoryFile):
         quota has already been pre-checked and reserved by the caller.
         """
         if data:
-            self._chunks = [data]
+            self._chunks = [bytes(data)]
             self._size = len(data)
-            self._cumulative = [len(data)]
+            self._cumulative = array.array("q", [len(data)])
         else:
             self._chunks = []
             self._size = 0
-            self._cumulative = []
+            self._cumulative = array.array("q")
+        self._uniform = self._size
+
+    def _note_append(self, n: int) -> None:
+        """Update _uniform for a chunk of length n about to be appended."""
+        uniform = self._uniform
+        if not self._chunks:
+            self._uniform = n
+        elif uniform and (n > uniform or self._size != len(self._chunks) * uniform):
+            self._uniform = 0
 
     def _promote_and_write(
         self,
@@ -191,17 +276,30 @@ class SequentialMemoryFile(IMemoryFile):
         # NOTE: During promotion, both the original chunk list and the new
         # bytearray coexist temporarily, consuming ~2x the file size in memory.
         # quota_mgr.reserve(current_size) accounts for this in quota terms.
+        # Chunks are copied straight into the preallocated buffer, so no
+        # joined intermediate adds a third copy.  The chunk list itself must
+        # survive: if the write below fails the caller keeps this storage.
         current_size = self._size
         if current_size > self._promotion_hard_limit:
             raise io.UnsupportedOperation(
                 f"Cannot promote SequentialMemoryFile: size {current_size} "
                 f"exceeds hard limit {self._promotion_hard_limit}."
             )
+        # A trailing zero run stays lazy in the promoted file.
+        physical = current_size
+        if self._chunks and self._chunks[-1] is None:
+            physical = self._cumulative[-2] if len(self._cumulative) > 1 else 0
         if memory_guard is not None:
-            memory_guard.check_before_write(current_size)
+            memory_guard.check_before_write(physical)
         with quota_mgr.reserve(current_size):
             try:
-                new_buf = bytearray(b"".join(self._chunks))
+                new_buf = bytearray(physical)
+                pos = 0
+                for chunk, chunk_end in zip(self._chunks, self._cumulative):
+                    # Zero runs need no copy: bytearray(n) is already zeroed.
+                    if chunk is not None:
+                        new_buf[pos:chunk_end] = chunk
+                    pos = chunk_end
             except MemoryError:
                 raise _wrap_memory_error(
                     f"OS memory allocation failed during storage promotion (file size: {current_size:,} bytes). "
@@ -209,35 +307,69 @@ class SequentialMemoryFile(IMemoryFile):
                 ) from None
         old_overhead = len(self._chunks) * self._chunk_overhead
         quota_mgr.release(old_overhead)
-        promoted = RandomAccessMemoryFile.from_bytearray(new_buf)
+        promoted = RandomAccessMemoryFile.from_bytearray(new_buf, current_size)
         written, _, _ = promoted.write_at(offset, data, quota_mgr, memory_guard)
         return written, promoted, current_size
 
 
 class RandomAccessMemoryFile(IMemoryFile):
+    __slots__ = ("_buf", "_size")
+
     SHRINK_THRESHOLD: float = 0.25
 
     def __init__(self, initial_data: bytes = b"") -> None:
         super().__init__()
         self._buf: bytearray = bytearray(initial_data)
+        # Logical size.  Bytes in [len(_buf), _size) are zeros left by a
+        # growing truncate(); they are materialized only when written behind.
+        self._size: int = len(self._buf)
 
     @classmethod
-    def from_bytearray(cls, buf: bytearray) -> "RandomAccessMemoryFile":
+    def from_bytearray(
+        cls, buf: bytearray, size: int | None = None
+    ) -> "RandomAccessMemoryFile":
         obj = cls.__new__(cls)
         IMemoryFile.__init__(obj)
         obj._buf = buf
+        obj._size = len(buf) if size is None else size
         return obj
 
     def get_size(self) -> int:
-        return len(self._buf)
+        return self._size
 
     def get_quota_usage(self) -> int:
-        return len(self._buf)
+        return self._size
 
     def read_at(self, offset: int, size: int) -> bytes:
-        if size < 0:
-            return bytes(self._buf[offset:])
-        return bytes(self._buf[offset : offset + size])
+        file_size = self._size
+        if offset >= file_size or size == 0:
+            return b""
+        end = file_size if size < 0 else min(offset + size, file_size)
+        physical = len(self._buf)
+        if end <= physical:
+            if end - offset < _VIEW_READ_MIN:
+                return bytes(self._buf[offset:end])
+            with memoryview(self._buf) as view:
+                return view[offset:end].tobytes()
+        if offset >= physical:
+            return bytes(end - offset)
+        with memoryview(self._buf) as view:
+            return b"".join((view[offset:physical], bytes(end - physical)))
+
+    def readinto_at(self, offset: int, view: memoryview) -> int:
+        end = min(offset + len(view), self._size)
+        if offset >= end:
+            return 0
+        n = end - offset
+        copied = min(end, len(self._buf)) - offset
+        if copied > 0:
+            with memoryview(self._buf) as src:
+                view[:copied] = src[offset : offset + copied]
+        else:
+            copied = 0
+        if copied < n:
+            view[copied:n] = bytes(n - copied)
+        return n
 
     def write_at(
         self,
@@ -249,29 +381,37 @@ class RandomAccessMemoryFile(IMemoryFile):
         n = len(data)
         if n == 0:
             return 0, None, 0
-        current_len = len(self._buf)
-        new_size = max(current_len, offset + n)
-        extend = new_size - current_len
-        if extend > 0:
-            if memory_guard is not None:
-                memory_guard.check_before_write(extend)
-            with quota_mgr.reserve(extend):
-                try:
-                    if offset > current_len:
-                        self._buf.extend(bytes(offset - current_len))
-                        self._buf.extend(data)
-                    else:
-                        overlap = current_len - offset
-                        self._buf[offset:current_len] = data[:overlap]
-                        self._buf.extend(data[overlap:])
-                except MemoryError:
-                    raise _wrap_memory_error(
-                        f"OS memory allocation failed while writing {n:,} bytes. "
-                        f"MFS quota had {quota_mgr.free:,} bytes remaining. "
-                        "Consider reducing max_quota or using memory_guard='init'."
-                    ) from None
-        else:
-            self._buf[offset : offset + n] = data
+        buf = self._buf
+        physical = len(buf)
+        end = offset + n
+        if end <= physical:
+            # In-place overwrite: no growth, nothing to reserve.
+            buf[offset:end] = data
+            return n, None, 0
+        if memory_guard is not None:
+            memory_guard.check_before_write(end - physical)
+        # Only growth past the logical size costs quota; the lazy zero
+        # region was reserved by truncate().
+        with quota_mgr.reserve(end - self._size):
+            try:
+                if offset == physical:
+                    buf.extend(data)
+                elif offset > physical:
+                    buf.extend(bytes(offset - physical))
+                    buf.extend(data)
+                else:
+                    overlap = physical - offset
+                    view = memoryview(data)
+                    buf[offset:physical] = view[:overlap]
+                    buf.extend(view[overlap:])
+            except MemoryError:
+                raise _wrap_memory_error(
+                    f"OS memory allocation failed while writing {n:,} bytes. "
+                    f"MFS quota had {quota_mgr.free:,} bytes remaining. "
+                    "Consider reducing max_quota or using memory_guard='init'."
+                ) from None
+        if end > self._size:
+            self._size = end
         return n, None, 0
 
     def truncate(
@@ -280,29 +420,24 @@ class RandomAccessMemoryFile(IMemoryFile):
         quota_mgr: "QuotaManager",
         memory_guard: "MemoryGuard | None" = None,
     ) -> None:
-        old_size = len(self._buf)
+        old_size = self._size
         if size == old_size:
             return
         if size > old_size:
-            # POSIX: extend with zero bytes
-            extend = size - old_size
-            if memory_guard is not None:
-                memory_guard.check_before_write(extend)
-            with quota_mgr.reserve(extend):
-                try:
-                    self._buf.extend(bytes(extend))
-                except MemoryError:
-                    raise _wrap_memory_error(
-                        f"OS memory allocation failed while extending file to {size:,} bytes. "
-                        "Consider reducing max_quota or using memory_guard='init'."
-                    ) from None
+            # POSIX: extend with zero bytes.  Only quota is reserved here;
+            # read_at() fabricates the zeros and write_at() materializes them.
+            with quota_mgr.reserve(size - old_size):
+                self._size = size
             return
-        release = old_size - size
-        del self._buf[size:]
-        if old_size > 0 and size <= old_size * self.SHRINK_THRESHOLD:
-            self._buf = bytearray(self._buf)
-        quota_mgr.release(release)
+        physical = len(self._buf)
+        if size < physical:
+            del self._buf[size:]
+            if size <= physical * self.SHRINK_THRESHOLD:
+                self._buf = bytearray(self._buf)
+        self._size = size
+        quota_mgr.release(old_size - size)
 
     def _bulk_load(self, data: bytes) -> None:
         """Load data directly into storage, bypassing quota management."""
         self._buf = bytearray(data)
+        self._size = len(self._buf)
@@ -1,13 +1,16 @@
 from __future__ import annotations
 
 import fnmatch
+import functools
 import io
 import posixpath
+import re
+import sys
 import threading
 import time
-from collections.abc import Iterator
+from collections.abc import Callable, Iterator, Sequence
 
-from ._exceptions import MFSNodeLimitExceededError, MFSQuotaExceededError
+from ._exceptions import MFSNodeLimitExceededError
 from ._file import (
     CHUNK_OVERHEAD_ESTIMATE,
     IMemoryFile,
@@ -15,24 +18,75 @@ from ._file import (
     SequentialMemoryFile,
 )
 from ._handle import MemoryFileHandle
-from ._lock import ReadWriteLock
+from ._lock import ReadGuard, ReadWriteLock, WriteGuard
 from ._memory_guard import create_memory_guard
 from ._path import normalize_path
 from ._quota import QuotaManager
 from ._typing import MFSStatResult, MFSStats
 
+# Upper bound on MemoryFileSystem._path_cache entries; once full, each new
+# entry evicts the oldest one so memory stays bounded on huge trees.
+_PATH_CACHE_MAX: int = 4096
+
+_VALID_MODES: frozenset[str] = frozenset({"rb", "wb", "w+b", "ab", "r+b", "xb"})
+
+
+# Same test as glob.has_magic(): components without these are literal names.
+_GLOB_MAGIC = re.compile(r"[*?[]")
+
+
+@functools.lru_cache(maxsize=1024)
+def _glob_matcher(part: str) -> Callable[[str], re.Match[str] | None]:
+    """Compiled matcher for one glob path component (case-sensitive)."""
+    return re.compile(fnmatch.translate(part)).match
+
+
+@functools.lru_cache(maxsize=512)
+def _parse_glob(pattern: str) -> tuple[tuple[str, ...], int]:
+    """Split *pattern* into components and count the leading literal ones.
+
+    Runs of ``**`` collapse into one.  A count equal to the number of
+    components means the pattern has no wildcard at all.
+    """
+    parts: list[str] = []
+    for p in pattern.replace("\\", "/").split("/"):
+        # "**/**" matches exactly what "**" does.
+        if p and not (p == "**" and parts and parts[-1] == "**"):
+            parts.append(p)
+    literal = 0
+    while literal < len(parts) and _GLOB_MAGIC.search(parts[literal]) is None:
+        literal += 1
+    return tuple(parts), literal
+
+
 # ---------------------------------------------------------------------------
 #  Directory Index Layer
 # ---------------------------------------------------------------------------
 
 
 class DirNode:
-    __slots__ = ("node_id", "children", "created_at", "modified_at")
+    __slots__ = (
+        "node_id",
+        "parent",
+        "name",
+        "children",
+        "open_descendants",
+        "created_at",
+        "modified_at",
+    )
 
-    def __init__(self, node_id: int) -> None:
+    def __init__(self, node_id: int, now: float | None = None) -> None:
         self.node_id: int = node_id
-        self.children: dict[str, int] = {}
-        now = time.time()
+        # Back-pointer to the containing directory and the key under which
+        # this node is stored there; set by MemoryFileSystem._link().
+        self.parent: DirNode | None = None
+        self.name: str = ""
+        self.children: dict[str, Node] = {}
+        # Open handles anywhere below this directory; maintained by
+        # MemoryFileSystem._note_handle_opened()/_note_handle_closed().
+        self.open_descendants: int = 0
+        if now is None:
+            now = time.time()
         self.created_at: float = now
         self.modified_at: float = now
 
@@ -40,6 +94,8 @@ class DirNode:
 class FileNode:
     __slots__ = (
         "node_id",
+        "parent",
+        "name",
         "storage",
         "_rw_lock",
         "generation",
@@ -47,12 +103,15 @@ class FileNode:
         "modified_at",
     )
 
-    def __init__(self, node_id: int, storage: IMemoryFile) -> None:
+    def __init__(self, node_id: int, storage: IMemoryFile, now: float | None = None) -> None:
         self.node_id: int = node_id
+        self.parent: DirNode | None = None
+        self.name: str = ""
         self.storage: IMemoryFile = storage
         self._rw_lock: ReadWriteLock = ReadWriteLock()
         self.generation: int = 0
-        now = time.time()
+        if now is None:
+            now = time.time()
         self.created_at: float = now
         self.modified_at: float = now
 
@@ -84,7 +143,12 @@ class MemoryFileSystem:
                 "Expected 'auto', 'sequential', or 'random_access'."
             )
         self._quota = QuotaManager(max_quota)
-        self._global_lock = threading.RLock()
+        # Guards the directory index (_nodes, DirNode.children, _next_node_id,
+        # _path_cache).  Lookups share it; structural changes take it
+        # exclusively.  File contents are guarded by each FileNode's _rw_lock.
+        self._index_lock = ReadWriteLock()
+        self._read_index = ReadGuard(self._index_lock)
+        self._write_index = WriteGuard(self._index_lock)
         self._memory_guard = create_memory_guard(
             mode=memory_guard,
             action=memory_guard_action,
@@ -98,9 +162,30 @@ class MemoryFileSystem:
         self._promotion_hard_limit: int | None = promotion_hard_limit
         self._max_nodes: int | None = max_nodes
         self._default_storage: str = default_storage
+        # default_storage resolved once for _create_storage().
+        self._random_access_storage: bool = default_storage == "random_access"
+        self._allow_promotion: bool = default_storage != "sequential"
         self._default_lock_timeout: float | None = default_lock_timeout
+        # Registry of live nodes: backs max_nodes, stats() and the liveness
+        # checks of weakly consistent walks.  Traversal goes through
+        # DirNode.children, which holds the child nodes themselves.
         self._nodes: dict[int, Node] = {}
+        # DirNodes among _nodes; the rest are FileNodes.
+        self._dir_count: int = 0
         self._next_node_id: int = 0
+        # Shared creation timestamp while import_tree()/copy_tree() allocate
+        # a batch of nodes under the exclusive index lock; None otherwise.
+        self._batch_now: float | None = None
+        # npath -> resolved node.  Only hits are cached, so creating entries
+        # never stales it; every unlink/replace must call
+        # _invalidate_path_cache().
+        self._path_cache: dict[str, Node] = {}
+        # Readers fill the cache under the shared index lock, so inserts and
+        # evictions (which iterate the dict) are serialized among themselves.
+        self._path_cache_lock = threading.Lock()
+        # Serializes DirNode.open_descendants updates: handles open under the
+        # shared index lock and close without it.
+        self._open_count_lock = threading.Lock()
         # Root directory
         self._root = self._alloc_dir()
         self._memory_guard.check_init(max_quota)
@@ -109,11 +194,10 @@ class MemoryFileSystem:
 
     def _create_storage(self) -> IMemoryFile:
         """Create a new file storage object according to default_storage setting."""
-        if self._default_storage == "random_access":
+        if self._random_access_storage:
             return RandomAccessMemoryFile()
-        allow_promotion = self._default_storage != "sequential"
         return SequentialMemoryFile(
-            self._chunk_overhead, self._promotion_hard_limit, allow_promotion
+            self._chunk_overhead, self._promotion_hard_limit, self._allow_promotion
         )
 
     def _alloc_dir(self) -> DirNode:
@@ -121,8 +205,9 @@ class MemoryFileSystem:
             raise MFSNodeLimitExceededError(len(self._nodes), self._max_nodes)
         nid = self._next_node_id
         self._next_node_id += 1
-        node = DirNode(nid)
+        node = DirNode(nid, self._batch_now)
         self._nodes[nid] = node
+        self._dir_count += 1
         return node
 
     def _alloc_file(self, storage: IMemoryFile) -> FileNode:
@@ -130,10 +215,22 @@ class MemoryFileSystem:
             raise MFSNodeLimitExceededError(len(self._nodes), self._max_nodes)
         nid = self._next_node_id
         self._next_node_id += 1
-        node = FileNode(nid, storage)
+        node = FileNode(nid, storage, self._batch_now)
         self._nodes[nid] = node
         return node
 
+    @staticmethod
+    def _link(parent: DirNode, name: str, node: Node) -> None:
+        parent.children[name] = node
+        node.parent = parent
+        node.name = name
+
+    @staticmethod
+    def _unlink(node: Node) -> None:
+        parent = node.parent
+        assert parent is not None
+        del parent.children[node.name]
+
     # -- path helpers --
 
     def _np(self, path: str) -> str:
@@ -142,20 +239,52 @@ class MemoryFileSystem:
     def _resolve_path(self, npath: str) -> Node | None:
         if npath == "/":
             return self._root
-        parts = [p for p in npath.split("/") if p]
-        current: Node = self._root
-        for part in parts:
-            if not isinstance(current, DirNode):
+        cache = self._path_cache
+        cached = cache.get(npath)
+        if cached is not None:
+            return cached
+        # Misses are not cached, but their parent usually is: one probe
+        # then settles "does this entry exist?" without walking from root.
+        head, _, name = npath.rpartition("/")
+        parent = cache.get(head) if head else self._root
+        if parent is not None:
+            if not isinstance(parent, DirNode):
                 return None
-            child_id = current.children.get(part)
-            if child_id is None:
+            current = parent.children.get(name)
+            if current is None:
                 return None
-            current = self._nodes[child_id]
+        else:
+            parts = [p for p in npath.split("/") if p]
+            current = self._root
+            for i, part in enumerate(parts):
+                if not isinstance(current, DirNode):
+                    return None
+                child = current.children.get(part)
+                if child is None:
+                    if i == len(parts) - 1:
+                        # Remember the parent so repeated misses hit above.
+                        self._cache_resolved(head, current)
+                    return None
+                current = child
+        self._cache_resolved(npath, current)
         return current
 
+    def _cache_resolved(self, npath: str, node: Node) -> None:
+        cache = self._path_cache
+        with self._path_cache_lock:
+            if len(cache) >= _PATH_CACHE_MAX:
+                # dicts keep insertion order, so the first key is the oldest.
+                del cache[next(iter(cache))]
+            cache[npath] = node
+
+    def _invalidate_path_cache(self) -> None:
+        self._path_cache.clear()
+
     def _resolve_parent_and_name(self, npath: str) -> tuple[DirNode, str] | None:
         parent_path = posixpath.dirname(npath) or "/"
-        name = posixpath.basename(npath)
+        # Interned so that a name repeated across many directories is
+        # stored once and later dict probes can match it by identity.
+        name = sys.intern(posixpath.basename(npath))
         parent_node = self._resolve_path(parent_path)
         if parent_node is None or not isinstance(parent_node, DirNode):
             return None
@@ -170,79 +299,85 @@ class MemoryFileSystem:
         preallocate: int = 0,
         lock_timeout: float | None = None,
     ) -> MemoryFileHandle:
-        valid_modes = {"rb", "wb", "ab", "r+b", "xb"}
-        if mode not in valid_modes:
+        if mode not in _VALID_MODES:
             raise ValueError(
-                f"Invalid mode '{mode}'. MFS supports binary modes only: {valid_modes}"
+                f"Invalid mode '{mode}'. MFS supports binary modes only: {set(_VALID_MODES)}"
             )
         npath = self._np(path)
         handle = None
         fnode: FileNode | None = None
         effective_timeout = lock_timeout if lock_timeout is not None else self._default_lock_timeout
-        with self._global_lock:
-            node = self._resolve_path(npath)
-            if node is not None and isinstance(node, DirNode):
-                raise IsADirectoryError(f"Is a directory: '{path}'")
-            fnode = node if isinstance(node, FileNode) else None
+        # Opening an existing file leaves the index untouched, so every mode
+        # starts under the shared lock; only a missing file that this mode
+        # would create sends us round again under the exclusive one.
+        exclusive = False
+        while True:
+            with self._write_index if exclusive else self._read_index:
+                node = self._resolve_path(npath)
+                if node is None and not exclusive and mode not in ("rb", "r+b"):
+                    exclusive = True
+                    continue
+                if node is not None and isinstance(node, DirNode):
+                    raise IsADirectoryError(f"Is a directory: '{path}'")
+                fnode = node if isinstance(node, FileNode) else None
+
+                if mode == "rb":
+                    if fnode is None:
+                        raise FileNotFoundError(f"No such file: '{path}'")
+                    fnode._rw_lock.acquire_read(timeout=effective_timeout)
+                    handle = MemoryFileHandle(self, fnode, npath, mode)
 
-            if mode == "rb":
-                if fnode is None:
-                    raise FileNotFoundError(f"No such file: '{path}'")
-                fnode._rw_lock.acquire_read(timeout=effective_timeout)
-                handle = MemoryFileHandle(self, fnode, npath, mode)
+                elif mode in ("wb", "w+b"):
+                    if fnode is None:
+                        # New file: _create_file already sets timestamps
+                        fnode = self._create_file(npath)
+                        fnode._rw_lock.acquire_write(timeout=effective_timeout)
+                        handle = MemoryFileHandle(self, fnode, npath, mode)
+                    else:
+                        # Existing file: truncate and update metadata
+                        fnode._rw_lock.acquire_write(timeout=effective_timeout)
+                        fnode.storage.truncate(0, self._quota, self._memory_guard)
+                        fnode.generation += 1
+                        fnode.modified_at = time.time()
+                        handle = MemoryFileHandle(self, fnode, npath, mode)
 
-            elif mode == "wb":
-                if fnode is None:
-                    # New file: _create_file already sets timestamps
-                    fnode = self._create_file(npath)
+                elif mode == "ab":
+                    if fnode is None:
+                        fnode = self._create_file(npath)
                     fnode._rw_lock.acquire_write(timeout=effective_timeout)
-                    handle = MemoryFileHandle(self, fnode, npath, mode)
-                else:
-                    # Existing file: truncate and update metadata
+                    handle = MemoryFileHandle(self, fnode, npath, mode, is_append=True)
+
+                elif mode == "r+b":
+                    if fnode is None:
+                        raise FileNotFoundError(f"No such file: '{path}'")
                     fnode._rw_lock.acquire_write(timeout=effective_timeout)
-                    fnode.storage.truncate(0, self._quota, self._memory_guard)
-                    fnode.generation += 1
-                    fnode.modified_at = time.time()
                     handle = MemoryFileHandle(self, fnode, npath, mode)
 
-            elif mode == "ab":
-                if fnode is None:
+                elif mode == "xb":
+                    if fnode is not None:
+                        raise FileExistsError(f"File exists: '{path}'")
                     fnode = self._create_file(npath)
-                fnode._rw_lock.acquire_write(timeout=effective_timeout)
-                handle = MemoryFileHandle(self, fnode, npath, mode, is_append=True)
-
-            elif mode == "r+b":
-                if fnode is None:
-                    raise FileNotFoundError(f"No such file: '{path}'")
-                fnode._rw_lock.acquire_write(timeout=effective_timeout)
-                handle = MemoryFileHandle(self, fnode, npath, mode)
-
-            elif mode == "xb":
-                if fnode is not None:
-                    raise FileExistsError(f"File exists: '{path}'")
-                fnode = self._create_file(npath)
-                fnode._rw_lock.acquire_write(timeout=effective_timeout)
-                handle = MemoryFileHandle(self, fnode, npath, mode)
-
-            if preallocate > 0 and handle is not None and fnode is not None:
-                current = fnode.storage.get_size()
-                if preallocate > current:
-                    try:
-                        n, promoted, old_quota = fnode.storage.write_at(
-                            current,
-                            bytes(preallocate - current),
-                            self._quota,
-                            self._memory_guard,
-                        )
-                        if promoted is not None:
-                            fnode.storage = promoted
-                            self._quota.release(old_quota)
-                        fnode.generation += 1
-                    except Exception:
-                        handle.close()
-                        raise
+                    fnode._rw_lock.acquire_write(timeout=effective_timeout)
+                    handle = MemoryFileHandle(self, fnode, npath, mode)
 
-        return handle  # type: ignore[return-value]
+                if preallocate > 0 and handle is not None and fnode is not None:
+                    current = fnode.storage.get_size()
+                    if preallocate > current:
+                        try:
+                            # A growing truncate() reserves the quota but keeps
+                            # the zeros lazy, so no preallocate-sized temporary
+                            # is built.  The RAM check still covers the full
+                            # size, since writes will materialize it.
+                            self._memory_guard.check_before_write(preallocate - current)
+                            fnode.storage.truncate(
+                                preallocate, self._quota, self._memory_guard
+                            )
+                            fnode.generation += 1
+                        except Exception:
+                            handle.close()
+                            raise
+
+                return handle  # type: ignore[return-value]
 
     def _create_file(self, npath: str) -> FileNode:
         pinfo = self._resolve_parent_and_name(npath)
@@ -252,49 +387,54 @@ class MemoryFileSystem:
         parent, name = pinfo
         storage = self._create_storage()
         fnode = self._alloc_file(storage)
-        parent.children[name] = fnode.node_id
+        self._link(parent, name, fnode)
         return fnode
 
     def mkdir(self, path: str, exist_ok: bool = False) -> None:
         npath = self._np(path)
-        with self._global_lock:
-            node = self._resolve_path(npath)
-            if node is not None:
-                if isinstance(node, DirNode):
-                    if not exist_ok:
-                        raise FileExistsError(f"Directory exists: '{path}'")
-                    return
-                else:
-                    raise FileExistsError(f"File exists at path: '{path}'")
+        # mkdir(exist_ok=True) on an existing directory is a pure lookup.
+        with self._read_index:
+            if self._mkdir_target_exists(npath, path, exist_ok):
+                return
+        with self._write_index:
+            if self._mkdir_target_exists(npath, path, exist_ok):
+                return
             self._makedirs(npath)
 
-    def _makedirs(self, npath: str, created_dirs: list[str] | None = None) -> None:
+    def _mkdir_target_exists(self, npath: str, path: str, exist_ok: bool) -> bool:
+        node = self._resolve_path(npath)
+        if node is None:
+            return False
+        if isinstance(node, DirNode):
+            if not exist_ok:
+                raise FileExistsError(f"Directory exists: '{path}'")
+            return True
+        raise FileExistsError(f"File exists at path: '{path}'")
+
+    def _makedirs(self, npath: str, created_dirs: list[DirNode] | None = None) -> DirNode:
         parts = [p for p in npath.split("/") if p]
         current = self._root
-        current_path = ""
         for part in parts:
-            next_path = current_path + "/" + part
-            child_id = current.children.get(part)
-            if child_id is not None:
-                child = self._nodes[child_id]
+            child = current.children.get(part)
+            if child is not None:
                 if isinstance(child, DirNode):
                     current = child
                 else:
                     raise FileExistsError(f"A file exists at path component: '{part}'")
             else:
                 new_dir = self._alloc_dir()
-                current.children[part] = new_dir.node_id
+                self._link(current, sys.intern(part), new_dir)
                 current = new_dir
                 if created_dirs is not None:
-                    created_dirs.append(next_path)
-            current_path = next_path
+                    created_dirs.append(new_dir)
+        return current
 
     def rename(self, src: str, dst: str) -> None:
         nsrc = self._np(src)
         ndst = self._np(dst)
         if nsrc == "/":
             raise ValueError("Cannot rename the root directory.")
-        with self._global_lock:
+        with self._write_index:
             src_node = self._resolve_path(nsrc)
             if src_node is None:
                 raise FileNotFoundError(f"No such file or directory: '{src}'")
@@ -306,20 +446,17 @@ class MemoryFileSystem:
                 raise FileNotFoundError(f"Destination parent does not exist: '{dst}'")
             # Check open handles
             self._assert_no_open_handles(src_node, nsrc)
-            # Detach from old parent
-            src_pinfo = self._resolve_parent_and_name(nsrc)
-            assert src_pinfo is not None
-            src_parent, src_name = src_pinfo
             dst_parent, dst_name = dst_pinfo
-            del src_parent.children[src_name]
-            dst_parent.children[dst_name] = src_node.node_id
+            self._unlink(src_node)
+            self._link(dst_parent, dst_name, src_node)
+            self._invalidate_path_cache()
 
     def move(self, src: str, dst: str) -> None:
         nsrc = self._np(src)
         ndst = self._np(dst)
         if nsrc == "/":
             raise ValueError("Cannot move the root directory.")
-        with self._global_lock:
+        with self._write_index:
             src_node = self._resolve_path(nsrc)
             if src_node is None:
                 raise FileNotFoundError(f"No such file or directory: '{src}'")
@@ -333,26 +470,54 @@ class MemoryFileSystem:
                 self._makedirs(dst_parent_path)
             dst_pinfo = self._resolve_parent_and_name(ndst)
             assert dst_pinfo is not None
-            src_pinfo = self._resolve_parent_and_name(nsrc)
-            assert src_pinfo is not None
-            src_parent, src_name = src_pinfo
             dst_parent, dst_name = dst_pinfo
-            del src_parent.children[src_name]
-            dst_parent.children[dst_name] = src_node.node_id
+            self._unlink(src_node)
+            self._link(dst_parent, dst_name, src_node)
+            self._invalidate_path_cache()
+
+    # Subtree helpers walk with an explicit stack rather than recursion, so
+    # tree depth is bounded by memory, not the interpreter recursion limit.
+    # Children are pushed reversed to keep the recursive pre-order.  Paths
+    # passed around are normalized (no trailing "/" except the root), so
+    # child paths are joined without rstrip().
+
+    def _note_handle_opened(self, fnode: FileNode) -> None:
+        with self._open_count_lock:
+            parent = fnode.parent
+            while parent is not None:
+                parent.open_descendants += 1
+                parent = parent.parent
+
+    def _note_handle_closed(self, fnode: FileNode) -> None:
+        with self._open_count_lock:
+            parent = fnode.parent
+            while parent is not None:
+                parent.open_descendants -= 1
+                parent = parent.parent
 
     def _assert_no_open_handles(self, node: Node, path_for_error: str) -> None:
         if isinstance(node, FileNode):
             if node._rw_lock.is_locked:
                 raise BlockingIOError(f"File is open: '{path_for_error}'")
-        elif isinstance(node, DirNode):
-            for name, child_id in node.children.items():
-                child = self._nodes[child_id]
-                child_path = path_for_error.rstrip("/") + "/" + name
-                self._assert_no_open_handles(child, child_path)
+            return
+        if not node.open_descendants:
+            return
+        # Something below is open: walk only to name it in the error.
+        stack: list[tuple[Node, str]] = [(node, path_for_error)]
+        while stack:
+            node, node_path = stack.pop()
+            if isinstance(node, FileNode):
+                if node._rw_lock.is_locked:
+                    raise BlockingIOError(f"File is open: '{node_path}'")
+            else:
+                base = "/" if node_path == "/" else node_path + "/"
+                stack.extend(
+                    (child, base + name) for name, child in reversed(node.children.items())
+                )
 
     def remove(self, path: str) -> None:
         npath = self._np(path)
-        with self._global_lock:
+        with self._write_index:
             node = self._resolve_path(npath)
             if node is None:
                 raise FileNotFoundError(f"No such file: '{path}'")
@@ -361,65 +526,92 @@ class MemoryFileSystem:
             if node._rw_lock.is_locked:
                 raise BlockingIOError(f"File is open: '{path}'")
             size = node.storage.get_quota_usage()
-            pinfo = self._resolve_parent_and_name(npath)
-            assert pinfo is not None
-            parent, name = pinfo
-            del parent.children[name]
+            self._unlink(node)
             del self._nodes[node.node_id]
+            self._invalidate_path_cache()
             self._quota.release(size)
 
     def rmtree(self, path: str) -> None:
         npath = self._np(path)
         if npath == "/":
             raise ValueError("Cannot remove the root directory.")
-        with self._global_lock:
+        with self._write_index:
             node = self._resolve_path(npath)
             if node is None:
                 raise FileNotFoundError(f"No such directory: '{path}'")
             if not isinstance(node, DirNode):
                 raise NotADirectoryError(f"Not a directory: '{path}'")
             self._assert_no_open_handles(node, npath)
-            total_released = self._calc_subtree_quota(node)
-            pinfo = self._resolve_parent_and_name(npath)
-            if pinfo is not None:
-                parent, name = pinfo
-                del parent.children[name]
-            self._remove_subtree(node)
+            self._unlink(node)
+            total_released = self._drop_subtree(node)
+            self._invalidate_path_cache()
             self._quota.release(total_released)
 
     def _calc_subtree_quota(self, node: Node) -> int:
         total = 0
-        if isinstance(node, FileNode):
-            total += node.storage.get_quota_usage()
-        elif isinstance(node, DirNode):
-            for child_id in node.children.values():
-                total += self._calc_subtree_quota(self._nodes[child_id])
+        stack: list[Node] = [node]
+        while stack:
+            node = stack.pop()
+            if isinstance(node, FileNode):
+                total += node.storage.get_quota_usage()
+            else:
+                stack.extend(node.children.values())
         return total
 
-    def _remove_subtree(self, node: Node) -> None:
-        if isinstance(node, DirNode):
-            for child_id in list(node.children.values()):
-                self._remove_subtree(self._nodes[child_id])
-            node.children.clear()
-        if node.node_id in self._nodes:
-            del self._nodes[node.node_id]
+    def _drop_subtree(self, node: DirNode) -> int:
+        """Deregister *node* and everything under it; return the quota held."""
+        nodes = self._nodes
+        total = 0
+        dirs = 0
+        # Only directories go through the stack; files are settled while
+        # their parent's children are scanned.
+        stack: list[DirNode] = [node]
+        while stack:
+            dnode = stack.pop()
+            for child in dnode.children.values():
+                if isinstance(child, FileNode):
+                    total += child.storage.get_quota_usage()
+                    nodes.pop(child.node_id, None)
+                else:
+                    stack.append(child)
+            dnode.children.clear()
+            nodes.pop(dnode.node_id, None)
+            dirs += 1
+        self._dir_count -= dirs
+        return total
 
     def listdir(self, path: str) -> list[str]:
         npath = self._np(path)
-        with self._global_lock:
+        with self._read_index:
+            node = self._resolve_path(npath)
+            if node is None:
+                raise FileNotFoundError(f"No such directory: '{path}'")
+            if not isinstance(node, DirNode):
+                raise NotADirectoryError(f"Not a directory: '{path}'")
+            return list(node.children)
+
+    def iter_listdir(self, path: str) -> Iterator[str]:
+        """Iterate over the entry names of a directory.
+
+        Like listdir(), but hands back an iterator over a tuple snapshot
+        taken under the index lock, for callers that only loop over the
+        names.  Errors are raised at call time, not on first iteration.
+        """
+        npath = self._np(path)
+        with self._read_index:
             node = self._resolve_path(npath)
             if node is None:
                 raise FileNotFoundError(f"No such directory: '{path}'")
             if not isinstance(node, DirNode):
                 raise NotADirectoryError(f"Not a directory: '{path}'")
-            return list(node.children.keys())
+            return iter(tuple(node.children))
 
     def exists(self, path: str) -> bool:
         try:
             npath = self._np(path)
         except ValueError:
             return False
-        with self._global_lock:
+        with self._read_index:
             return self._resolve_path(npath) is not None
 
     def is_dir(self, path: str) -> bool:
@@ -427,7 +619,7 @@ class MemoryFileSystem:
             npath = self._np(path)
         except ValueError:
             return False
-        with self._global_lock:
+        with self._read_index:
             node = self._resolve_path(npath)
             return node is not None and isinstance(node, DirNode)
 
@@ -436,12 +628,12 @@ class MemoryFileSystem:
             npath = self._np(path)
         except ValueError:
             return False
-        with self._global_lock:
+        with self._read_index:
             return isinstance(self._resolve_path(npath), FileNode)
 
     def stat(self, path: str) -> MFSStatResult:
         npath = self._np(path)
-        with self._global_lock:
+        with self._read_index:
             node = self._resolve_path(npath)
             if node is None:
                 raise FileNotFoundError(f"No such file or directory: '{path}'")
@@ -462,17 +654,16 @@ class MemoryFileSystem:
             )
 
     def stats(self) -> MFSStats:
-        with self._global_lock:
-            file_count = 0
-            dir_count = 0
+        with self._read_index:
+            dir_count = self._dir_count
+            file_count = len(self._nodes) - dir_count
             chunk_count = 0
-            for node in self._nodes.values():
-                if isinstance(node, DirNode):
-                    dir_count += 1
-                elif isinstance(node, FileNode):
-                    file_count += 1
-                    if isinstance(node.storage, SequentialMemoryFile):
-                        chunk_count += len(node.storage._chunks)
+            if file_count:
+                for node in self._nodes.values():
+                    if isinstance(node, FileNode):
+                        storage = node.storage
+                        if isinstance(storage, SequentialMemoryFile):
+                            chunk_count += len(storage._chunks)
             quota_max, _quota_used, quota_free = self._quota.snapshot()
         return MFSStats(
             used_bytes=quota_max - quota_free,
@@ -486,7 +677,7 @@ class MemoryFileSystem:
 
     def get_size(self, path: str) -> int:
         npath = self._np(path)
-        with self._global_lock:
+        with self._read_index:
             node = self._resolve_path(npath)
             if node is None:
                 raise FileNotFoundError(f"No such file: '{path}'")
@@ -502,7 +693,7 @@ class MemoryFileSystem:
         beyond the configured quota limit.
         """
         npath = self._np(path)
-        with self._global_lock:
+        with self._read_index:
             node = self._resolve_path(npath)
             if node is None:
                 raise FileNotFoundError(f"No such file: '{path}'")
@@ -520,65 +711,98 @@ class MemoryFileSystem:
         return io.BytesIO(data)
 
     def export_tree(self, prefix: str = "/", only_dirty: bool = False) -> dict[str, bytes]:
-        return dict(self.iter_export_tree(prefix=prefix, only_dirty=only_dirty))
+        # Same snapshot and per-file locking as iter_export_tree(), filled in
+        # one loop instead of resuming a generator for every file.
+        nodes = self._nodes
+        result: dict[str, bytes] = {}
+        for fpath, fnode in self._export_snapshot(prefix, only_dirty):
+            if fnode.node_id not in nodes:
+                continue
+            lock = fnode._rw_lock
+            lock.acquire_read()
+            try:
+                result[fpath] = fnode.storage.read_at(0, -1)
+            finally:
+                lock.release_read()
+        return result
 
     def iter_export_tree(
         self, prefix: str = "/", only_dirty: bool = False
     ) -> Iterator[tuple[str, bytes]]:
-        nprefix = self._np(prefix)
-        with self._global_lock:
-            entries: list[tuple[str, FileNode]] = []
-            self._collect_files(self._resolve_path(nprefix), nprefix, entries)
-            if only_dirty:
-                entries = [(p, fn) for p, fn in entries if fn.generation > 0]
-        for fpath, fnode in entries:
-            if fnode.node_id not in self._nodes:
+        nodes = self._nodes
+        for fpath, fnode in self._export_snapshot(prefix, only_dirty):
+            if fnode.node_id not in nodes:
                 continue
-            fnode._rw_lock.acquire_read()
+            lock = fnode._rw_lock
+            lock.acquire_read()
             try:
-                data = fnode.storage.read_at(0, fnode.storage.get_size())
+                data = fnode.storage.read_at(0, -1)
             finally:
-                fnode._rw_lock.release_read()
+                lock.release_read()
             yield fpath, data
 
+    def _export_snapshot(self, prefix: str, only_dirty: bool) -> list[tuple[str, FileNode]]:
+        nprefix = self._np(prefix)
+        entries: list[tuple[str, FileNode]] = []
+        with self._read_index:
+            self._collect_files(self._resolve_path(nprefix), nprefix, entries)
+        if only_dirty:
+            entries = [(p, fn) for p, fn in entries if fn.generation > 0]
+        return entries
+
     def _collect_files(
         self, node: Node | None, current_path: str, result: list[tuple[str, FileNode]]
     ) -> None:
         if node is None:
             return
-        if isinstance(node, FileNode):
-            result.append((current_path, node))
-        elif isinstance(node, DirNode):
-            for name, child_id in node.children.items():
-                child = self._nodes[child_id]
-                child_path = current_path.rstrip("/") + "/" + name
-                self._collect_files(child, child_path, result)
+        stack: list[tuple[Node, str]] = [(node, current_path)]
+        while stack:
+            node, node_path = stack.pop()
+            if isinstance(node, FileNode):
+                result.append((node_path, node))
+            else:
+                base = "/" if node_path == "/" else node_path + "/"
+                stack.extend(
+                    (child, base + name) for name, child in reversed(node.children.items())
+                )
 
     def import_tree(self, tree: dict[str, bytes]) -> None:
         if not tree:
             return
-        with self._global_lock:
+        with self._write_index:
             normalized: dict[str, bytes] = {}
             for path, data in tree.items():
                 npath = self._np(path)
                 normalized[npath] = data
 
-            # Check for open files
-            for npath in normalized:
-                node = self._resolve_path(npath)
-                if node is not None and isinstance(node, FileNode) and node._rw_lock.is_locked:
-                    raise BlockingIOError(f"Cannot import: file is open: '{npath}'")
-
-            # Calculate quota
+            # One lookup per entry checks for open files, finds the nodes being
+            # replaced and sums the quota they free.  Paths that are or will
+            # become directories are rejected here, before anything is
+            # mutated, rather than rolled back from the write phase.
             old_quota = 0
             old_nodes: dict[str, FileNode | None] = {}
+            dir_conflict: str | None = None
             for npath in normalized:
                 node = self._resolve_path(npath)
-                if node is not None and isinstance(node, FileNode):
+                if isinstance(node, FileNode):
+                    if node._rw_lock.is_locked:
+                        raise BlockingIOError(f"Cannot import: file is open: '{npath}'")
                     old_quota += node.storage.get_quota_usage()
                     old_nodes[npath] = node
                 else:
+                    if node is not None and dir_conflict is None:
+                        dir_conflict = npath
                     old_nodes[npath] = None
+            parent_paths = {posixpath.dirname(p) or "/" for p in normalized}
+            if dir_conflict is None:
+                needed_dirs: set[str] = set()
+                for dpath in parent_paths:
+                    while dpath != "/" and dpath not in needed_dirs:
+                        needed_dirs.add(dpath)
+                        dpath = posixpath.dirname(dpath)
+                dir_conflict = next((p for p in normalized if p in needed_dirs), None)
+            if dir_conflict is not None:
+                raise IsADirectoryError(f"Cannot import: is a directory: '{dir_conflict}'")
 
             new_quota = 0
             for npath, data in normalized.items():
@@ -587,90 +811,100 @@ class MemoryFileSystem:
 
             net = new_quota - old_quota
             if net > 0:
-                avail = self._quota.free
-                if net > avail:
-                    raise MFSQuotaExceededError(requested=net, available=avail)
                 self._memory_guard.check_before_write(net)
 
-            written_npaths: list[str] = []
-            new_fnodes: dict[str, FileNode] = {}
-            created_dirs: list[str] = []
-
-            try:
-                for npath, data in normalized.items():
-                    self._ensure_parents(npath, created_dirs)
-                    storage = self._create_storage()
-                    try:
-                        storage._bulk_load(data)
-                    except MemoryError:
-                        raise MemoryError(
-                            f"OS memory allocation failed during import_tree "
-                            f"(file: '{npath}', size: {len(data):,} bytes). "
-                            "Consider reducing max_quota or using memory_guard='init'."
-                        ) from None
-                    fnode = self._alloc_file(storage)
-                    fnode.generation = 0
-                    # Insert into parent
-                    pinfo = self._resolve_parent_and_name(npath)
-                    assert pinfo is not None
-                    parent, name = pinfo
-                    # Remove old node if exists
-                    old_node = old_nodes.get(npath)
-                    if old_node is not None:
-                        del self._nodes[old_node.node_id]
-                    parent.children[name] = fnode.node_id
-                    new_fnodes[npath] = fnode
-                    written_npaths.append(npath)
-            except Exception:
-                # Rollback
-                for npath in written_npaths:
-                    fn = new_fnodes.get(npath)
-                    if fn is not None and fn.node_id in self._nodes:
-                        del self._nodes[fn.node_id]
-                    old_fn = old_nodes.get(npath)
-                    pinfo = self._resolve_parent_and_name(npath)
-                    if pinfo is not None:
-                        parent, name = pinfo
+            # Reserve the net growth before writing anything, so handle writes
+            # on other threads cannot take quota this import was promised;
+            # reserve() hands it back if the import raises.
+            with self._quota.reserve(net):
+                written_npaths: list[str] = []
+                new_fnodes: dict[str, FileNode] = {}
+                created_dirs: list[DirNode] = []
+                parent_dirs: dict[str, DirNode] = {}
+
+                self._batch_now = time.time()
+                try:
+                    for npath, data in normalized.items():
+                        old_node = old_nodes.get(npath)
+                        if old_node is not None:
+                            assert old_node.parent is not None
+                            parent, name = old_node.parent, old_node.name
+                        else:
+                            # Each distinct parent is resolved or created once,
+                            # on first use, so directories appear in the same
+                            # order as the entries that need them.
+                            parent_path = posixpath.dirname(npath) or "/"
+                            cached_parent = parent_dirs.get(parent_path)
+                            if cached_parent is None:
+                                cached_parent = self._ensure_dir(parent_path, created_dirs)
+                                parent_dirs[parent_path] = cached_parent
+                            parent = cached_parent
+                            name = sys.intern(posixpath.basename(npath))
+                            if name in parent.children:
+                                raise IsADirectoryError(f"Cannot import: is a directory: '{npath}'")
+                        storage = self._create_storage()
+                        try:
+                            storage._bulk_load(data)
+                        except MemoryError:
+                            raise MemoryError(
+                                f"OS memory allocation failed during import_tree "
+                                f"(file: '{npath}', size: {len(data):,} bytes). "
+                                "Consider reducing max_quota or using memory_guard='init'."
+                            ) from None
+                        fnode = self._alloc_file(storage)
+                        fnode.generation = 0
+                        # Replace the old node in place, or insert into parent
+                        if old_node is not None:
+                            del self._nodes[old_node.node_id]
+                            self._invalidate_path_cache()
+                        self._link(parent, name, fnode)
+                        new_fnodes[npath] = fnode
+                        written_npaths.append(npath)
+                except Exception:
+                    # Rollback
+                    self._invalidate_path_cache()
+                    for npath in written_npaths:
+                        fn = new_fnodes[npath]
+                        self._nodes.pop(fn.node_id, None)
+                        fn_parent = fn.parent
+                        assert fn_parent is not None
+                        old_fn = old_nodes.get(npath)
                         if old_fn is not None:
                             self._nodes[old_fn.node_id] = old_fn
-                            parent.children[name] = old_fn.node_id
-                        elif name in parent.children:
-                            del parent.children[name]
-                self._rollback_created_dirs(created_dirs)
-                raise
-
-            if net > 0:
-                self._quota._force_reserve(net)
-            elif net < 0:
+                            fn_parent.children[fn.name] = old_fn
+                        elif fn_parent.children.get(fn.name) is fn:
+                            del fn_parent.children[fn.name]
+                    self._rollback_created_dirs(created_dirs)
+                    raise
+                finally:
+                    self._batch_now = None
+            if net < 0:
                 self._quota.release(-net)
 
-    def _rollback_created_dirs(self, created_dirs: list[str]) -> None:
-        for dpath in reversed(created_dirs):
-            node = self._resolve_path(dpath)
-            if node is None or not isinstance(node, DirNode):
-                continue
+    def _rollback_created_dirs(self, created_dirs: list[DirNode]) -> None:
+        # Deepest first, so each directory is empty again by the time its
+        # parent is considered.  Anything still holding children is kept.
+        for node in reversed(created_dirs):
             if node.children:
                 continue
-            pinfo = self._resolve_parent_and_name(dpath)
-            if pinfo is None:
-                continue
-            parent, name = pinfo
-            child_id = parent.children.get(name)
-            if child_id != node.node_id:
+            parent = node.parent
+            if parent is None or parent.children.get(node.name) is not node:
                 continue
-            del parent.children[name]
-            if node.node_id in self._nodes:
-                del self._nodes[node.node_id]
+            del parent.children[node.name]
+            if self._nodes.pop(node.node_id, None) is not None:
+                self._dir_count -= 1
+        self._invalidate_path_cache()
 
-    def _ensure_parents(self, npath: str, created_dirs: list[str] | None = None) -> None:
-        parent_path = posixpath.dirname(npath) or "/"
-        if self._resolve_path(parent_path) is None:
-            self._makedirs(parent_path, created_dirs)
+    def _ensure_dir(self, dpath: str, created_dirs: list[DirNode] | None = None) -> DirNode:
+        node = self._resolve_path(dpath)
+        if isinstance(node, DirNode):
+            return node
+        return self._makedirs(dpath, created_dirs)
 
     def copy(self, src: str, dst: str) -> None:
         nsrc = self._np(src)
         ndst = self._np(dst)
-        with self._global_lock:
+        with self._write_index:
             src_node = self._resolve_path(nsrc)
             if src_node is None:
                 raise FileNotFoundError(f"No such file: '{src}'")
@@ -680,7 +914,7 @@ class MemoryFileSystem:
                 raise FileExistsError(f"Destination already exists: '{dst}'")
             src_node._rw_lock.acquire_read()
             try:
-                data = src_node.storage.read_at(0, src_node.storage.get_size())
+                data = src_node.storage.read_at(0, -1)
             finally:
                 src_node._rw_lock.release_read()
             fnode = self._create_file(ndst)
@@ -696,7 +930,7 @@ class MemoryFileSystem:
     def copy_tree(self, src: str, dst: str) -> None:
         nsrc = self._np(src)
         ndst = self._np(dst)
-        with self._global_lock:
+        with self._write_index:
             src_node = self._resolve_path(nsrc)
             if src_node is None:
                 raise FileNotFoundError(f"No such file or directory: '{src}'")
@@ -710,58 +944,70 @@ class MemoryFileSystem:
             # Calculate total data to copy for quota pre-check
             total_data = self._calc_subtree_quota(src_node)
             if total_data > 0:
-                avail = self._quota.free
-                if total_data > avail:
-                    raise MFSQuotaExceededError(requested=total_data, available=avail)
                 self._memory_guard.check_before_write(total_data)
-            # Deep copy the subtree with rollback on failure
+            # Deep copy the subtree into quota reserved up front; reserve()
+            # releases it again if the copy is rolled back.
             dst_parent, dst_name = dst_pinfo
             created_node_ids: list[int] = []
-            try:
-                new_root = self._deep_copy_subtree(src_node, created_node_ids)
-            except Exception:
-                for nid in reversed(created_node_ids):
-                    self._nodes.pop(nid, None)
-                raise
-            dst_parent.children[dst_name] = new_root.node_id
-            if total_data > 0:
-                self._quota._force_reserve(total_data)
+            with self._quota.reserve(total_data):
+                self._batch_now = time.time()
+                try:
+                    new_root = self._deep_copy_subtree(src_node, created_node_ids)
+                except Exception:
+                    for nid in reversed(created_node_ids):
+                        if isinstance(self._nodes.pop(nid, None), DirNode):
+                            self._dir_count -= 1
+                    raise
+                finally:
+                    self._batch_now = None
+                self._link(dst_parent, dst_name, new_root)
 
     def _deep_copy_subtree(self, node: Node, created_node_ids: list[int]) -> Node:
-        if isinstance(node, FileNode):
-            # Read data under read lock
-            node._rw_lock.acquire_read()
-            try:
-                data = node.storage.read_at(0, node.storage.get_size())
-            finally:
-                node._rw_lock.release_read()
-            storage = self._create_storage()
-            storage._bulk_load(data)
-            new_fnode = self._alloc_file(storage)
-            created_node_ids.append(new_fnode.node_id)
-            new_fnode.generation = 0
-            return new_fnode
-        elif isinstance(node, DirNode):
-            new_dir = self._alloc_dir()
-            created_node_ids.append(new_dir.node_id)
-            for name, child_id in node.children.items():
-                child = self._nodes[child_id]
-                new_child = self._deep_copy_subtree(child, created_node_ids)
-                new_dir.children[name] = new_child.node_id
-            return new_dir
-        raise TypeError(f"Unknown node type: {type(node)}")
+        new_root: Node | None = None
+        # (source node, new parent dir or None for the root, entry name)
+        stack: list[tuple[Node, DirNode | None, str]] = [(node, None, "")]
+        while stack:
+            src, new_parent, name = stack.pop()
+            new_node: Node
+            if isinstance(src, FileNode):
+                # Read data under read lock
+                src._rw_lock.acquire_read()
+                try:
+                    data = src.storage.read_at(0, -1)
+                finally:
+                    src._rw_lock.release_read()
+                storage = self._create_storage()
+                storage._bulk_load(data)
+                new_node = self._alloc_file(storage)
+                created_node_ids.append(new_node.node_id)
+                new_node.generation = 0
+            elif isinstance(src, DirNode):
+                new_node = self._alloc_dir()
+                created_node_ids.append(new_node.node_id)
+                stack.extend(
+                    (child, new_node, child_name)
+                    for child_name, child in reversed(src.children.items())
+                )
+            else:
+                raise TypeError(f"Unknown node type: {type(src)}")
+            if new_parent is None:
+                new_root = new_node
+            else:
+                self._link(new_parent, name, new_node)
+        assert new_root is not None
+        return new_root
 
     def walk(self, path: str = "/") -> Iterator[tuple[str, list[str], list[str]]]:
         """Recursively walk the directory tree (top-down).
 
         .. warning::
             Thread Safety (Weak Consistency):
-            walk() does not hold _global_lock across iterations.
+            walk() does not hold the index lock across iterations.
             Structural changes by other threads may cause inconsistencies.
             Deleted entries are skipped (no crash).
         """
         npath = self._np(path)
-        with self._global_lock:
+        with self._read_index:
             node = self._resolve_path(npath)
             if node is None:
                 raise FileNotFoundError(f"No such directory: '{path}'")
@@ -772,103 +1018,150 @@ class MemoryFileSystem:
     def _walk_dir(
         self, dir_path: str, dir_node: DirNode
     ) -> Iterator[tuple[str, list[str], list[str]]]:
-        dirnames: list[str] = []
-        filenames: list[str] = []
-        child_dirs: list[tuple[str, DirNode]] = []
-        with self._global_lock:
-            snapshot = list(dir_node.children.items())
-        for name, child_id in snapshot:
-            child = self._nodes.get(child_id)
-            if child is None:
+        for dir_path, _, snapshot in self._iter_dir_snapshots(dir_path, dir_node):
+            dirnames: list[str] = []
+            filenames: list[str] = []
+            for name, child in snapshot.items():
+                if isinstance(child, DirNode):
+                    dirnames.append(name)
+                else:
+                    filenames.append(name)
+            yield dir_path, dirnames, filenames
+
+    def _iter_dir_snapshots(
+        self, dir_path: str, dir_node: DirNode
+    ) -> Iterator[tuple[str, str, dict[str, Node]]]:
+        """Yield ``(path, path + "/", children snapshot)`` for *dir_node* and
+        every directory below it, top-down in name order."""
+        nodes = self._nodes
+        stack: list[tuple[str, DirNode]] = [(dir_path, dir_node)]
+        first = True
+        while stack:
+            dir_path, dir_node = stack.pop()
+            # Subdirectories are checked when reached, after the caller has
+            # consumed their parent, so ones deleted meanwhile are skipped.
+            # Children come from a snapshot of a live directory and need no
+            # check of their own.
+            if not first and dir_node.node_id not in nodes:
                 continue
-            if isinstance(child, DirNode):
-                dirnames.append(name)
-                child_dirs.append((dir_path.rstrip("/") + "/" + name, child))
-            else:
-                filenames.append(name)
-        yield dir_path, dirnames, filenames
-        for child_path, child_dir in child_dirs:
-            if child_dir.node_id in self._nodes:
-                yield from self._walk_dir(child_path, child_dir)
+            first = False
+            # dict.copy() is one table copy; the (name, child) pairs are only
+            # built while iterating, after the index lock is released.
+            with self._read_index:
+                snapshot = dir_node.children.copy()
+            base = "/" if dir_path == "/" else dir_path + "/"
+            yield dir_path, base, snapshot
+            stack.extend(
+                [
+                    (base + name, child)
+                    for name, child in reversed(snapshot.items())
+                    if isinstance(child, DirNode)
+                ]
+            )
 
     def glob(self, pattern: str) -> list[str]:
         """Return a sorted list of paths matching *pattern*.
 
         Supports `*` (single dir), `**` (recursive), `?`, `[seq]`.
         """
-        pattern = pattern.replace("\\", "/")
-        if not pattern.startswith("/"):
-            pattern = "/" + pattern
-        parts = [p for p in pattern.split("/") if p]
+        parts, idx = _parse_glob(pattern)
+        if idx == len(parts):
+            # No wildcards: the pattern names at most one path.
+            if not parts:
+                return []
+            path = "/" + "/".join(parts)
+            with self._read_index:
+                found = self._resolve_path(path) is not None
+            return [path] if found else []
         results: list[str] = []
-        self._glob_match(self._root, "/", parts, 0, results)
-        return sorted(results)
+        # Leading literal directories are resolved as one path, through the
+        # path cache, rather than one component at a time.
+        start: Node | None = self._root
+        start_path = "/"
+        if idx:
+            start_path = "/" + "/".join(parts[:idx])
+            with self._read_index:
+                start = self._resolve_path(start_path)
+        if start is not None:
+            self._glob_match(start, start_path, parts, idx, results)
+        # A path can be reached through more than one "**" expansion.
+        return sorted(set(results))
 
     def _glob_match(
         self,
         node: Node,
         current_path: str,
-        parts: list[str],
+        parts: Sequence[str],
         idx: int,
         results: list[str],
     ) -> None:
-        if not isinstance(node, DirNode):
-            return
-        if idx >= len(parts):
-            return
-        part = parts[idx]
-        is_last = idx == len(parts) - 1
-
-        with self._global_lock:
-            snapshot = list(node.children.items())
-
-        if part == "**":
-            # --- Zero-depth match: skip ** and try next part at current node ---
-            if idx + 1 < len(parts):
-                self._glob_match(node, current_path, parts, idx + 1, results)
-            else:
-                # ** at end of pattern: collect everything recursively
-                self._collect_all_paths(node, current_path, results)
-
-            # --- One-or-more depth match: recurse into children ---
-            for name, child_id in snapshot:
-                child = self._nodes.get(child_id)
-                if child is None:
+        # Worklist over (directory, path, part index) states.  A "**" state
+        # forks into "skip it here" and "descend one level, still on **";
+        # each state is expanded once, so overlapping "**" branches cannot
+        # multiply the work.  Every pushed state still needs at least one
+        # more path component, so empty directories are never pushed.
+        # Liveness is checked once per pushed directory rather than once per
+        # child: a directory removed after it was pushed is skipped whole.
+        nodes = self._nodes
+        last = len(parts) - 1
+        # Matchers are looked up once per call, not once per directory state;
+        # None marks "**" and literal components, which never use one.
+        matchers = [
+            None if p == "**" or _GLOB_MAGIC.search(p) is None else _glob_matcher(p)
+            for p in parts
+        ]
+        seen: set[tuple[int, int]] = set()
+        stack: list[tuple[Node, str, int]] = [(node, current_path, idx)]
+        start = node
+        while stack:
+            node, current_path, idx = stack.pop()
+            if not isinstance(node, DirNode) or idx > last:
+                continue
+            if node is not start and node.node_id not in nodes:
+                continue
+            state = (node.node_id, idx)
+            if state in seen:
+                continue
+            seen.add(state)
+            part = parts[idx]
+            base = "/" if current_path == "/" else current_path + "/"
+
+            if part == "**":
+                if idx == last:
+                    # ** at end of pattern: everything below matches.
+                    self._collect_all_paths(node, current_path, results)
                     continue
-                child_path = current_path.rstrip("/") + "/" + name
-                if isinstance(child, DirNode):
-                    # Continue recursive ** expansion into subdirectories
-                    self._glob_match(child, child_path, parts, idx, results)
-                elif isinstance(child, FileNode):
-                    if idx + 1 < len(parts):
-                        # ** before more parts: match file against next part
-                        next_part = parts[idx + 1]
-                        if fnmatch.fnmatch(name, next_part) and idx + 1 == len(parts) - 1:
-                            results.append(child_path)
-                    else:
-                        # ** at end: file matches
-                        results.append(child_path)
-        else:
-            for name, child_id in snapshot:
-                if not fnmatch.fnmatch(name, part):
+                stack.append((node, current_path, idx + 1))
+                with self._read_index:
+                    snapshot = node.children.copy()
+                for name, child in snapshot.items():
+                    if isinstance(child, DirNode) and child.children:
+                        stack.append((child, base + name, idx))
+                continue
+
+            match = matchers[idx]
+            if match is None:
+                # Literal component: one dict probe instead of scanning children.
+                with self._read_index:
+                    found: Node | None = node.children.get(part)
+                if found is None:
                     continue
-                child = self._nodes.get(child_id)
-                if child is None:
+                if idx == last:
+                    results.append(base + part)
+                elif isinstance(found, DirNode) and found.children:
+                    stack.append((found, base + part, idx + 1))
+                continue
+
+            with self._read_index:
+                snapshot = node.children.copy()
+            for name, child in snapshot.items():
+                if not match(name):
                     continue
-                child_path = current_path.rstrip("/") + "/" + name
-                if is_last:
-                    results.append(child_path)
-                elif isinstance(child, DirNode):
-                    self._glob_match(child, child_path, parts, idx + 1, results)
+                if idx == last:
+                    results.append(base + name)
+                elif isinstance(child, DirNode) and child.children:
+                    stack.append((child, base + name, idx + 1))
 
     def _collect_all_paths(self, node: DirNode, current_path: str, results: list[str]) -> None:
-        with self._global_lock:
-            snapshot = list(node.children.items())
-        for name, child_id in snapshot:
-            child = self._nodes.get(child_id)
-            if child is None:
-                continue
-            child_path = current_path.rstrip("/") + "/" + name
-            results.append(child_path)
-            if isinstance(child, DirNode):
-                self._collect_all_paths(child, child_path, results)
+        for _, base, snapshot in self._iter_dir_snapshots(current_path, node):
+            results.extend([base + name for name in snapshot])
@@ -26,38 +26,40 @@ class MemoryFileHandle(io.RawIOBase):
         self._cursor: int = fnode.storage.get_size() if is_append else 0
         self._is_closed: bool = False
         self._is_append: bool = is_append
+        # The mode never changes, so readability is decided once; read(),
+        # write(), seek() and tell() test these flags inline.
+        self._readable: bool = mode not in ("wb", "ab", "xb")
+        self._writable: bool = mode != "rb"
+        mfs._note_handle_opened(fnode)
 
     def _assert_readable(self) -> None:
-        if self._mode in ("wb", "ab", "xb"):
+        if not self._readable:
             raise io.UnsupportedOperation(f"not readable in mode '{self._mode}'")
 
     def _assert_writable(self) -> None:
-        if self._mode == "rb":
+        if not self._writable:
             raise io.UnsupportedOperation(f"not writable in mode '{self._mode}'")
 
     def _assert_open(self) -> None:
-        if self.closed or self._is_closed:
+        if self._is_closed:
             raise ValueError("I/O operation on closed file.")
 
     def read(self, size: int = -1) -> bytes:
-        self._assert_open()
-        self._assert_readable()
-        storage = self._fnode.storage
-        current_size = storage.get_size()
-        if self._cursor >= current_size:
-            return b""
-        if size < 0:
-            data = storage.read_at(self._cursor, current_size - self._cursor)
-            self._cursor = current_size
-        else:
-            actual = min(size, current_size - self._cursor)
-            data = storage.read_at(self._cursor, actual)
-            self._cursor += actual
+        if self._is_closed:
+            raise ValueError("I/O operation on closed file.")
+        if not self._readable:
+            raise io.UnsupportedOperation(f"not readable in mode '{self._mode}'")
+        # read_at() already clamps to the current size (size < 0 reads to
+        # EOF), so the cursor simply advances by what came back.
+        data = self._fnode.storage.read_at(self._cursor, size)
+        self._cursor += len(data)
         return data
 
     def write(self, data: Any) -> int:
-        self._assert_open()
-        self._assert_writable()
+        if self._is_closed:
+            raise ValueError("I/O operation on closed file.")
+        if not self._writable:
+            raise io.UnsupportedOperation(f"not writable in mode '{self._mode}'")
         if not isinstance(data, (bytes, bytearray, memoryview)):
             raise TypeError("a bytes-like object is required")
         payload = bytes(data)
@@ -76,16 +78,20 @@ class MemoryFileHandle(io.RawIOBase):
         return n
 
     def readinto(self, buffer: Any) -> int:
-        self._assert_open()
-        self._assert_readable()
+        if self._is_closed:
+            raise ValueError("I/O operation on closed file.")
+        if not self._readable:
+            raise io.UnsupportedOperation(f"not readable in mode '{self._mode}'")
         view = memoryview(buffer).cast("B")
-        data = self.read(len(view))
-        n = len(data)
-        view[:n] = data
+        if not view:
+            return 0
+        n = self._fnode.storage.readinto_at(self._cursor, view)
+        self._cursor += n
         return n
 
     def seek(self, offset: int, whence: int = 0) -> int:
-        self._assert_open()
+        if self._is_closed:
+            raise ValueError("I/O operation on closed file.")
         if whence == 0:
             if offset < 0:
                 raise ValueError("seek offset must be >= 0 for SEEK_SET")
@@ -107,7 +113,8 @@ class MemoryFileHandle(io.RawIOBase):
         return self._cursor
 
     def tell(self) -> int:
-        self._assert_open()
+        if self._is_closed:
+            raise ValueError("I/O operation on closed file.")
         return self._cursor
 
     def truncate(self, size: int | None = None) -> int:
@@ -131,11 +138,11 @@ class MemoryFileHandle(io.RawIOBase):
 
     def readable(self) -> bool:
         self._assert_open()
-        return self._mode not in ("wb", "ab", "xb")
+        return self._readable
 
     def writable(self) -> bool:
         self._assert_open()
-        return self._mode != "rb"
+        return self._writable
 
     def seekable(self) -> bool:
         self._assert_open()
@@ -144,8 +151,9 @@ class MemoryFileHandle(io.RawIOBase):
     def close(self) -> None:
         if self.closed or self._is_closed:
             return
+        self._mfs._note_handle_closed(self._fnode)
         mode = self._mode
-        if mode in ("wb", "ab", "r+b", "xb"):
+        if mode in ("wb", "w+b", "ab", "r+b", "xb"):
             self._fnode._rw_lock.release_write()
         else:
             self._fnode._rw_lock.release_read()
@@ -158,15 +166,19 @@ class MemoryFileHandle(io.RawIOBase):
     def __exit__(self, *args: object) -> None:
         self.close()
 
+    # Kept as __del__ rather than weakref.finalize: io.IOBase's own finalizer
+    # closes the handle before weakref callbacks run, which would silently
+    # swallow the warning.  Properly closed handles return on the first test.
     def __del__(self) -> None:
-        if not getattr(self, "_is_closed", True) and not getattr(self, "closed", True):
-            warnings.warn(
-                "MFS MemoryFileHandle was not closed properly. "
-                "Always use 'with mfs.open(...) as f:' to ensure cleanup.",
-                ResourceWarning,
-                stacklevel=1,
-            )
-            try:
-                self.close()
-            except Exception:
-                pass
+        if getattr(self, "_is_closed", True) or self.closed:
+            return
+        warnings.warn(
+            "MFS MemoryFileHandle was not closed properly. "
+            "Always use 'with mfs.open(...) as f:' to ensure cleanup.",
+            ResourceWarning,
+            stacklevel=1,
+        )
+        try:
+            self.close()
+        except Exception:
+            pass
@@ -26,49 +26,122 @@ class ReadWriteLock:
     indefinitely.  Callers should use ``timeout`` to bound the wait.
     """
 
+    __slots__ = ("_mutex", "_condition", "_read_count", "_write_held", "_waiting")
+
     def __init__(self) -> None:
-        self._condition = threading.Condition(threading.Lock())
+        self._mutex = threading.Lock()
+        # Built on first contention: most per-file locks are never waited
+        # on, and a Condition costs several times more than the Lock.
+        self._condition: threading.Condition | None = None
         self._read_count: int = 0
         self._write_held: bool = False
+        # Threads blocked in wait(); releases skip notify_all() when zero,
+        # which keeps the uncontended acquire/release pair cheap.
+        self._waiting: int = 0
+
+    def _wait(self, deadline: float | None, kind: str) -> None:
+        remaining = _remaining(deadline)
+        if remaining == 0.0:
+            raise BlockingIOError(f"Could not acquire {kind} lock within timeout.")
+        condition = self._condition
+        if condition is None:
+            condition = self._condition = threading.Condition(self._mutex)
+        self._waiting += 1
+        try:
+            notified = condition.wait(timeout=remaining)
+        finally:
+            self._waiting -= 1
+        if not notified:
+            raise BlockingIOError(f"Could not acquire {kind} lock within timeout.")
 
     def acquire_read(self, timeout: float | None = None) -> None:
-        deadline = _calc_deadline(timeout)
-        with self._condition:
+        with self._mutex:
+            if not self._write_held:
+                self._read_count += 1
+                return
+            deadline = _calc_deadline(timeout)
             while self._write_held:
-                remaining = _remaining(deadline)
-                if remaining == 0.0:
-                    raise BlockingIOError("Could not acquire read lock within timeout.")
-                if not self._condition.wait(timeout=remaining):
-                    raise BlockingIOError("Could not acquire read lock within timeout.")
+                self._wait(deadline, "read")
             self._read_count += 1
 
     def release_read(self) -> None:
-        with self._condition:
+        with self._mutex:
             if self._read_count <= 0:
                 raise RuntimeError("release_read called without matching acquire_read")
             self._read_count -= 1
-            if self._read_count == 0:
-                self._condition.notify_all()
+            if self._read_count == 0 and self._waiting:
+                self._condition.notify_all()  # type: ignore[union-attr]
 
     def acquire_write(self, timeout: float | None = None) -> None:
-        deadline = _calc_deadline(timeout)
-        with self._condition:
-            while self._write_held or self._read_count > 0:
-                remaining = _remaining(deadline)
-                if remaining == 0.0:
-                    raise BlockingIOError("Could not acquire write lock within timeout.")
-                if not self._condition.wait(timeout=remaining):
-                    raise BlockingIOError("Could not acquire write lock within timeout.")
+        with self._mutex:
+            if self._write_held or self._read_count > 0:
+                deadline = _calc_deadline(timeout)
+                while self._write_held or self._read_count > 0:
+                    self._wait(deadline, "write")
             self._write_held = True
 
     def release_write(self) -> None:
-        with self._condition:
+        with self._mutex:
             if not self._write_held:
                 raise RuntimeError("release_write called without matching acquire_write")
             self._write_held = False
-            self._condition.notify_all()
+            if self._waiting:
+                self._condition.notify_all()  # type: ignore[union-attr]
 
     @property
     def is_locked(self) -> bool:
-        with self._condition:
+        with self._mutex:
             return self._write_held or self._read_count > 0
+
+
+# The guards inline the uncontended acquire/release instead of calling the
+# lock's methods, saving a Python call on each side of every index-lock
+# section; contended acquires still go through the waiting paths above.
+
+
+class ReadGuard:
+    """Reusable ``with`` guard that holds *lock* in read mode (no timeout)."""
+
+    __slots__ = ("_lock",)
+
+    def __init__(self, lock: ReadWriteLock) -> None:
+        self._lock = lock
+
+    def __enter__(self) -> None:
+        lock = self._lock
+        with lock._mutex:
+            if not lock._write_held:
+                lock._read_count += 1
+                return
+        lock.acquire_read()
+
+    def __exit__(self, *exc: object) -> None:
+        lock = self._lock
+        with lock._mutex:
+            lock._read_count -= 1
+            if lock._read_count == 0 and lock._waiting:
+                lock._condition.notify_all()  # type: ignore[union-attr]
+
+
+class WriteGuard:
+    """Reusable ``with`` guard that holds *lock* in write mode (no timeout)."""
+
+    __slots__ = ("_lock",)
+
+    def __init__(self, lock: ReadWriteLock) -> None:
+        self._lock = lock
+
+    def __enter__(self) -> None:
+        lock = self._lock
+        with lock._mutex:
+            if not lock._write_held and not lock._read_count:
+                lock._write_held = True
+                return
+        lock.acquire_write()
+
+    def __exit__(self, *exc: object) -> None:
+        lock = self._lock
+        with lock._mutex:
+            lock._write_held = False
+            if lock._waiting:
+                lock._condition.notify_all()  # type: ignore[union-attr]
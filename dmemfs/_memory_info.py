@@ -6,13 +6,13 @@ Uses only Python standard library.
 
 from __future__ import annotations
 
-import ctypes
-import ctypes.util
-import platform
+import sys
 from collections.abc import Callable
 from typing import cast
 
-_SYSTEM = platform.system()
+# ctypes (and ctypes.util, which pulls in subprocess) is imported lazily by
+# the Windows/macOS readers so that importing dmemfs stays cheap.
+_SYSTEM = {"win32": "Windows", "linux": "Linux", "darwin": "Darwin"}.get(sys.platform, "")
 _UNPROBED = object()
 _linux_reader: Callable[[], int | None] | None | object = _UNPROBED
 
@@ -32,6 +32,8 @@ def get_available_memory_bytes() -> int | None:
 
 
 def _windows_avail() -> int:
+    import ctypes
+
     class MEMORYSTATUSEX(ctypes.Structure):
         _fields_ = [
             ("dwLength", ctypes.c_ulong),
@@ -150,6 +152,9 @@ def _read_proc_meminfo() -> int:
 
 
 def _macos_avail() -> int:
+    import ctypes
+    import ctypes.util
+
     libc_path = ctypes.util.find_library("c") or "/usr/lib/libSystem.B.dylib"
     libc = ctypes.CDLL(libc_path)
 
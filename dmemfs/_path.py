@@ -1,25 +1,29 @@
-import posixpath
+import functools
 
 
+# Callers reopen the same handful of paths many times; a normalized path is
+# a pure function of its input, so repeat lookups skip the per-part scan.
+@functools.lru_cache(maxsize=4096)
 def normalize_path(path: str) -> str:
-    converted = path.replace("\\", "/")
-    if not converted:
-        return "/"
-
-    # Traversal check: simulate path resolution from root (depth 0)
-    # relative paths are treated as if prepended with "/"
-    parts = converted.split("/")
-    depth = 0
-    for part in parts:
+    # Already-normal absolute paths (the common case) need no parsing.  "/."
+    # also rejects harmless names like "/.git"; those take the full route.
+    if (
+        path[:1] == "/"
+        and path[-1:] != "/"
+        and "//" not in path
+        and "/." not in path
+        and "\\" not in path
+    ):
+        return path
+    # One pass over the components: "" and "." vanish, ".." pops, and popping
+    # past the root is a traversal attempt.  Relative paths are treated as if
+    # prepended with "/".
+    stack: list[str] = []
+    for part in path.replace("\\", "/").split("/"):
         if part == "..":
-            depth -= 1
-            if depth < 0:
+            if not stack:
                 raise ValueError(f"Path traversal attempt detected: '{path}'")
+            stack.pop()
         elif part and part != ".":
-            depth += 1
-
-    # Normalize: make absolute then normpath
-    if not converted.startswith("/"):
-        converted = "/" + converted
-    normalized = posixpath.normpath(converted)
-    return normalized
+            stack.append(part)
+    return "/" + "/".join(stack)
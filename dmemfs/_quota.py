@@ -1,32 +1,59 @@
+from __future__ import annotations
+
 import threading
-from collections.abc import Iterator
-from contextlib import contextmanager
+from types import TracebackType
 
 from ._exceptions import MFSQuotaExceededError
 
 
+class _Reservation:
+    """Context manager returned by :meth:`QuotaManager.reserve`.
+
+    A plain class rather than ``@contextmanager``: every write enters one,
+    and a generator-based context manager costs several times more.
+    """
+
+    __slots__ = ("_quota", "_size")
+
+    def __init__(self, quota: QuotaManager, size: int) -> None:
+        self._quota = quota
+        self._size = size
+
+    def __enter__(self) -> None:
+        size = self._size
+        if size <= 0:
+            return
+        quota = self._quota
+        with quota._lock:
+            available = quota._max_quota - quota._used
+            if size > available:
+                raise MFSQuotaExceededError(requested=size, available=available)
+            quota._used += size
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        # The block failed: hand the reservation back.
+        if exc_type is not None and self._size > 0:
+            quota = self._quota
+            with quota._lock:
+                quota._used -= self._size
+
+
 class QuotaManager:
+    __slots__ = ("_max_quota", "_used", "_lock")
+
     def __init__(self, max_quota: int) -> None:
         self._max_quota: int = max_quota
         self._used: int = 0
         self._lock: threading.Lock = threading.Lock()
 
-    @contextmanager
-    def reserve(self, size: int) -> Iterator[None]:
-        if size <= 0:
-            yield
-            return
-        with self._lock:
-            available = self._max_quota - self._used
-            if size > available:
-                raise MFSQuotaExceededError(requested=size, available=available)
-            self._used += size
-        try:
-            yield
-        except BaseException:
-            with self._lock:
-                self._used -= size
-            raise
+    def reserve(self, size: int) -> _Reservation:
+        """Reserve *size* bytes for the ``with`` block; returned if it raises."""
+        return _Reservation(self, size)
 
     def release(self, size: int) -> None:
         if size <= 0:
@@ -34,36 +61,21 @@ class QuotaManager:
         with self._lock:
             self._used = max(0, self._used - size)
 
-    def _force_reserve(self, size: int) -> None:
-        """Internal helper: add to used bytes without limit check.
-
-        This bypasses normal quota enforcement and must be used only when all
-        of the following conditions are true:
-
-        1) The caller holds the filesystem global lock.
-        2) Available quota has already been checked by the caller.
-        3) The call site is part of an atomic operation path (`import_tree` or
-           `copy_tree`) that performs its own rollback/invariant handling.
-        """
-        if size <= 0:
-            return
-        with self._lock:
-            self._used += size
+    # Readers take no lock: _used is only ever rebound to a new int under
+    # _lock, so one read of it is always a value some writer committed.
 
     def snapshot(self) -> tuple[int, int, int]:
-        """Return (maximum, used, free) atomically under a single lock."""
-        with self._lock:
-            return self._max_quota, self._used, self._max_quota - self._used
+        """Return a consistent (maximum, used, free) from a single read of used."""
+        used = self._used
+        return self._max_quota, used, self._max_quota - used
 
     @property
     def used(self) -> int:
-        with self._lock:
-            return self._used
+        return self._used
 
     @property
     def free(self) -> int:
-        with self._lock:
-            return self._max_quota - self._used
+        return self._max_quota - self._used
 
     @property
     def maximum(self) -> int:
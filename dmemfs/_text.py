@@ -14,6 +14,16 @@ if TYPE_CHECKING:
     from ._handle import MemoryFileHandle
 
 _READLINE_CHUNK = 4096
+_READLINE_FIRST_BLOCK = 256
+
+# Encodings in which the bytes 0x0A / 0x0D only ever encode "\n" / "\r"
+# (never part of a multibyte sequence), so lines can be split on raw bytes.
+_BYTE_NEWLINE_CODECS = frozenset(
+    {"utf-8", "ascii", "iso8859-1", "cp1252", "shift_jis", "cp932", "euc_jp"}
+)
+# Error handlers that keep undecodable bytes in place; "ignore" drops them, so
+# "\r<bad byte>\n" has to be matched on decoded characters as one "\r\n" line.
+_BYTE_NEWLINE_ERRORS = frozenset({"strict", "replace"})
 
 
 class MFSTextHandle:
@@ -35,6 +45,8 @@ class MFSTextHandle:
     ...     th.write("こんにちは世界\\n")
     """
 
+    __slots__ = ("_handle", "_encoding", "_errors", "_decoded_buffer", "_byte_newlines")
+
     def __init__(
         self,
         handle: MemoryFileHandle,
@@ -45,6 +57,10 @@ class MFSTextHandle:
         self._encoding = encoding
         self._errors = errors
         self._decoded_buffer = ""
+        self._byte_newlines = (
+            codecs.lookup(encoding).name in _BYTE_NEWLINE_CODECS
+            and errors in _BYTE_NEWLINE_ERRORS
+        )
 
     @property
     def encoding(self) -> str:
@@ -104,7 +120,9 @@ class MFSTextHandle:
 
         decoder = codecs.getincrementaldecoder(self._encoding)(errors=self._errors)
         while remaining > 0:
-            chunk = self._handle.read(1)
+            # Every character takes at least one byte, so reading as many
+            # bytes as characters are still missing never reads past them.
+            chunk = self._handle.read(remaining)
             if not chunk:
                 tail = decoder.decode(b"", final=True)
                 if tail:
@@ -122,6 +140,12 @@ class MFSTextHandle:
                 self._decoded_buffer = decoded[len(take) :] + self._decoded_buffer
                 break
 
+        # An error handler such as "backslashreplace" turns one byte into
+        # several characters, so the loop can stop while the start of the
+        # next character is still held by the decoder: give those bytes back.
+        pending = decoder.getstate()[0]
+        if pending:
+            self._handle.seek(-len(pending), 1)
         return "".join(parts)
 
     def readline(self, limit: int = -1) -> str:
@@ -134,6 +158,8 @@ class MFSTextHandle:
         limit:
             Maximum number of characters to read (``-1`` means unlimited).
         """
+        if limit < 0 and self._byte_newlines and not self._decoded_buffer:
+            return self._readline_bytes()
         chars: list[str] = []
         while True:
             if limit >= 0 and len(chars) >= limit:
@@ -153,6 +179,41 @@ class MFSTextHandle:
                 break
         return "".join(chars)
 
+    def _readline_bytes(self) -> str:
+        """Read one line in blocks, splitting on raw line-ending bytes.
+
+        Bytes read past the line ending are given back by seeking, so the
+        handle is left just after the line, as with the per-character path.
+        The first block is small, since most lines are short; a line that
+        ends inside it is decoded without being copied into a ``bytearray``.
+        """
+        handle = self._handle
+        buf: bytes | bytearray = handle.read(_READLINE_FIRST_BLOCK)
+        start = 0
+        while buf:
+            lf = buf.find(b"\n", start)
+            cr = buf.find(b"\r", start, lf if lf >= 0 else len(buf))
+            if lf >= 0 or cr >= 0:
+                end = cr + 1 if cr >= 0 else lf + 1
+                if cr >= 0 and end == len(buf):
+                    # "\r" ends the block: peek one byte for a following "\n".
+                    buf += handle.read(1)
+                if cr >= 0 and buf[end : end + 1] == b"\n":
+                    end += 1
+                excess = len(buf) - end
+                if excess:
+                    handle.seek(-excess, 1)
+                    buf = buf[:end]
+                break
+            chunk = handle.read(_READLINE_CHUNK)
+            if not chunk:
+                break
+            if start == 0:
+                buf = bytearray(buf)
+            start = len(buf)
+            buf += chunk
+        return buf.decode(self._encoding, self._errors)
+
     def __iter__(self) -> Iterator[str]:
         """Line iterator."""
         return self
@@ -265,3 +265,67 @@ async def test_async_export_as_bytesio(async_mfs):
 
     bio = await async_mfs.export_as_bytesio("/f.bin")
     assert bio.read() == b"export me"
+
+
+@pytest.mark.asyncio
+async def test_async_buffered_write_flushes_on_fill_and_close(async_mfs):
+    """buffer_size 指定時、小さな書き込みはバッファされ満杯・close 時に反映される。"""
+    async with await async_mfs.open("/f.bin", "wb", buffer_size=8) as f:
+        for part in (b"abc", b"def"):
+            assert await f.write(part) == 3
+        assert await async_mfs.get_size("/f.bin") == 0
+        await f.write(b"gh")
+        assert await async_mfs.get_size("/f.bin") == 8
+        await f.write(b"ij")
+    async with await async_mfs.open("/f.bin", "rb") as f:
+        assert await f.read() == b"abcdefghij"
+
+
+@pytest.mark.asyncio
+async def test_async_buffered_read_ahead_and_mixed_io(async_mfs):
+    """先読みバッファ使用中の tell / seek / write が論理位置を保つ。"""
+    async with await async_mfs.open("/f.bin", "wb") as f:
+        await f.write(b"0123456789")
+    async with await async_mfs.open("/f.bin", "r+b", buffer_size=64) as f:
+        assert await f.read(2) == b"01"
+        assert await f.read(3) == b"234"
+        assert await f.tell() == 5
+        assert await f.read(2) == b"56"
+        await f.write(b"XY")
+        assert await f.read(5) == b"9"
+        await f.seek(0)
+        assert await f.read(100) == b"0123456XY9"
+        assert await f.read(1) == b""
+
+
+@pytest.mark.asyncio
+async def test_async_buffered_write_errors_are_eager(async_mfs):
+    """バッファ付きでも読み取り専用ハンドルへの書き込みは即座に失敗する。"""
+    import io
+
+    async with await async_mfs.open("/f.bin", "wb") as f:
+        await f.write(b"x")
+    async with await async_mfs.open("/f.bin", "rb", buffer_size=16) as f:
+        with pytest.raises(io.UnsupportedOperation):
+            await f.write(b"y")
+    with pytest.raises(ValueError):
+        await async_mfs.open("/f.bin", "rb", buffer_size=-1)
+
+
+@pytest.mark.asyncio
+async def test_async_handle_queries_do_not_dispatch_to_thread(async_mfs, monkeypatch):
+    """readable / writable / seekable / バッファなしの tell はスレッドを経由しない。"""
+    async with await async_mfs.open("/f.bin", "wb") as f:
+        await f.write(b"abc")
+
+        async def fail(*args, **kwargs):
+            raise AssertionError("unexpected to_thread dispatch")
+
+        monkeypatch.setattr(asyncio, "to_thread", fail)
+        assert await f.tell() == 3
+        assert await f.writable() is True
+        assert await f.readable() is False
+        assert await f.seekable() is True
+        monkeypatch.undo()
+    with pytest.raises(ValueError):
+        await f.tell()
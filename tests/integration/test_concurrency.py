@@ -174,3 +174,113 @@ def test_default_lock_timeout_none_waits_for_lock():
     t_holder.join(timeout=3.0)
     t_waiter.join(timeout=3.0)
 
+
+
+# --- index lock tests ---
+
+
+def test_lookups_share_index_lock_while_structural_change_waits(mfs):
+    """インデックスの読み取りロック保持中も参照系 API は進み、構造変更だけが待機する。"""
+    mfs.mkdir("/d")
+    with mfs.open("/d/f.bin", "wb") as f:
+        f.write(b"data")
+
+    lookups_done = threading.Event()
+    mkdir_done = threading.Event()
+
+    def lookups():
+        assert mfs.exists("/d/f.bin")
+        assert mfs.listdir("/d") == ["f.bin"]
+        assert mfs.stat("/d/f.bin")["size"] == 4
+        with mfs.open("/d/f.bin", "rb") as f:
+            assert f.read() == b"data"
+        lookups_done.set()
+
+    def structural():
+        mfs.mkdir("/e")
+        mkdir_done.set()
+
+    mfs._index_lock.acquire_read()
+    try:
+        t_lookup = threading.Thread(target=lookups, daemon=True)
+        t_mkdir = threading.Thread(target=structural, daemon=True)
+        t_lookup.start()
+        t_mkdir.start()
+        assert lookups_done.wait(timeout=5.0)
+        assert not mkdir_done.wait(timeout=0.1)
+    finally:
+        mfs._index_lock.release_read()
+    assert mkdir_done.wait(timeout=5.0)
+    assert mfs.is_dir("/e")
+
+
+def test_opening_existing_file_for_write_needs_only_shared_index_lock(mfs):
+    """既存ファイルの wb/ab と exist_ok の mkdir は共有ロックで進み、新規作成だけが待機する。"""
+    mfs.mkdir("/d")
+    with mfs.open("/d/f.bin", "wb") as f:
+        f.write(b"old")
+
+    existing_done = threading.Event()
+    create_done = threading.Event()
+
+    def reopen_existing():
+        mfs.mkdir("/d", exist_ok=True)
+        with mfs.open("/d/f.bin", "wb") as f:
+            f.write(b"new")
+        with mfs.open("/d/f.bin", "ab") as f:
+            f.write(b"!")
+        existing_done.set()
+
+    def create_new():
+        with mfs.open("/d/g.bin", "wb") as f:
+            f.write(b"g")
+        create_done.set()
+
+    mfs._index_lock.acquire_read()
+    try:
+        t_existing = threading.Thread(target=reopen_existing, daemon=True)
+        t_create = threading.Thread(target=create_new, daemon=True)
+        t_existing.start()
+        t_create.start()
+        assert existing_done.wait(timeout=5.0)
+        assert not create_done.wait(timeout=0.1)
+    finally:
+        mfs._index_lock.release_read()
+    assert create_done.wait(timeout=5.0)
+    assert mfs.export_tree("/d") == {"/d/f.bin": b"new!", "/d/g.bin": b"g"}
+
+
+def test_concurrent_lookups_overflowing_path_cache(mfs, monkeypatch):
+    """パスキャッシュが上限を超えて退避し続けても、並行する読み取り系ルックアップは例外を出さない。"""
+    import sys
+
+    import dmemfs._fs as fs_mod
+
+    monkeypatch.setattr(fs_mod, "_PATH_CACHE_MAX", 16)
+    for i in range(400):
+        mfs.mkdir(f"/d{i}")
+    errors = []
+    start = threading.Barrier(8)
+
+    def lookup(tid):
+        start.wait()
+        try:
+            for _ in range(20):
+                for i in range(tid, 400 + tid):
+                    assert mfs.is_dir(f"/d{i % 400}")
+                    assert not mfs.exists(f"/d{i % 400}/missing")
+        except Exception as exc:  # pragma: no cover - failure path
+            errors.append(exc)
+
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        threads = [threading.Thread(target=lookup, args=(t,)) for t in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+    finally:
+        sys.setswitchinterval(interval)
+    assert errors == []
+    assert len(mfs._path_cache) <= 16
@@ -221,3 +221,48 @@ def test_import_tree_rollback_removes_auto_created_parent_dirs():
     assert not mfs.exists("/new")
     assert not mfs.exists("/new/deep")
     assert not mfs.exists("/new/deep/path")
+
+
+def test_import_tree_creates_each_parent_once(mfs):
+    """同じ親を持つ多数のエントリでも親ディレクトリの作成は 1 回ずつ。"""
+    from unittest.mock import patch
+
+    tree = {f"/a/b/c/f{i}.bin": b"x" for i in range(50)}
+    tree.update({f"/a/d/g{i}.bin": b"y" for i in range(50)})
+    with patch.object(mfs, "_makedirs", wraps=mfs._makedirs) as makedirs:
+        mfs.import_tree(tree)
+    assert sorted(call.args[0] for call in makedirs.call_args_list) == ["/a/b/c", "/a/d"]
+    assert mfs.export_tree("/a") == tree
+
+
+def test_import_tree_path_colliding_with_directory_rolls_back(mfs):
+    """ファイルパスが既存またはインポート中に作成されるディレクトリと衝突すると IsADirectoryError で全体が戻る。"""
+    mfs.mkdir("/dir")
+    with pytest.raises(IsADirectoryError):
+        mfs.import_tree({"/ok.bin": b"ok", "/dir": b"clash"})
+    assert mfs.is_dir("/dir")
+    assert not mfs.exists("/ok.bin")
+
+    with pytest.raises(IsADirectoryError):
+        mfs.import_tree({"/x": b"file", "/x/y.bin": b"child"})
+    assert not mfs.exists("/x")
+    assert mfs.stats()["used_bytes"] == 0
+
+
+def test_import_tree_keeps_entry_order_in_listdir(mfs):
+    """import_tree 後の listdir / walk はエントリの出現順（挿入順）を保つ。"""
+    mfs.import_tree({"/z/f": b"1", "/top.bin": b"2", "/a/f": b"3", "/m/q/f": b"4"})
+    assert mfs.listdir("/") == ["z", "top.bin", "a", "m"]
+    assert [d for d, _, _ in mfs.walk("/")] == ["/", "/z", "/a", "/m", "/m/q"]
+
+
+def test_import_tree_directory_collision_is_rejected_before_writing(mfs):
+    """ディレクトリとの衝突は書き込み前に検出され、ノードの作成もクォータ予約も行われない。"""
+    from unittest.mock import patch
+
+    with patch.object(mfs, "_ensure_dir", wraps=mfs._ensure_dir) as ensure_dir:
+        with pytest.raises(IsADirectoryError, match="/a/b"):
+            mfs.import_tree({"/a/b/c.bin": b"c", "/a/b": b"clash"})
+    ensure_dir.assert_not_called()
+    assert mfs.stats()["used_bytes"] == 0
+    assert mfs.listdir("/") == []
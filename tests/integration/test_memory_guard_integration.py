@@ -86,7 +86,7 @@ def test_sequential_write_memoryerror_message_is_contextualized():
             f.write(b"abc")
 
 
-def test_randomaccess_truncate_expand_memoryerror_message_is_contextualized():
+def test_randomaccess_hole_fill_memoryerror_message_is_contextualized():
     class FailingBytearray(bytearray):
         def extend(self, data):
             raise MemoryError
@@ -95,8 +95,11 @@ def test_randomaccess_truncate_expand_memoryerror_message_is_contextualized():
     with mfs.open("/f.bin", "wb") as f:
         storage = f._fnode.storage
         storage._buf = FailingBytearray(storage._buf)
-        with pytest.raises(MemoryError, match="extending file to 10 bytes"):
-            f.truncate(10)
+        f.truncate(10)
+        f.seek(12)
+        with pytest.raises(MemoryError, match="OS memory allocation failed while writing 3 bytes"):
+            f.write(b"abc")
+    assert mfs.stats()["used_bytes"] == 10
 
 
 def test_promotion_memoryerror_message_suggests_memory_guard():
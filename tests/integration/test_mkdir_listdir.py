@@ -82,6 +82,28 @@ def test_listdir_root(mfs):
     assert "b" in result
 
 
+def test_iter_listdir_matches_listdir_and_is_a_snapshot(mfs):
+    """iter_listdir は listdir と同じ順序で名前を返し、呼び出し後の変更に影響されない。"""
+    mfs.mkdir("/d/sub")
+    for name in ("b.bin", "a.bin"):
+        with mfs.open(f"/d/{name}", "wb"):
+            pass
+    it = mfs.iter_listdir("/d")
+    mfs.remove("/d/a.bin")
+    assert list(it) == ["sub", "b.bin", "a.bin"]
+    assert list(mfs.iter_listdir("/d")) == mfs.listdir("/d")
+
+
+def test_iter_listdir_raises_at_call_time(mfs):
+    """iter_listdir のエラーは反復開始時ではなく呼び出し時に送出される。"""
+    with mfs.open("/f.bin", "wb"):
+        pass
+    with pytest.raises(FileNotFoundError):
+        mfs.iter_listdir("/nope")
+    with pytest.raises(NotADirectoryError):
+        mfs.iter_listdir("/f.bin")
+
+
 def test_exists_file(mfs):
     with mfs.open("/f.bin", "wb") as f:
         f.write(b"data")
@@ -175,9 +197,37 @@ def test_glob_no_match_returns_empty(mfs):
     assert mfs.glob("/*.xyz") == []
 
 
+def test_glob_is_case_sensitive(mfs):
+    """glob はパス解決と同じく大文字小文字を区別する（全プラットフォーム共通）。"""
+    with mfs.open("/Data.BIN", "wb") as f:
+        f.write(b"x")
+    with mfs.open("/data.bin", "wb") as f:
+        f.write(b"y")
+    assert mfs.glob("/*.bin") == ["/data.bin"]
+    assert mfs.glob("/D*") == ["/Data.BIN"]
+
+
 # --- v10: glob(**) recursive matching ---
 
 
+def test_glob_literal_components_match_exactly(mfs):
+    """ワイルドカードを含まない要素は名前の完全一致で解決される（正規表現の特殊文字も含む）。"""
+    mfs.mkdir("/data/sub")
+    for name in ("a+b(1).txt", "ab(1).txt", "c.txt"):
+        with mfs.open(f"/data/sub/{name}", "wb"):
+            pass
+    assert mfs.glob("/data/sub/a+b(1).txt") == ["/data/sub/a+b(1).txt"]
+    assert mfs.glob("/data/*/c.txt") == ["/data/sub/c.txt"]
+    assert mfs.glob("/data/sub/C.txt") == []
+    assert mfs.glob("/data/sub") == ["/data/sub"]
+    assert mfs.glob("/data/sub/c.txt/x") == []
+    assert mfs.glob("\\data//sub\\c.txt") == ["/data/sub/c.txt"]
+    assert mfs.glob("/") == []
+    assert mfs.glob("/data/sub/c.txt/*") == []
+    assert mfs.glob("/nope/sub/*.txt") == []
+    assert mfs.glob("data/sub/a+*") == ["/data/sub/a+b(1).txt"]
+
+
 def test_glob_double_star_matches_recursive(mfs):
     """** パターンで再帰的にファイルをマッチする。"""
     mfs.mkdir("/a/b/c")
@@ -220,6 +270,29 @@ def test_glob_consecutive_double_star(mfs):
     assert "/a/d.txt" in result
 
 
+def test_glob_double_star_results_are_unique(mfs):
+    """** が複数の経路で同じパスに到達しても結果は重複しない。"""
+    mfs.mkdir("/x/x/x")
+    with mfs.open("/x/x/x/f.txt", "wb") as f:
+        f.write(b"f")
+    assert mfs.glob("/**") == ["/x", "/x/x", "/x/x/x", "/x/x/x/f.txt"]
+    assert mfs.glob("/**/*.txt") == ["/x/x/x/f.txt"]
+    assert mfs.glob("/**/x/**/x/**") == ["/x/x/x", "/x/x/x/f.txt"]
+    assert mfs.glob("/**/**/x/**/**/*.txt") == ["/x/x/x/f.txt"]
+
+
+def test_glob_skips_empty_directories_but_still_matches_them(mfs):
+    """空ディレクトリは末尾成分としてはマッチし、途中成分としては探索されない。"""
+    mfs.mkdir("/e/empty")
+    mfs.mkdir("/e/full")
+    with mfs.open("/e/full/f.txt", "wb") as f:
+        f.write(b"f")
+    assert mfs.glob("/e/*") == ["/e/empty", "/e/full"]
+    assert mfs.glob("/e/*/*") == ["/e/full/f.txt"]
+    assert mfs.glob("/e/**/*.txt") == ["/e/full/f.txt"]
+    assert mfs.glob("/e/empty/**") == []
+
+
 def test_glob_double_star_trailing_slash(mfs):
     """/**/ パターンは中間ディレクトリにマッチする。"""
     mfs.mkdir("/a/b")
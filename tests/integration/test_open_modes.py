@@ -77,6 +77,30 @@ def test_rplusb_nonexistent_raises():
         mfs.open("/nope.bin", "r+b")
 
 
+def test_wplusb_truncates_and_reads_back():
+    """w+b モードで既存ファイルが切り詰められ、同一ハンドルで読み戻せる。"""
+    mfs = MemoryFileSystem()
+    with mfs.open("/f.bin", "wb") as f:
+        f.write(b"original content")
+    with mfs.open("/f.bin", "w+b") as f:
+        assert f.read() == b""
+        f.write(b"new")
+        f.seek(0)
+        assert f.read() == b"new"
+    with mfs.open("/f.bin", "rb") as f:
+        assert f.read() == b"new"
+
+
+def test_wplusb_creates_and_releases_write_lock():
+    """w+b で新規作成したファイルは close 後に書き込みロックが解放される。"""
+    mfs = MemoryFileSystem()
+    with mfs.open("/f.bin", "w+b") as f:
+        assert f.readable() and f.writable()
+        f.write(b"data")
+    mfs.remove("/f.bin")
+    assert not mfs.exists("/f.bin")
+
+
 def test_xb_exclusive_create():
     """xb モードでの排他新規作成が FS に正しく反映される。"""
     mfs = MemoryFileSystem()
@@ -164,6 +188,15 @@ def test_preallocate_allocates_space(mfs):
     assert mfs.stats()["used_bytes"] >= 1000
 
 
+def test_preallocate_reads_zeros_and_accepts_writes(mfs):
+    """preallocate 領域はゼロとして読め、その後の書き込みで正しく上書きされる。"""
+    with mfs.open("/f.bin", "wb", preallocate=16) as f:
+        assert f.tell() == 0
+        f.write(b"abc")
+    with mfs.open("/f.bin", "rb") as f:
+        assert f.read() == b"abc" + bytes(13)
+
+
 def test_read_empty_file():
     mfs = MemoryFileSystem()
     with mfs.open("/f.bin", "wb") as f:
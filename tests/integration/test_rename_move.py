@@ -315,6 +315,7 @@ def test_copy_tree_rollback_no_orphan_nodes():
         f.write(b"bbb")
 
     node_count_before = len(mfs._nodes)
+    stats_before = mfs.stats()
 
     # Patch _alloc_file to fail on the second file copy
     original_alloc = MFS._alloc_file
@@ -333,9 +334,51 @@ def test_copy_tree_rollback_no_orphan_nodes():
 
     # No orphan nodes should remain
     assert len(mfs._nodes) == node_count_before
+    assert mfs.stats()["dir_count"] == stats_before["dir_count"]
+    assert mfs.stats()["file_count"] == stats_before["file_count"]
     assert not mfs.exists("/dst")
 
 
+def test_copy_tree_reserves_quota_before_copying(mfs):
+    """copy_tree はコピー開始前にクォータを確保し、途中の他の書き込みに奪われない。"""
+    from unittest.mock import patch
+
+    mfs.mkdir("/src")
+    with mfs.open("/src/f.bin", "wb") as f:
+        f.write(b"x" * 100)
+    used_before = mfs._quota.used
+    needed = used_before
+    seen: list[int] = []
+    original = mfs._deep_copy_subtree
+
+    def observing_copy(node, created_node_ids):
+        seen.append(mfs._quota.used)
+        return original(node, created_node_ids)
+
+    with patch.object(mfs, "_deep_copy_subtree", observing_copy):
+        mfs.copy_tree("/src", "/dst")
+    assert seen == [used_before + needed]
+    assert mfs._quota.used == used_before + needed
+
+
+def test_open_handle_counts_propagate_to_ancestors(mfs):
+    """オープン中のハンドルは祖先ディレクトリ全てに数えられ、close で 0 に戻る。"""
+    mfs.mkdir("/a/b/c")
+    f = mfs.open("/a/b/c/f.bin", "wb")
+    g = mfs.open("/a/g.bin", "wb")
+    a = mfs._resolve_path("/a")
+    c = mfs._resolve_path("/a/b/c")
+    assert (mfs._root.open_descendants, a.open_descendants, c.open_descendants) == (2, 2, 1)
+    with pytest.raises(BlockingIOError, match="/a/b/c/f.bin"):
+        mfs.rename("/a/b", "/moved")
+    f.close()
+    mfs.rename("/a/b", "/moved")
+    g.close()
+    assert mfs._root.open_descendants == 0
+    assert a.open_descendants == 0
+    mfs.rmtree("/a")
+
+
 def test_rename_dst_parent_missing_raises(mfs):
     """rename の dst の親ディレクトリが存在しない場合 FileNotFoundError。"""
     with mfs.open("/a.bin", "wb") as f:
@@ -351,3 +394,30 @@ def test_copy_tree_dst_parent_missing_raises(mfs):
         f.write(b"data")
     with pytest.raises(FileNotFoundError):
         mfs.copy_tree("/src", "/nonexistent_dir/dst")
+
+
+def test_parent_back_pointers_follow_structural_changes(mfs):
+    """rename / move / copy_tree / import_tree 後も各ノードの parent と name が配置と一致する。"""
+
+    def assert_linked(path):
+        node = mfs._resolve_path(path)
+        parent_path, name = path.rsplit("/", 1)
+        assert node.name == name
+        assert node.parent is mfs._resolve_path(parent_path or "/")
+        assert node.parent.children[name] is node
+
+    mfs.mkdir("/a/sub")
+    with mfs.open("/a/sub/f.bin", "wb") as f:
+        f.write(b"data")
+    mfs.rename("/a/sub", "/a/renamed")
+    assert_linked("/a/renamed")
+    mfs.move("/a/renamed/f.bin", "/b/c/moved.bin")
+    assert_linked("/b/c/moved.bin")
+    mfs.copy_tree("/b", "/b2")
+    assert_linked("/b2")
+    assert_linked("/b2/c/moved.bin")
+    mfs.import_tree({"/b/c/moved.bin": b"new", "/d/e.bin": b"e"})
+    assert_linked("/b/c/moved.bin")
+    assert_linked("/d/e.bin")
+    mfs.remove("/b/c/moved.bin")
+    assert mfs.listdir("/b/c") == []
@@ -85,3 +85,22 @@ def test_stats_snapshot_consistency(mfs):
 def test_stats_overhead_per_chunk_estimate(mfs):
     s = mfs.stats()
     assert s["overhead_per_chunk_estimate"] > 0
+
+
+def test_stats_counts_match_tree_after_rollbacks(mfs):
+    """ロールバックや rmtree を経ても file_count / dir_count が実際のツリーと一致する。"""
+    mfs.mkdir("/src/sub")
+    with mfs.open("/src/sub/a.bin", "wb") as f:
+        f.write(b"a")
+    mfs.copy_tree("/src", "/copy")
+    with pytest.raises(ValueError):
+        mfs.import_tree({"/new/deep/f.bin": b"x", "../bad": b"y"})
+    mfs.rmtree("/copy")
+
+    dirs = files = 0
+    for _dirpath, dirnames, filenames in mfs.walk("/"):
+        dirs += len(dirnames)
+        files += len(filenames)
+    s = mfs.stats()
+    assert s["dir_count"] == dirs + 1  # root
+    assert s["file_count"] == files
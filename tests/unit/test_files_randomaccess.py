@@ -30,6 +30,17 @@ def test_overwrite_inplace():
     assert qm.used == initial_used  # pure overwrite, no new quota consumed
 
 
+def test_write_overlapping_tail_extends():
+    """末尾をまたぐ書き込みは重複部を上書きし、伸長分だけクォータを消費する。"""
+    f = RandomAccessMemoryFile()
+    qm = make_qm()
+    f.write_at(0, b"hello", qm)
+    initial_used = qm.used
+    f.write_at(3, b"LOWORLD", qm)
+    assert f.read_at(0, -1) == b"helLOWORLD"
+    assert qm.used == initial_used + 5
+
+
 def test_write_gap_fills_zeros():
     f = RandomAccessMemoryFile()
     qm = make_qm()
@@ -171,4 +182,73 @@ def test_truncate_extend_exceeds_quota():
     f.write_at(0, b"hello", qm)
     with pytest.raises(MFSQuotaExceededError):
         f.truncate(10, qm)
-    assert f.get_size() == 5
\ No newline at end of file
+    assert f.get_size() == 5
+
+def test_truncate_extend_is_lazy():
+    """truncate による拡張は物理バッファを伸ばさず、読み込み時にゼロを返す。"""
+    f = RandomAccessMemoryFile()
+    qm = make_qm()
+    f.write_at(0, b"hello", qm)
+    f.truncate(1024 * 1024, qm)
+    assert len(f._buf) == 5
+    assert f.get_size() == 1024 * 1024
+    assert f.get_quota_usage() == 1024 * 1024
+    assert f.read_at(3, 4) == b"lo\x00\x00"
+    assert f.read_at(100, 3) == b"\x00\x00\x00"
+
+
+def test_write_into_lazy_region_materializes_hole():
+    """遅延ゼロ領域への書き込みは穴だけを実体化し、追加クォータを消費しない。"""
+    f = RandomAccessMemoryFile()
+    qm = make_qm()
+    f.write_at(0, b"ab", qm)
+    f.truncate(10, qm)
+    used = qm.used
+    f.write_at(5, b"XY", qm)
+    assert qm.used == used
+    assert f.get_size() == 10
+    assert f.read_at(0, -1) == b"ab\x00\x00\x00XY\x00\x00\x00"
+    f.write_at(9, b"123", qm)
+    assert qm.used == used + 2
+    assert f.read_at(0, -1) == b"ab\x00\x00\x00XY\x00\x00123"
+
+
+def test_truncate_shrink_within_lazy_region():
+    """遅延ゼロ領域内への縮小はクォータを解放しサイズだけを更新する。"""
+    f = RandomAccessMemoryFile()
+    qm = make_qm()
+    f.write_at(0, b"hello", qm)
+    f.truncate(20, qm)
+    f.truncate(8, qm)
+    assert qm.used == 8
+    assert f.read_at(0, -1) == b"hello\x00\x00\x00"
+
+
+def test_readinto_at_fills_lazy_tail_with_zeros():
+    """readinto_at は物理バッファ外の遅延領域をゼロで埋める。"""
+    f = RandomAccessMemoryFile()
+    qm = make_qm()
+    f.write_at(0, b"hello", qm)
+    f.truncate(8, qm)
+    buf = bytearray(b"*" * 10)
+    assert f.readinto_at(3, memoryview(buf)) == 5
+    assert buf == b"lo\x00\x00\x00*****"
+    assert f.readinto_at(6, memoryview(buf)[:1]) == 1
+    assert buf[:1] == b"\x00"
+    assert f.readinto_at(8, memoryview(buf)) == 0
+
+
+def test_large_read_is_detached_bytes():
+    """閾値以上の読み出しも独立した bytes を返し、その後の書き込み・縮小を妨げない。"""
+    from dmemfs._file import _VIEW_READ_MIN
+
+    qm = make_qm()
+    data = bytes(range(256)) * (_VIEW_READ_MIN // 128)
+    f = RandomAccessMemoryFile()
+    f.write_at(0, data, qm)
+    got = f.read_at(1, len(data))
+    assert type(got) is bytes
+    assert got == data[1:]
+    f.write_at(1, b"\xff", qm)
+    f.truncate(0, qm)
+    assert got == data[1:]
@@ -1,143 +1,234 @@
-﻿import pytest
-from dmemfs._file import (
-    SequentialMemoryFile,
-    RandomAccessMemoryFile,
-    CHUNK_OVERHEAD_ESTIMATE,
-)
-from dmemfs._quota import QuotaManager
-from dmemfs._exceptions import MFSQuotaExceededError
-
-
-def make_qm(size=10 * 1024 * 1024):
-    return QuotaManager(size)
-
-
-def test_initial_state():
-    f = SequentialMemoryFile(chunk_overhead=0)
-    assert f.get_size() == 0
-
-
-def test_sequential_write_and_read():
-    f = SequentialMemoryFile(chunk_overhead=0)
-    qm = make_qm()
-    f.write_at(0, b"hello", qm)
-    f.write_at(5, b" world", qm)
-    assert f.get_size() == 11
-    assert f.read_at(0, 11) == b"hello world"
-
-
-def test_write_advances_size():
-    f = SequentialMemoryFile(chunk_overhead=0)
-    qm = make_qm()
-    f.write_at(0, b"abc", qm)
-    assert f.get_size() == 3
-
-
-def test_read_partial():
-    f = SequentialMemoryFile(chunk_overhead=0)
-    qm = make_qm()
-    f.write_at(0, b"hello world", qm)
-    assert f.read_at(6, 5) == b"world"
-
-
-def test_read_beyond_size_returns_empty():
-    f = SequentialMemoryFile(chunk_overhead=0)
-    qm = make_qm()
-    f.write_at(0, b"abc", qm)
-    assert f.read_at(10, 5) == b""
-
-
-def test_write_quota_consumed():
-    f = SequentialMemoryFile(chunk_overhead=0)
-    qm = QuotaManager(5)
-    f.write_at(0, b"hello", qm)
-    assert qm.used == 5
-
-
-def test_write_exceeds_quota():
-    f = SequentialMemoryFile(chunk_overhead=0)
-    qm = QuotaManager(4)
-    with pytest.raises(MFSQuotaExceededError):
-        f.write_at(0, b"hello", qm)
-    assert f.get_size() == 0
-
-
-def test_truncate_reduces_size():
-    f = SequentialMemoryFile(chunk_overhead=0)
-    qm = make_qm()
-    f.write_at(0, b"hello world", qm)
-    f.truncate(5, qm)
-    assert f.get_size() == 5
-    assert f.read_at(0, 5) == b"hello"
-
-
-def test_truncate_releases_quota():
-    f = SequentialMemoryFile(chunk_overhead=0)
-    qm = QuotaManager(100)
-    f.write_at(0, b"hello world", qm)
-    used_after_write = qm.used
-    f.truncate(5, qm)
-    assert qm.used < used_after_write
-
-
-def test_non_sequential_write_triggers_promotion():
-    """Non-tail write returns (written, promoted_file, old_data_size) tuple."""
-    f = SequentialMemoryFile(chunk_overhead=0)
-    qm = make_qm()
-    f.write_at(0, b"hello", qm)
-    written, promoted, old_data_size = f.write_at(0, b"X", qm)  # offset != size
-    assert isinstance(promoted, RandomAccessMemoryFile)
-    assert written == 1
-    assert old_data_size == 5  # old sequential data size
-
-
-def test_chunk_overhead_accounted():
-    overhead = 100
-    f = SequentialMemoryFile(chunk_overhead=overhead)
-    qm = QuotaManager(200)
-    f.write_at(0, b"abc", qm)  # 3 data + 100 overhead = 103
-    assert qm.used == 103
-
-
-def test_truncate_extends_with_zeros():
-    """truncate(size > current) はゼロバイトで拡張する（POSIX互換）。"""
-    f = SequentialMemoryFile(chunk_overhead=0)
-    qm = make_qm()
-    f.write_at(0, b"hello", qm)
-    f.truncate(10, qm)
-    assert f.get_size() == 10
-    assert f.read_at(0, 10) == b"hello\x00\x00\x00\x00\x00"
-
-
-def test_truncate_extend_consumes_quota():
-    """truncate による拡張はクォータを消費する。"""
-    f = SequentialMemoryFile(chunk_overhead=0)
-    qm = QuotaManager(100)
-    f.write_at(0, b"hello", qm)
-    assert qm.used == 5
-    f.truncate(10, qm)
-    assert qm.used == 10
-
-
-def test_truncate_extend_exceeds_quota():
-    """truncate による拡張がクォータを超えると例外。"""
-    f = SequentialMemoryFile(chunk_overhead=0)
-    qm = QuotaManager(7)
-    f.write_at(0, b"hello", qm)
-    with pytest.raises(MFSQuotaExceededError):
-        f.truncate(10, qm)
-    # サイズは変化しない
-    assert f.get_size() == 5
-
-
-def test_promotion_hard_limit_raises():
-    """512MB を超えたシーケンシャルファイルへの非末尾書き込みは UnsupportedOperation。"""
-    import io
-
-    f = SequentialMemoryFile(chunk_overhead=0)
-    qm = make_qm(size=2 * 1024 * 1024 * 1024)  # 2GB クォータ
-    # 内部サイズを DEFAULT_PROMOTION_HARD_LIMIT 超えに偽装（実メモリは確保しない）
-    f._size = SequentialMemoryFile.DEFAULT_PROMOTION_HARD_LIMIT + 1
-    # offset != _size → _promote_and_write → ハードリミット判定
-    with pytest.raises(io.UnsupportedOperation):
-        f.write_at(0, b"x", qm)
+﻿import pytest
+from dmemfs._file import (
+    SequentialMemoryFile,
+    RandomAccessMemoryFile,
+    CHUNK_OVERHEAD_ESTIMATE,
+)
+from dmemfs._quota import QuotaManager
+from dmemfs._exceptions import MFSQuotaExceededError
+
+
+def make_qm(size=10 * 1024 * 1024):
+    return QuotaManager(size)
+
+
+def test_initial_state():
+    f = SequentialMemoryFile(chunk_overhead=0)
+    assert f.get_size() == 0
+
+
+def test_sequential_write_and_read():
+    f = SequentialMemoryFile(chunk_overhead=0)
+    qm = make_qm()
+    f.write_at(0, b"hello", qm)
+    f.write_at(5, b" world", qm)
+    assert f.get_size() == 11
+    assert f.read_at(0, 11) == b"hello world"
+
+
+def test_write_advances_size():
+    f = SequentialMemoryFile(chunk_overhead=0)
+    qm = make_qm()
+    f.write_at(0, b"abc", qm)
+    assert f.get_size() == 3
+
+
+def test_read_partial():
+    f = SequentialMemoryFile(chunk_overhead=0)
+    qm = make_qm()
+    f.write_at(0, b"hello world", qm)
+    assert f.read_at(6, 5) == b"world"
+
+
+def test_read_spanning_chunks():
+    """チャンク境界をまたぐ読み込みと単一チャンク内の読み込みが正しい範囲を返す。"""
+    f = SequentialMemoryFile(chunk_overhead=0)
+    qm = make_qm()
+    for part in (b"abc", b"defg", b"hi", b"jklmn"):
+        f.write_at(f.get_size(), part, qm)
+    data = b"abcdefghijklmn"
+    for offset in range(len(data)):
+        for size in (1, 2, 3, 5, 9, len(data), -1):
+            expected = data[offset:] if size < 0 else data[offset:offset + size]
+            got = f.read_at(offset, size)
+            assert type(got) is bytes
+            assert got == expected
+
+
+def test_read_uniform_chunks_and_after_uniformity_breaks():
+    """均一長チャンク（末尾は短くてよい）と均一性が崩れた後の読み込みが一致する。"""
+    f = SequentialMemoryFile(chunk_overhead=0)
+    qm = make_qm()
+    expected = b""
+    for part in (b"aaaa", b"bbbb", b"cccc", b"dd"):
+        f.write_at(f.get_size(), part, qm)
+        expected += part
+    assert f._uniform == 4
+    for part in (b"eeee", b"f"):
+        f.write_at(f.get_size(), part, qm)
+        expected += part
+    assert f._uniform == 0
+    for offset in range(len(expected)):
+        for size in (1, 3, 4, 7, -1):
+            want = expected[offset:] if size < 0 else expected[offset:offset + size]
+            assert f.read_at(offset, size) == want
+
+
+def test_read_beyond_size_returns_empty():
+    f = SequentialMemoryFile(chunk_overhead=0)
+    qm = make_qm()
+    f.write_at(0, b"abc", qm)
+    assert f.read_at(10, 5) == b""
+
+
+def test_write_quota_consumed():
+    f = SequentialMemoryFile(chunk_overhead=0)
+    qm = QuotaManager(5)
+    f.write_at(0, b"hello", qm)
+    assert qm.used == 5
+
+
+def test_write_exceeds_quota():
+    f = SequentialMemoryFile(chunk_overhead=0)
+    qm = QuotaManager(4)
+    with pytest.raises(MFSQuotaExceededError):
+        f.write_at(0, b"hello", qm)
+    assert f.get_size() == 0
+
+
+def test_truncate_reduces_size():
+    f = SequentialMemoryFile(chunk_overhead=0)
+    qm = make_qm()
+    f.write_at(0, b"hello world", qm)
+    f.truncate(5, qm)
+    assert f.get_size() == 5
+    assert f.read_at(0, 5) == b"hello"
+
+
+def test_truncate_releases_quota():
+    f = SequentialMemoryFile(chunk_overhead=0)
+    qm = QuotaManager(100)
+    f.write_at(0, b"hello world", qm)
+    used_after_write = qm.used
+    f.truncate(5, qm)
+    assert qm.used < used_after_write
+
+
+def test_non_sequential_write_triggers_promotion():
+    """Non-tail write returns (written, promoted_file, old_data_size) tuple."""
+    f = SequentialMemoryFile(chunk_overhead=0)
+    qm = make_qm()
+    f.write_at(0, b"hello", qm)
+    written, promoted, old_data_size = f.write_at(0, b"X", qm)  # offset != size
+    assert isinstance(promoted, RandomAccessMemoryFile)
+    assert written == 1
+    assert old_data_size == 5  # old sequential data size
+
+
+def test_chunk_overhead_accounted():
+    overhead = 100
+    f = SequentialMemoryFile(chunk_overhead=overhead)
+    qm = QuotaManager(200)
+    f.write_at(0, b"abc", qm)  # 3 data + 100 overhead = 103
+    assert qm.used == 103
+
+
+
+def test_truncate_extends_with_zeros():
+    """truncate(size > current) はゼロバイトで拡張する（POSIX互換）。"""
+    f = SequentialMemoryFile(chunk_overhead=0)
+    qm = make_qm()
+    f.write_at(0, b"hello", qm)
+    f.truncate(10, qm)
+    assert f.get_size() == 10
+    assert f.read_at(0, 10) == b"hello\x00\x00\x00\x00\x00"
+
+
+def test_truncate_extend_consumes_quota():
+    """truncate による拡張はクォータを消費する。"""
+    f = SequentialMemoryFile(chunk_overhead=0)
+    qm = QuotaManager(100)
+    f.write_at(0, b"hello", qm)
+    assert qm.used == 5
+    f.truncate(10, qm)
+    assert qm.used == 10
+
+
+def test_truncate_extend_exceeds_quota():
+    """truncate による拡張がクォータを超えると例外。"""
+    f = SequentialMemoryFile(chunk_overhead=0)
+    qm = QuotaManager(7)
+    f.write_at(0, b"hello", qm)
+    with pytest.raises(MFSQuotaExceededError):
+        f.truncate(10, qm)
+    # サイズは変化しない
+    assert f.get_size() == 5
+
+
+def test_promotion_hard_limit_raises():
+    """512MB を超えたシーケンシャルファイルへの非末尾書き込みは UnsupportedOperation。"""
+    import io
+
+    f = SequentialMemoryFile(chunk_overhead=0)
+    qm = make_qm(size=2 * 1024 * 1024 * 1024)  # 2GB クォータ
+    # 内部サイズを DEFAULT_PROMOTION_HARD_LIMIT 超えに偽装（実メモリは確保しない）
+    f._size = SequentialMemoryFile.DEFAULT_PROMOTION_HARD_LIMIT + 1
+    # offset != _size → _promote_and_write → ハードリミット判定
+    with pytest.raises(io.UnsupportedOperation):
+        f.write_at(0, b"x", qm)
+
+
+def test_truncate_extend_is_lazy_zero_run():
+    """truncate による拡張はゼロ列を遅延表現し、その後の追記と跨いで読める。"""
+    f = SequentialMemoryFile(chunk_overhead=0)
+    qm = make_qm()
+    f.write_at(0, b"abc", qm)
+    f.truncate(1024 * 1024, qm)
+    assert f._chunks[-1] is None
+    assert qm.used == 1024 * 1024
+    f.write_at(f.get_size(), b"xyz", qm)
+    assert f.read_at(1024 * 1024 - 2, 5) == b"\x00\x00xyz"
+    assert f.read_at(1, 4) == b"bc\x00\x00"
+    assert f.read_at(10, 3) == b"\x00\x00\x00"
+    f.truncate(5, qm)
+    assert f.read_at(0, -1) == b"abc\x00\x00"
+
+
+def test_promotion_keeps_trailing_zero_run_lazy():
+    """末尾ゼロ列を持つファイルの昇格後も物理バッファはデータ部分のみ。"""
+    f = SequentialMemoryFile(chunk_overhead=0)
+    qm = make_qm()
+    f.write_at(0, b"hello", qm)
+    f.truncate(100, qm)
+    _, promoted, _ = f.write_at(1, b"E", qm)
+    assert isinstance(promoted, RandomAccessMemoryFile)
+    assert len(promoted._buf) == 5
+    assert promoted.get_size() == 100
+    assert promoted.read_at(0, 7) == b"hEllo\x00\x00"
+
+
+def test_promotion_copies_chunks_around_interior_zero_run():
+    """途中にゼロ列を含むファイルの昇格で、各チャンクが正しい位置へ複製される。"""
+    f = SequentialMemoryFile(chunk_overhead=0)
+    qm = make_qm()
+    f.write_at(0, b"ab", qm)
+    f.truncate(5, qm)
+    f.write_at(5, b"cd", qm)
+    f.write_at(7, b"ef", qm)
+    _, promoted, _ = f.write_at(1, b"B", qm)
+    assert promoted.read_at(0, -1) == b"aB\x00\x00\x00cdef"
+    assert f.read_at(0, -1) == b"ab\x00\x00\x00cdef"
+
+
+def test_readinto_at_spans_chunks_and_zero_run():
+    """readinto_at はチャンク境界とゼロ列をまたいで read_at と同じ内容を書き込む。"""
+    f = SequentialMemoryFile(chunk_overhead=0)
+    qm = make_qm()
+    f.write_at(0, b"abc", qm)
+    f.write_at(3, b"defgh", qm)
+    f.truncate(10, qm)
+    buf = bytearray(b"*" * 12)
+    assert f.readinto_at(1, memoryview(buf)) == 9
+    assert bytes(buf[:9]) == f.read_at(1, 9) == b"bcdefgh\x00\x00"
+    assert buf[9:] == b"***"
+    assert f.readinto_at(10, memoryview(buf)) == 0
@@ -73,56 +73,53 @@ def test_deep_copy_subtree_unknown_type_raises():
 
 
 # ---------------------------------------------------------------------------
-# _walk_dir: deleted child node skipped (L685)
-# _glob_match / _collect_all_paths: deleted child node skipped (L703, L739, L762, L777)
+# _walk_dir / _glob_match / _collect_all_paths: a directory deleted after it
+# was reached from its parent's snapshot is not descended into
 # ---------------------------------------------------------------------------
 
 
 def test_walk_skips_deleted_child(mfs):
-    """_walk_dir skips a child whose node_id has been removed from _nodes."""
-    mfs.mkdir("/dir")
-    with mfs.open("/dir/f.bin", "wb") as h:
+    """_walk_dir skips a subdirectory whose node_id has been removed from _nodes."""
+    mfs.mkdir("/dir/sub")
+    with mfs.open("/dir/sub/f.bin", "wb") as h:
         h.write(b"data")
 
-    # Manually delete the file node from _nodes to simulate a deleted entry
+    # Manually delete the directory node from _nodes to simulate a deleted entry
     dir_node = mfs._resolve_path("/dir")
-    child_id = dir_node.children["f.bin"]
-    del mfs._nodes[child_id]
+    del mfs._nodes[dir_node.children["sub"].node_id]
 
     result = list(mfs.walk("/dir"))
-    # walk should complete without error; file is simply absent
-    assert result[0][0] == "/dir"
-    assert "f.bin" not in result[0][2]
+    # walk should complete without error; the subdirectory is not descended into
+    assert result == [("/dir", ["sub"], [])]
 
 
 def test_glob_skips_deleted_child(mfs):
-    """_glob_match skips a child whose node_id has been removed from _nodes."""
-    with mfs.open("/f.bin", "wb") as h:
+    """_glob_match skips a directory whose node_id has been removed from _nodes."""
+    mfs.mkdir("/d")
+    with mfs.open("/d/f.bin", "wb") as h:
         h.write(b"data")
 
-    # Manually delete the file node from _nodes
-    root = mfs._root
-    child_id = root.children["f.bin"]
-    del mfs._nodes[child_id]
+    # Manually delete the directory node from _nodes
+    del mfs._nodes[mfs._root.children["d"].node_id]
 
-    result = mfs.glob("/*.bin")
-    assert "/f.bin" not in result
+    assert mfs.glob("/*/*.bin") == []
+    assert mfs.glob("/**/*.bin") == []
 
 
 def test_collect_all_paths_skips_deleted_child(mfs):
-    """_collect_all_paths skips a child whose node_id has been removed from _nodes."""
-    mfs.mkdir("/dir")
-    with mfs.open("/dir/f.bin", "wb") as h:
+    """_collect_all_paths skips a directory whose node_id has been removed from _nodes."""
+    mfs.mkdir("/dir/sub")
+    with mfs.open("/dir/sub/f.bin", "wb") as h:
         h.write(b"data")
 
-    # Manually delete the file node so _collect_all_paths encounters a missing entry
+    # Manually delete the directory node so _collect_all_paths reaches a dead entry
     dir_node = mfs._resolve_path("/dir")
-    child_id = dir_node.children["f.bin"]
-    del mfs._nodes[child_id]
+    del mfs._nodes[dir_node.children["sub"].node_id]
 
     # glob with ** triggers _collect_all_paths
     result = mfs.glob("/**")
-    assert "/dir/f.bin" not in result
+    assert "/dir/sub" in result
+    assert "/dir/sub/f.bin" not in result
 
 
 # ---------------------------------------------------------------------------
@@ -276,3 +273,106 @@ def test_import_tree_rollback_removes_new_file():
     # Both files should be absent after rollback
     assert not mfs.exists("/a.bin")
     assert not mfs.exists("/b.bin")
+
+
+# ---------------------------------------------------------------------------
+# _path_cache: resolved paths must not survive unlink / replace
+# ---------------------------------------------------------------------------
+
+
+def test_path_cache_invalidated_by_structural_changes(mfs):
+    """Cached lookups are dropped on rename / move / remove / rmtree / import_tree."""
+    mfs.mkdir("/a/b")
+    with mfs.open("/a/b/f.bin", "wb") as h:
+        h.write(b"one")
+    assert mfs.exists("/a/b/f.bin")
+    assert "/a/b/f.bin" in mfs._path_cache
+
+    mfs.rename("/a/b", "/a/c")
+    assert not mfs.exists("/a/b/f.bin")
+    assert mfs.exists("/a/c/f.bin")
+
+    mfs.move("/a/c/f.bin", "/x/f.bin")
+    assert not mfs.exists("/a/c/f.bin")
+
+    old = mfs._resolve_path("/x/f.bin")
+    mfs.import_tree({"/x/f.bin": b"two"})
+    assert mfs._resolve_path("/x/f.bin") is not old
+    with mfs.open("/x/f.bin", "rb") as h:
+        assert h.read() == b"two"
+
+    mfs.remove("/x/f.bin")
+    assert not mfs.exists("/x/f.bin")
+
+    assert mfs.is_dir("/a/c")
+    mfs.rmtree("/a")
+    assert not mfs.is_dir("/a/c")
+
+
+def test_path_cache_is_bounded(mfs, monkeypatch):
+    """Once _PATH_CACHE_MAX entries are cached, the oldest ones are evicted."""
+    import dmemfs._fs as fs_mod
+
+    monkeypatch.setattr(fs_mod, "_PATH_CACHE_MAX", 4)
+    for i in range(10):
+        mfs.mkdir(f"/d{i}")
+        assert mfs.is_dir(f"/d{i}")
+    assert len(mfs._path_cache) <= 4
+    assert list(mfs._path_cache) == ["/d6", "/d7", "/d8", "/d9"]
+
+
+def test_path_cache_miss_resolves_from_cached_parent(mfs):
+    """末尾要素だけが存在しない場合は親をキャッシュし、以後の判定は親から 1 段で行う。"""
+    mfs.mkdir("/a/b/c")
+    with mfs.open("/a/b/c/f.bin", "wb"):
+        pass
+    mfs._invalidate_path_cache()
+    assert not mfs.exists("/a/b/c/nope.bin")
+    assert list(mfs._path_cache) == ["/a/b/c"]
+    assert not mfs.exists("/a/b/c/nope.bin")
+    assert mfs.exists("/a/b/c/f.bin")
+    # A cached file as parent, and a miss higher up, both still resolve to None.
+    assert not mfs.exists("/a/b/c/f.bin/x")
+    assert not mfs.exists("/a/zz/c/f.bin")
+    assert "/a/zz/c" not in mfs._path_cache
+
+
+def test_child_names_are_interned(mfs):
+    """Names repeated across directories share one interned key object."""
+    for d in ("/p", "/q"):
+        mfs.mkdir(d + "/sub")
+        with mfs.open(d + "/sub/data.bin", "wb") as h:
+            h.write(b"x")
+    p_sub = mfs._resolve_path("/p/sub")
+    q_sub = mfs._resolve_path("/q/sub")
+    (p_name,) = p_sub.children
+    (q_name,) = q_sub.children
+    assert p_name is q_name
+    (p_dir,) = mfs._resolve_path("/p").children
+    (q_dir,) = mfs._resolve_path("/q").children
+    assert p_dir is q_dir
+
+
+def test_subtree_operations_handle_trees_deeper_than_recursion_limit():
+    """copy_tree / export_tree / walk / glob / rmtree do not recurse per directory level."""
+    import sys
+
+    fs = MemoryFileSystem()
+    deep = "/root" + "/d" * (sys.getrecursionlimit() + 50)
+    fs.mkdir(deep)
+    with fs.open(deep + "/f.bin", "wb") as h:
+        h.write(b"deep")
+    fs.copy_tree("/root", "/copy")
+    copied = "/copy" + deep[len("/root"):] + "/f.bin"
+    assert fs.export_tree("/copy") == {copied: b"deep"}
+    walked = list(fs.walk("/copy"))
+    assert len(walked) == sys.getrecursionlimit() + 51
+    assert walked[-1] == (copied[: -len("/f.bin")], [], ["f.bin"])
+    collected: list[str] = []
+    fs._collect_all_paths(fs._resolve_path("/copy"), "/copy", collected)
+    assert collected[-1] == copied
+    assert fs.glob("/copy/**/*.bin") == [copied]
+    fs.rmtree("/root")
+    fs.rmtree("/copy")
+    assert fs.listdir("/") == []
+    assert fs.stats()["used_bytes"] == 0
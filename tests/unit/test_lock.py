@@ -159,3 +159,39 @@ def test_release_write_without_acquire_raises():
     lock = ReadWriteLock()
     with pytest.raises(RuntimeError, match="release_write called without matching acquire_write"):
         lock.release_write()
+
+
+def test_guards_wake_threads_blocked_on_the_lock():
+    """ReadGuard / WriteGuard の退出は、ロック待ちのスレッドを起こす。"""
+    from dmemfs._lock import ReadGuard, WriteGuard
+
+    lock = ReadWriteLock()
+    read_guard, write_guard = ReadGuard(lock), WriteGuard(lock)
+    order: list[str] = []
+
+    def writer():
+        with write_guard:
+            order.append("write")
+
+    def reader():
+        with read_guard:
+            order.append("read")
+
+    with read_guard:
+        t = threading.Thread(target=writer)
+        t.start()
+        t.join(timeout=0.1)
+        assert t.is_alive()  # blocked behind the read guard
+        order.append("read-held")
+    t.join(timeout=5.0)
+    assert not t.is_alive()
+
+    with write_guard:
+        t = threading.Thread(target=reader)
+        t.start()
+        t.join(timeout=0.1)
+        assert t.is_alive()
+        order.append("write-held")
+    t.join(timeout=5.0)
+    assert order == ["read-held", "write", "write-held", "read"]
+    assert not lock.is_locked
@@ -51,3 +51,29 @@ def test_backslash_converted():
 def test_windows_style_traversal():
     with pytest.raises(ValueError, match="traversal"):
         normalize_path("..\\x")
+
+
+def test_repeated_traversal_still_raises():
+    """キャッシュ後も不正なパスは毎回 ValueError を送出する。"""
+    for _ in range(2):
+        with pytest.raises(ValueError, match="traversal"):
+            normalize_path("/a/../../y")
+    assert normalize_path("/a/./b/") == normalize_path("/a/./b/") == "/a/b"
+
+
+@pytest.mark.parametrize(
+    "path, expected",
+    [
+        ("/a/b.bin", "/a/b.bin"),
+        ("/a/.git/config", "/a/.git/config"),
+        ("/a/b/", "/a/b"),
+        ("/a/b/.", "/a/b"),
+        ("/a/b/..", "/a"),
+        ("/a\\b", "/a/b"),
+        ("//a", "/a"),
+        ("./a/../b", "/b"),
+    ],
+)
+def test_already_normal_and_near_normal_paths(path, expected):
+    """正規化済みパスの高速経路と通常経路が同じ結果を返す。"""
+    assert normalize_path(path) == expected
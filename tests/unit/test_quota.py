@@ -70,6 +70,19 @@ def test_reserve_zero_is_noop():
     assert qm.used == 0
 
 
+def test_reserve_rolls_back_on_base_exception():
+    """KeyboardInterrupt などの BaseException でも予約は返却される。"""
+    qm = QuotaManager(100)
+    with pytest.raises(KeyboardInterrupt):
+        with qm.reserve(60):
+            assert qm.used == 60
+            raise KeyboardInterrupt
+    assert qm.used == 0
+    with qm.reserve(100):
+        pass
+    assert qm.used == 100
+
+
 def test_concurrent_reserves():
     """Multiple threads reserving should not exceed quota."""
     qm = QuotaManager(1000)
@@ -103,15 +116,6 @@ def test_quota_exceeded_error_is_oserror():
     assert err.available == 50
 
 
-def test_force_reserve_zero_or_negative_is_noop():
-    """_force_reserve with size <= 0 should not change used bytes."""
-    qm = QuotaManager(1000)
-    qm._force_reserve(0)
-    assert qm.used == 0
-    qm._force_reserve(-5)
-    assert qm.used == 0
-
-
 def test_node_limit_exceeded_error_is_quota_exceeded():
     from dmemfs._exceptions import MFSNodeLimitExceededError
     err = MFSNodeLimitExceededError(10, 10)
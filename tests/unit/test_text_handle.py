@@ -58,6 +58,28 @@ def test_read_partial_multibyte_counts_characters(mfs):
         assert th.read(2) == "お"
 
 
+def test_read_partial_mixed_width_stops_after_requested_characters(mfs):
+    """read(size) は幅の異なる文字が混在しても size 文字の直後でカーソルを止める。"""
+    text = "aあbい" * 1000
+    with mfs.open("/f.bin", "wb") as fh:
+        MFSTextHandle(fh, encoding="utf-8").write(text)
+    with mfs.open("/f.bin", "rb") as fh:
+        th = MFSTextHandle(fh, encoding="utf-8")
+        assert th.read(1999) == text[:1999]
+        assert fh.tell() == len(text[:1999].encode("utf-8"))
+        assert th.read() == text[1999:]
+
+
+def test_read_partial_backslashreplace_keeps_pending_multibyte(mfs):
+    """1 バイトが複数文字に展開されても、読みかけのマルチバイト文字を失わない。"""
+    with mfs.open("/f.bin", "wb") as fh:
+        fh.write(b"\xff\xc3\xa9Z")
+    with mfs.open("/f.bin", "rb") as fh:
+        th = MFSTextHandle(fh, encoding="utf-8", errors="backslashreplace")
+        assert th.read(2) == "\\x"
+        assert th.read() == "fféZ"
+
+
 def test_readline_after_partial_multibyte_read_uses_buffer(mfs):
     with mfs.open("/f.bin", "wb") as fh:
         th = MFSTextHandle(fh, encoding="utf-8")
@@ -105,6 +127,58 @@ def test_readline_cr(mfs):
         assert th.readline() == ""
 
 
+def test_readline_long_lines_across_blocks_leave_cursor_after_line(mfs):
+    """ブロック境界をまたぐ長い行・CRLF でも行単位で返し、カーソルは行末直後に残る。"""
+    from dmemfs._text import _READLINE_CHUNK
+
+    first = "a" * (_READLINE_CHUNK - 1) + "\r\n"  # CRLF straddles the block end
+    second = "あ" * _READLINE_CHUNK + "\r"
+    third = "tail"
+    with mfs.open("/f.bin", "wb") as fh:
+        fh.write((first + second + third).encode("utf-8"))
+    with mfs.open("/f.bin", "rb") as fh:
+        th = MFSTextHandle(fh, encoding="utf-8")
+        assert th.readline() == first
+        assert fh.tell() == len(first)
+        assert th.readline() == second
+        assert fh.tell() == len((first + second).encode("utf-8"))
+        assert th.readline() == third
+        assert th.readline() == ""
+
+
+def test_readline_crlf_straddling_first_block_end(mfs):
+    """最初の小ブロック末尾で CRLF が分かれても 1 行として返す。"""
+    from dmemfs._text import _READLINE_FIRST_BLOCK
+
+    first = "b" * (_READLINE_FIRST_BLOCK - 1) + "\r\n"
+    with mfs.open("/f.bin", "wb") as fh:
+        fh.write((first + "x\n").encode("utf-8"))
+    with mfs.open("/f.bin", "rb") as fh:
+        th = MFSTextHandle(fh, encoding="utf-8")
+        assert th.readline() == first
+        assert fh.tell() == len(first)
+        assert list(th) == ["x\n"]
+
+
+def test_readline_shiftjis_and_utf16(mfs):
+    """Shift_JIS はバイト単位の分割、UTF-16 は文字単位の経路で正しく行を返す。"""
+    for encoding in ("shift_jis", "utf-16-le"):
+        with mfs.open("/f.bin", "wb") as fh:
+            MFSTextHandle(fh, encoding=encoding).write("表示\r\n能\n")
+        with mfs.open("/f.bin", "rb") as fh:
+            th = MFSTextHandle(fh, encoding=encoding)
+            assert list(th) == ["表示\r\n", "能\n"]
+
+
+def test_readline_errors_ignore_matches_crlf_on_decoded_chars(mfs):
+    """errors="ignore" では CR と LF の間の不正バイトが消え、1 つの CRLF 行になる。"""
+    with mfs.open("/f.bin", "wb") as fh:
+        fh.write(b"a\r\x81\nb")
+    with mfs.open("/f.bin", "rb") as fh:
+        th = MFSTextHandle(fh, encoding="cp1252", errors="ignore")
+        assert list(th) == ["a\r\n", "b"]
+
+
 # ---------------------------------------------------------------------------
 # __iter__ / __next__
 # ---------------------------------------------------------------------------
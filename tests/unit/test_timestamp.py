@@ -143,6 +143,19 @@ def test_import_tree_creates_new_timestamps(mfs):
     assert before <= info["created_at"] <= after
 
 
+def test_import_tree_reads_clock_once_per_batch(mfs):
+    """import_tree で作成されるノードは 1 回の時刻取得を共有し、以降の作成には持ち越さない。"""
+    with patch("time.time") as mock_time:
+        mock_time.side_effect = [1000.0, 2000.0, 3000.0]
+        mfs.import_tree({"/a/b/x.bin": b"x", "/a/c/y.bin": b"y"})
+        with mfs.open("/later.bin", "wb"):
+            pass
+
+    assert mfs.stat("/a/b/x.bin")["created_at"] == 1000.0
+    assert mfs.stat("/a/c")["created_at"] == 1000.0
+    assert mfs.stat("/later.bin")["created_at"] == 2000.0
+
+
 # -------------------------------------------------------------------
 # §17.2  stat() API — エラーハンドリングと統合動作
 # -------------------------------------------------------------------